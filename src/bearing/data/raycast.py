@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Provides Voxel Raycaster Class
+
+Batched 3D DDA (Amanatides-Woo) ray traversal of voxel grids.
+
+Examples:
+    >>> caster = VoxelRaycaster((0.0, 0.0, 0.0), 1.0, (0, 0, 0), (4, 4, 4))
+    >>> origins = [(-1.0, 0.0, 0.0), (-1.0, 1.0, 0.0)]
+    >>> offsets, voxels, t = caster.traverse(origins, (1.0, 0.0, 0.0))
+    >>> voxels[offsets[0]:offsets[1]].tolist()      # voxels crossed by ray 0
+    [[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]]
+    >>> t[offsets[0]:offsets[1]].tolist()
+    [0.5, 1.5, 2.5, 3.5]
+    >>> occupied = numpy.zeros((4, 4, 4), dtype=bool)
+    >>> occupied[2, 0, 0] = True
+    >>> hit, voxel, t = caster.first_hit(origins, (1.0, 0.0, 0.0), occupied)
+    >>> hit.tolist(), voxel[0].tolist(), t.tolist()
+    ([True, False], [2, 0, 0], [2.5, inf])
+
+Attributes:
+    ...
+
+Todo:
+
+Links:
+    Amanatides, J. and Woo, A. (1987). A Fast Voxel Traversal Algorithm for
+    Ray Tracing. Eurographics '87.
+
+"""
+
+
+# Import | Futures
+
+
+# Import | Standard Library
+
+
+# Import | Libraries
+import numpy
+
+
+# Import | Local Modules
+from bearing.data.voxel_key import VoxelKey
+from bearing.data.voxel_store import SparseVoxelStore
+from bearing.math.vector import Vector, VectorArray
+
+
+
+class VoxelRaycaster(object):
+    """
+    A class used to cast rays through a voxel grid
+
+    The grid geometry follows Voxel_grid: voxel (x, y, z) is centered on
+    center + (x, y, z) * voxel_size, for indices in the half-open box
+    [lower, upper). All rays are clipped to the box and then marched
+    together, one voxel step per iteration, with the incremental DDA of
+    Amanatides and Woo; every iteration is a handful of vectorized
+    operations over the rays that are still inside the box.
+
+    Ray parameters t are distances along the normalized directions.
+
+    Methods
+    -------
+    traverse(origins, directions, max_distance)
+        returns the voxels crossed by every ray
+    first_hit(origins, directions, occupied, max_distance)
+        returns the first occupied voxel of every ray
+    """
+
+    def __init__(self, center, voxel_size, lower, upper):
+        """Constructor of the object."""
+        if voxel_size <= 0:
+            raise ValueError("voxel_size must be positive.")
+        if hasattr(center, "x"):
+            center = (center.x, center.y, center.z)
+        self._center = numpy.asarray(center, dtype=numpy.float64)
+        self._voxel_size = float(voxel_size)
+        self._lower = numpy.asarray(lower, dtype=numpy.int64)
+        self._upper = numpy.asarray(upper, dtype=numpy.int64)
+        if numpy.any(self._upper <= self._lower):
+            raise ValueError("The voxel box must not be empty.")
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Creates a raycaster for the voxels of a Voxel_grid."""
+        return cls(
+            grid.center,
+            grid.voxel_size,
+            (grid.voxel_min_x, grid.voxel_min_y, grid.voxel_min_z),
+            (grid.voxel_max_x, grid.voxel_max_y, grid.voxel_max_z),
+        )
+
+    # Methods | rays
+
+    def traverse(self, origins, directions, max_distance=numpy.inf):
+        """
+        Returns the voxels crossed by every ray, in order along the ray.
+
+        Parameters
+        ----------
+        origins, directions : Vector, VectorArray, list or array-like
+            The (N, 3) ray origins and directions; a single origin or
+            direction is broadcast against the other.
+        max_distance : float or array-like, optional
+            The maximum distance along each ray. Defaults to no limit.
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            The (N + 1,) offsets of the voxels of each ray: the voxels of
+            ray n are voxels[offsets[n]:offsets[n + 1]].
+        voxels : numpy.ndarray
+            The (M, 3) voxel indices.
+        t : numpy.ndarray
+            The (M,) distances at which the rays enter the voxels.
+        """
+        origins, directions, max_distance = self._rays(origins, directions, max_distance)
+        n = origins.shape[0]
+        rays, voxels, t = [], [], []
+        for active, index, t_enter in self._march(origins, directions, max_distance):
+            rays.append(active)
+            voxels.append(index)
+            t.append(t_enter)
+
+        if not rays:
+            return (
+                numpy.zeros(n + 1, dtype=numpy.intp),
+                numpy.empty((0, 3), dtype=numpy.int64),
+                numpy.empty(0),
+            )
+        rays = numpy.concatenate(rays)
+        # Steps were recorded in order, so a stable sort keeps each ray's
+        # voxels in traversal order
+        order = numpy.argsort(rays, kind="stable")
+        offsets = numpy.zeros(n + 1, dtype=numpy.intp)
+        numpy.cumsum(numpy.bincount(rays, minlength=n), out=offsets[1:])
+        return offsets, numpy.concatenate(voxels)[order], numpy.concatenate(t)[order]
+
+    def first_hit(self, origins, directions, occupied, max_distance=numpy.inf):
+        """
+        Returns the first occupied voxel along every ray.
+
+        Parameters
+        ----------
+        origins, directions : Vector, VectorArray, list or array-like
+            See :meth:`traverse`.
+        occupied : numpy.ndarray or SparseVoxelStore
+            A boolean array over the box, indexed by voxel index - lower,
+            or a store whose voxels count as occupied.
+        max_distance : float or array-like, optional
+            The maximum distance along each ray. Defaults to no limit.
+
+        Returns
+        -------
+        hit : numpy.ndarray
+            A boolean mask of the rays that hit an occupied voxel.
+        voxels : numpy.ndarray
+            The (N, 3) indices of the hit voxels; undefined where not hit.
+        t : numpy.ndarray
+            The distances at which the rays enter the hit voxels; inf where
+            not hit.
+        """
+        if isinstance(occupied, SparseVoxelStore):
+            # A sorted copy of the keys is probed with one vectorized
+            # searchsorted per step instead of a dict lookup per voxel
+            keys = numpy.sort(occupied.keys)
+
+            def is_occupied(index):
+                if not keys.shape[0]:
+                    return numpy.zeros(index.shape[0], dtype=bool)
+                probe = VoxelKey.pack(index[:, 0], index[:, 1], index[:, 2])
+                position = numpy.searchsorted(keys, probe)
+                numpy.minimum(position, keys.shape[0] - 1, out=position)
+                return keys[position] == probe
+        else:
+            occupied = numpy.asarray(occupied, dtype=bool)
+            if occupied.shape != tuple(self._upper - self._lower):
+                raise ValueError("occupied must have the shape of the voxel box.")
+
+            def is_occupied(index):
+                return occupied[tuple((index - self._lower).T)]
+
+        origins, directions, max_distance = self._rays(origins, directions, max_distance)
+        n = origins.shape[0]
+        hit = numpy.zeros(n, dtype=bool)
+        voxels = numpy.zeros((n, 3), dtype=numpy.int64)
+        t = numpy.full(n, numpy.inf)
+        marcher = self._march(origins, directions, max_distance)
+        stop = None
+        while True:
+            try:
+                active, index, t_enter = marcher.send(stop)
+            except StopIteration:
+                break
+            stop = is_occupied(index)
+            rays = active[stop]
+            hit[rays] = True
+            voxels[rays] = index[stop]
+            t[rays] = t_enter[stop]
+        return hit, voxels, t
+
+    # Methods | helpers
+
+    def _rays(self, origins, directions, max_distance):
+        """Packs the rays into (N, 3) arrays with unit directions."""
+        origins = _as_array(origins)
+        directions = _as_array(directions)
+        origins, directions = numpy.broadcast_arrays(origins, directions)
+        length = numpy.sqrt(numpy.einsum("ij,ij->i", directions, directions))
+        if numpy.any(length == 0):
+            raise ValueError("Ray directions must not be zero.")
+        directions = directions / length[:, numpy.newaxis]
+        max_distance = numpy.broadcast_to(
+            numpy.asarray(max_distance, dtype=numpy.float64), length.shape
+        )
+        return numpy.ascontiguousarray(origins), directions, max_distance
+
+    def _march(self, origins, directions, max_distance):
+        """
+        Marches all rays through the box, yielding (rays, voxels, t) for the
+        voxels entered in each step. The caller may send a boolean mask
+        over the yielded rays to stop them.
+        """
+        size = self._voxel_size
+        box_lower = self._center + (self._lower - 0.5) * size
+        box_upper = self._center + (self._upper - 0.5) * size
+
+        # Clip the rays to the box (slab test)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / directions
+            t0 = (box_lower - origins) * inverse
+            t1 = (box_upper - origins) * inverse
+        # Rays parallel to a slab: inside it for all t, or never
+        parallel = directions == 0
+        inside = (origins >= box_lower) & (origins < box_upper)
+        t_near = numpy.where(
+            parallel, numpy.where(inside, -numpy.inf, numpy.inf), numpy.minimum(t0, t1)
+        )
+        t_far = numpy.where(
+            parallel, numpy.where(inside, numpy.inf, -numpy.inf), numpy.maximum(t0, t1)
+        )
+        t_enter = numpy.maximum(t_near.max(axis=1), 0.0)
+        t_exit = numpy.minimum(t_far.min(axis=1), max_distance)
+
+        active = numpy.flatnonzero(t_enter < t_exit)
+        t_enter = t_enter[active]
+        t_exit = t_exit[active]
+        origins = origins[active]
+        directions = directions[active]
+
+        # Starting voxel, at the point where the ray enters the box
+        start = origins + directions * t_enter[:, numpy.newaxis]
+        index = numpy.floor((start - self._center) / size + 0.5).astype(numpy.int64)
+        numpy.clip(index, self._lower, self._upper - 1, out=index)
+
+        step = numpy.sign(directions).astype(numpy.int64)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t_delta = numpy.where(parallel[active], numpy.inf, size / numpy.abs(directions))
+            boundary = self._center + (index + 0.5 * step) * size
+            t_max = numpy.where(parallel[active], numpy.inf, (boundary - origins) / directions)
+        rows = numpy.arange(active.shape[0])
+
+        while active.shape[0]:
+            stop = yield active, index, t_enter
+            keep = numpy.ones(active.shape[0], dtype=bool) if stop is None else ~stop
+
+            # Advance along the axis of the nearest voxel boundary
+            axis = numpy.argmin(t_max, axis=1)
+            rows_ = rows[:active.shape[0]]
+            t_enter = t_max[rows_, axis]
+            index = index.copy()
+            index[rows_, axis] += step[rows_, axis]
+            t_max[rows_, axis] += t_delta[rows_, axis]
+
+            keep &= t_enter < t_exit
+            keep &= numpy.all((index >= self._lower) & (index < self._upper), axis=1)
+            if not keep.all():
+                active = active[keep]
+                index = index[keep]
+                t_enter = t_enter[keep]
+                t_exit = t_exit[keep]
+                t_max = t_max[keep]
+                t_delta = t_delta[keep]
+                step = step[keep]
+
+
+def _as_array(vectors):
+    """Returns Vectors, VectorArrays or array-likes as an (N, 3) array."""
+    if isinstance(vectors, VectorArray):
+        return vectors.data
+    if isinstance(vectors, Vector):
+        vectors = [vectors]
+    if not isinstance(vectors, numpy.ndarray) and any(
+        isinstance(vector, Vector) for vector in vectors
+    ):
+        return VectorArray.from_vectors(vectors).data
+    return numpy.atleast_2d(numpy.asarray(vectors, dtype=numpy.float64))
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
@@ -24,15 +24,33 @@ Todo:
 
 
 # Import | Libraries
+import numpy
 
 
 # Import | Local Modules
+from bearing.data.voxel_key import VoxelKey
+from bearing.geospatial.coordinate import GeographicCoordinate
 from starling.geometry.point import Point
 from starling.geometry.rectangle import Rectangle
 from starling.geospatial.utils import coord_offset
 from starling.math.utils import distance_1d
 
 
+#: Columns of the voxel point table, in the order of the former pt_list rows
+POINT_DTYPE = numpy.dtype([
+    ("oid", numpy.int64),
+    ("x", numpy.int64),
+    ("y", numpy.int64),
+    ("z", numpy.int64),
+    ("px", numpy.float64),
+    ("py", numpy.float64),
+    ("pz", numpy.float64),
+    ("lat", numpy.float64),
+    ("lon", numpy.float64),
+    ("dx", numpy.float64),
+    ("dy", numpy.float64),
+])
+
 
 class Voxel_grid():
     """
@@ -71,28 +89,82 @@ class Voxel_grid():
         return "voxel grid loaded!"
 
     def points(self):
-        for z in range(self.voxel_min_z, self.voxel_max_z):
-            progress = float(z) / float(self.voxel_res_z) * 100.0
-            print ("voxel init progress:    {0:.2f}%...".format(progress))
-            for y in range(self.voxel_min_y, self.voxel_max_y):
-                for x in range(self.voxel_min_x, self.voxel_max_x):
-                    if x <= 0: oid_x = "0{0:03d}".format(abs(x))
-                    else: oid_x = "1{0:03d}".format(x)
-                    if y <= 0: oid_y = "0{0:03d}".format(abs(y))
-                    else: oid_y = "1{0:03d}".format(y)
-                    if z <= 0: oid_z = "0{0:03d}".format(abs(z))
-                    else: oid_z = "1{0:03d}".format(z)
-                    oid = oid_x + oid_y + oid_z
-                    pt_x = self.center.x + x * self.voxel_size
-                    pt_y = self.center.y + y * self.voxel_size
-                    pt_z = self.center.z + z * self.voxel_size
-
-                    pt = Point(pt_x, pt_y, pt_z)
-                    ll_dx = distance_1d(self.center.x, pt.x) / 1000
-                    ll_dy = distance_1d(self.center.y, pt.y) / 1000
-                    coord = coord_offset(self.center, self.lat, self.lon, ll_dx, ll_dy).calc()
-                    com = [oid, x, y, z, pt.x, pt.y, pt.z, coord[0], coord[1], ll_dx, ll_dy]
-                    self.pt_list.append(com)
+        """
+        Builds the table of all voxel points.
+
+        The table is a structured array of :data:`POINT_DTYPE` in z, y, x
+        order. 'oid' is the packed int64 key of the voxel indices (see
+        :class:`VoxelKey`; use VoxelKey.format for the string OIDs), px/py/pz
+        the point coordinates, lat/lon the offset of the point from the grid
+        center, and dx/dy the horizontal distances to the center in km.
+
+        Returns
+        -------
+        numpy.ndarray
+            The point table, also stored as pt_list.
+        """
+        n_x = self.voxel_max_x - self.voxel_min_x
+        n_y = self.voxel_max_y - self.voxel_min_y
+        n_z = self.voxel_max_z - self.voxel_min_z
+        table = numpy.empty(max(n_x, 0) * max(n_y, 0) * max(n_z, 0), dtype=POINT_DTYPE)
+        start = 0
+        for slab in self.iter_points():
+            table[start:start + slab.shape[0]] = slab
+            start += slab.shape[0]
+        self.pt_list = table
+        return table
+
+    def iter_points(self, max_rows=1 << 20):
+        """
+        Generates the voxel point table in slabs of whole z-layers.
+
+        The latitudes and longitudes only depend on x and y, so they are
+        computed once for a single layer, with the spherical offset of
+        GeographicCoordinate.coord_offset_array (x east, y north, in the
+        units of voxel_size, taken as metres), and repeated for every layer.
+
+        Parameters
+        ----------
+        max_rows : int, optional
+            The approximate number of rows per slab; a slab holds at least
+            one layer. Defaults to 2**20.
+
+        Yields
+        ------
+        numpy.ndarray
+            A structured array of :data:`POINT_DTYPE`, see :meth:`points`.
+        """
+        size = self.voxel_size
+        xs = numpy.arange(self.voxel_min_x, self.voxel_max_x, dtype=numpy.int64)
+        ys = numpy.arange(self.voxel_min_y, self.voxel_max_y, dtype=numpy.int64)
+        zs = numpy.arange(self.voxel_min_z, self.voxel_max_z, dtype=numpy.int64)
+        if not (xs.size and ys.size and zs.size):
+            return
+
+        # One layer of (y, x) columns, shared by all z
+        offset_e = numpy.broadcast_to(xs * size, (ys.size, xs.size))
+        offset_n = numpy.broadcast_to((ys * size)[:, numpy.newaxis], (ys.size, xs.size))
+        lat, lon = GeographicCoordinate.coord_offset_array(
+            self.lat, self.lon, offset_n, offset_e
+        )
+        layer = (ys.size, xs.size)
+        step = max(1, max_rows // (ys.size * xs.size))
+
+        for start in range(0, zs.size, step):
+            z = zs[start:start + step]
+            slab = numpy.empty((z.size,) + layer, dtype=POINT_DTYPE)
+            slab["x"] = xs
+            slab["y"] = ys[:, numpy.newaxis]
+            slab["z"] = z[:, numpy.newaxis, numpy.newaxis]
+            slab["oid"] = VoxelKey.pack(slab["x"], slab["y"], slab["z"])
+            slab["px"] = self.center.x + xs * size
+            slab["py"] = self.center.y + (ys * size)[:, numpy.newaxis]
+            slab["pz"] = self.center.z + (z * size)[:, numpy.newaxis, numpy.newaxis]
+            slab["lat"] = lat
+            slab["lon"] = lon
+            slab["dx"] = numpy.abs(xs * size) / 1000
+            slab["dy"] = numpy.abs(ys * size)[:, numpy.newaxis] / 1000
+            yield slab.reshape(-1)
 
     def base(self):
         ll = Point(self.center.x + self.voxel_min_x * self.voxel_size, self.center.y + self.voxel_min_y * self.voxel_size, self.center.z + self.voxel_min_z * self.voxel_size)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Provides Voxel Key Class
+
+Packs signed integer voxel indices (x, y, z) into a single int64 key.
+
+Examples:
+    >>> key = VoxelKey.pack(-3, 0, 12)
+    >>> [int(v) for v in VoxelKey.unpack(key)]
+    [-3, 0, 12]
+    >>> VoxelKey.format(key)
+    '000300001012'
+
+Attributes:
+    BITS : bits per axis; indices must lie in [-2**20, 2**20).
+
+Todo:
+
+"""
+
+
+# Import | Futures
+
+
+# Import | Standard Library
+
+
+# Import | Libraries
+import numpy
+
+
+# Import | Local Modules
+
+
+
+class VoxelKey(object):
+    """
+    A class used to pack and unpack voxel keys
+
+    Each index is stored in offset binary in 21 bits, x in the high bits and
+    z in the low bits, so the keys of a dense box sort in (x, y, z) order
+    and packing and unpacking are a few vectorized shifts and masks.
+
+    Methods
+    -------
+    pack(x, y, z)
+        packs indices into int64 keys
+    unpack(key)
+        unpacks int64 keys into indices
+    format(key)
+        formats keys as the legacy zero-padded string OIDs
+    """
+
+    BITS = 21
+    OFFSET = 1 << (BITS - 1)
+    MASK = (1 << BITS) - 1
+
+    @staticmethod
+    def pack(x, y, z):
+        """
+        Packs voxel indices into int64 keys.
+
+        Parameters
+        ----------
+        x, y, z : int or array-like
+            The signed voxel indices, in [-2**20, 2**20).
+
+        Returns
+        -------
+        numpy.ndarray
+            The int64 keys, broadcast to the shape of the inputs.
+        """
+        x = numpy.asarray(x, dtype=numpy.int64)
+        y = numpy.asarray(y, dtype=numpy.int64)
+        z = numpy.asarray(z, dtype=numpy.int64)
+        offset = VoxelKey.OFFSET
+        for axis in (x, y, z):
+            if axis.size and (axis.min() < -offset or axis.max() >= offset):
+                raise ValueError("Voxel index out of the packable range.")
+        return (
+            ((x + offset) << (2 * VoxelKey.BITS))
+            | ((y + offset) << VoxelKey.BITS)
+            | (z + offset)
+        )
+
+    @staticmethod
+    def unpack(key):
+        """
+        Unpacks int64 keys into voxel indices.
+
+        Parameters
+        ----------
+        key : int or array-like
+            The packed keys.
+
+        Returns
+        -------
+        x, y, z : numpy.ndarray
+            The signed voxel indices.
+        """
+        key = numpy.asarray(key, dtype=numpy.int64)
+        bits = VoxelKey.BITS
+        mask = VoxelKey.MASK
+        offset = VoxelKey.OFFSET
+        return (
+            ((key >> (2 * bits)) & mask) - offset,
+            ((key >> bits) & mask) - offset,
+            (key & mask) - offset,
+        )
+
+    @staticmethod
+    def format(key):
+        """
+        Formats keys as the legacy string OIDs of Voxel_grid.
+
+        Each index becomes a sign digit (0 for x <= 0, 1 otherwise) followed
+        by three zero-padded digits of its absolute value.
+
+        Parameters
+        ----------
+        key : int or array-like
+            The packed keys.
+
+        Returns
+        -------
+        str or list
+            The OID of a single key, or a list of OIDs.
+        """
+        x, y, z = VoxelKey.unpack(key)
+
+        def part(v):
+            return ("0%03d" if v <= 0 else "1%03d") % abs(v)
+
+        if x.ndim == 0:
+            return part(int(x)) + part(int(y)) + part(int(z))
+        return [
+            part(a) + part(b) + part(c)
+            for a, b, c in zip(x.ravel().tolist(), y.ravel().tolist(), z.ravel().tolist())
+        ]
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
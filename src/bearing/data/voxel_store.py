@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Provides Sparse Voxel Store Class
+
+A hash map of occupied voxels, keyed by packed (x, y, z) indices.
+
+Examples:
+    >>> store = SparseVoxelStore()
+    >>> store.insert([0, 1, 5], [0, 0, 5], [0, 0, 5], [1.0, 2.0, 3.0])
+    >>> store[1, 0, 0]
+    2.0
+    >>> coords, values = store.query_box((0, 0, 0), (2, 2, 2))
+    >>> coords.tolist(), values.tolist()
+    ([[0, 0, 0], [1, 0, 0]], [1.0, 2.0])
+
+Attributes:
+    ...
+
+Todo:
+
+"""
+
+
+# Import | Futures
+
+
+# Import | Standard Library
+
+
+# Import | Libraries
+import numpy
+
+
+# Import | Local Modules
+from bearing.data.voxel_key import VoxelKey
+
+
+
+class SparseVoxelStore(object):
+    """
+    A class used to represent a sparse set of voxels
+
+    Occupied voxels are kept in two dense columns, their packed keys (see
+    :class:`VoxelKey`) and their values, plus a dict from key to row. Insert,
+    lookup and removal are O(1) per voxel; removal moves the last row into
+    the freed one. Memory scales with the number of occupied voxels, not
+    with the volume they span.
+
+    Box queries probe the dict voxel by voxel when the box is small, and
+    otherwise filter the key column in one vectorized pass, whichever
+    touches fewer voxels.
+
+    Attributes
+    ----------
+    keys : numpy.ndarray
+        the packed keys of the occupied voxels
+    values : numpy.ndarray
+        the values of the occupied voxels, in the order of keys
+    fill_value : scalar
+        the value reported for empty voxels
+
+    Methods
+    -------
+    insert(x, y, z, values)
+        sets the values of voxels
+    lookup(x, y, z)
+        gets the values of voxels
+    remove(x, y, z)
+        empties voxels
+    query_box(lower, upper)
+        gets the occupied voxels in a box
+    """
+
+    def __init__(self, dtype=numpy.float64, fill_value=numpy.nan, capacity=1024):
+        """Constructor of the object."""
+        self._index = {}
+        self._keys = numpy.empty(max(int(capacity), 1), dtype=numpy.int64)
+        self._values = numpy.empty(max(int(capacity), 1), dtype=dtype)
+        self._size = 0
+        self.fill_value = fill_value
+
+    def __str__(self):
+        """This method returns the string representation of the object."""
+        return "SparseVoxelStore(%d voxels)" % self._size
+
+    def __len__(self):
+        """Returns the number of occupied voxels."""
+        return self._size
+
+    def __contains__(self, xyz):
+        """Checks whether the voxel (x, y, z) is occupied."""
+        return int(VoxelKey.pack(*xyz)) in self._index
+
+    def __getitem__(self, xyz):
+        """Returns the value of the voxel (x, y, z)."""
+        row = self._index[int(VoxelKey.pack(*xyz))]
+        return self._values[row].item()
+
+    def __setitem__(self, xyz, value):
+        """Sets the value of the voxel (x, y, z)."""
+        x, y, z = xyz
+        self.insert([x], [y], [z], [value])
+
+    def __delitem__(self, xyz):
+        """Empties the voxel (x, y, z)."""
+        if not self.remove(*([v] for v in xyz)).any():
+            raise KeyError(xyz)
+
+    def __iter__(self):
+        """Iterates over the (x, y, z) indices of the occupied voxels."""
+        x, y, z = VoxelKey.unpack(self.keys)
+        return zip(x.tolist(), y.tolist(), z.tolist())
+
+    # Methods | parameters
+
+    @property
+    def keys(self):
+        """Getter decorator method for keys parameter."""
+        return self._keys[:self._size]
+
+    @property
+    def values(self):
+        """Getter decorator method for values parameter."""
+        return self._values[:self._size]
+
+    @property
+    def nbytes(self):
+        """Returns the approximate memory use of the store, in bytes."""
+        # A dict entry costs roughly 100 bytes including the int key
+        return self._keys.nbytes + self._values.nbytes + 100 * len(self._index)
+
+    def coords(self):
+        """Returns the (N, 3) indices of the occupied voxels."""
+        return numpy.column_stack(VoxelKey.unpack(self.keys))
+
+    # Methods | voxels
+
+    def insert(self, x, y, z, values):
+        """
+        Sets the values of voxels, occupying them if needed.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The voxel indices.
+        values : scalar or array-like
+            The values, broadcast against the indices. When an index occurs
+            more than once, the last value wins.
+        """
+        keys = VoxelKey.pack(x, y, z).ravel()
+        values = numpy.broadcast_to(values, keys.shape)
+        self._reserve(self._size + keys.size)
+        index = self._index
+        rows = numpy.empty(keys.size, dtype=numpy.intp)
+        size = self._size
+        for n, key in enumerate(keys.tolist()):
+            row = index.get(key)
+            if row is None:
+                row = index[key] = size
+                self._keys[size] = key
+                size += 1
+            rows[n] = row
+        self._size = size
+        self._values[rows] = values
+
+    def lookup(self, x, y, z):
+        """
+        Gets the values of voxels.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The voxel indices.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The values, 'fill_value' for empty voxels.
+        found : numpy.ndarray
+            A boolean mask of the occupied voxels.
+        """
+        keys = VoxelKey.pack(x, y, z)
+        get = self._index.get
+        rows = numpy.fromiter(
+            (get(key, -1) for key in keys.ravel().tolist()),
+            dtype=numpy.intp, count=keys.size,
+        ).reshape(keys.shape)
+        found = rows >= 0
+        values = numpy.full(keys.shape, self.fill_value, dtype=self._values.dtype)
+        values[found] = self._values[rows[found]]
+        return values, found
+
+    def remove(self, x, y, z):
+        """
+        Empties voxels.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The voxel indices.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean mask of the voxels that were occupied.
+        """
+        keys = VoxelKey.pack(x, y, z).ravel()
+        removed = numpy.zeros(keys.size, dtype=bool)
+        index = self._index
+        for n, key in enumerate(keys.tolist()):
+            row = index.pop(key, None)
+            if row is None:
+                continue
+            removed[n] = True
+            last = self._size - 1
+            if row != last:
+                # Move the last voxel into the freed row
+                moved = int(self._keys[last])
+                self._keys[row] = moved
+                self._values[row] = self._values[last]
+                index[moved] = row
+            self._size = last
+        return removed
+
+    def query_box(self, lower, upper):
+        """
+        Gets the occupied voxels in the half-open box [lower, upper).
+
+        Parameters
+        ----------
+        lower, upper : tuple
+            The (x, y, z) corners of the box.
+
+        Returns
+        -------
+        coords : numpy.ndarray
+            The (M, 3) indices of the occupied voxels in the box, in key
+            order.
+        values : numpy.ndarray
+            Their values.
+        """
+        lower = numpy.asarray(lower, dtype=numpy.int64)
+        upper = numpy.asarray(upper, dtype=numpy.int64)
+        volume = int(numpy.prod(numpy.maximum(upper - lower, 0)))
+
+        if volume <= self._size:
+            # Probe every voxel of the (small) box
+            axes = [numpy.arange(lo, hi) for lo, hi in zip(lower, upper)]
+            x, y, z = (a.ravel() for a in numpy.meshgrid(*axes, indexing="ij"))
+            values, found = self.lookup(x, y, z)
+            coords = numpy.column_stack((x, y, z))[found]
+            return coords, values[found]
+
+        # Filter the occupied voxels
+        coords = self.coords()
+        inside = numpy.all((coords >= lower) & (coords < upper), axis=1)
+        rows = numpy.flatnonzero(inside)
+        rows = rows[numpy.argsort(self.keys[rows], kind="stable")]
+        return coords[rows], self.values[rows]
+
+    def _reserve(self, capacity):
+        """Grows the columns to hold at least 'capacity' voxels."""
+        if capacity <= self._keys.shape[0]:
+            return
+        capacity = max(capacity, 2 * self._keys.shape[0])
+        keys = numpy.empty(capacity, dtype=numpy.int64)
+        values = numpy.empty(capacity, dtype=self._values.dtype)
+        keys[:self._size] = self.keys
+        values[:self._size] = self.values
+        self._keys = keys
+        self._values = values
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
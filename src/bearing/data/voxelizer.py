@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+Provides Voxelizer Class
+
+Streaming, mergeable binning of 3D point clouds into voxels.
+
+Examples:
+    >>> voxelizer = Voxelizer(center=(0.0, 0.0, 0.0), voxel_size=1.0)
+    >>> points = numpy.array([
+    ...     [0.1, 0.2, 0.0, 1.0],
+    ...     [0.4, -0.3, 0.2, 3.0],
+    ...     [2.0, 0.0, 0.0, 5.0],
+    ... ])
+    >>> voxelizer = voxelizer.consume(points, chunk_size=2)
+    >>> voxelizer.coords().tolist(), voxelizer.count.tolist()
+    ([[0, 0, 0], [2, 0, 0]], [2, 1])
+    >>> store = voxelizer.to_store("mean")
+    >>> store[0, 0, 0]
+    2.0
+
+Attributes:
+    ...
+
+Todo:
+
+"""
+
+
+# Import | Futures
+
+
+# Import | Standard Library
+
+
+# Import | Libraries
+import numpy
+
+
+# Import | Local Modules
+from bearing.data.voxel_key import VoxelKey
+from bearing.data.voxel_store import SparseVoxelStore
+
+
+
+class Voxelizer(object):
+    """
+    A class used to bin point clouds into voxels
+
+    Points are quantized against the grid center and voxel size like
+    Voxel_grid.points: voxel (x, y, z) is centered on center + (x, y, z) *
+    voxel_size. Each batch is reduced to per-voxel count, sum, min and max
+    by sorting its packed voxel keys and applying ufunc.reduceat, so the
+    cost per point is a few vectorized passes. Reduced batches are merged
+    into the running aggregates in the same way, lazily, once they
+    outweigh them; memory thus scales with the number of occupied voxels
+    plus one batch.
+
+    Voxelizers with the same center and voxel size can be merged, so each
+    worker process can ingest a share of the points and the parent merges
+    the (picklable) results.
+
+    Attributes
+    ----------
+    keys : numpy.ndarray
+        the sorted packed keys of the occupied voxels
+    count : numpy.ndarray
+        the number of points per voxel
+    mean, min, max : numpy.ndarray
+        the aggregates of the point attribute per voxel
+    dropped : int
+        the number of points outside the bounds, beyond the 2**20 voxel
+        index range of VoxelKey, or not finite
+    """
+
+    def __init__(self, center=(0.0, 0.0, 0.0), voxel_size=1.0, lower=None, upper=None):
+        """Constructor of the object."""
+        if voxel_size <= 0:
+            raise ValueError("voxel_size must be positive.")
+        self._center = numpy.asarray(_xyz(center), dtype=numpy.float64)
+        self._voxel_size = float(voxel_size)
+        self._lower = None if lower is None else numpy.asarray(lower, dtype=numpy.int64)
+        self._upper = None if upper is None else numpy.asarray(upper, dtype=numpy.int64)
+        self._state = _empty_state()
+        self._pending = []
+        self._pending_size = 0
+        self.dropped = 0
+
+    def __str__(self):
+        """This method returns the string representation of the object."""
+        return "Voxelizer(%d voxels)" % len(self.keys)
+
+    # Class Methods
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Creates a voxelizer for the voxels of a Voxel_grid, dropping points
+        outside its voxel_min/voxel_max box.
+        """
+        return cls(
+            center=grid.center,
+            voxel_size=grid.voxel_size,
+            lower=(grid.voxel_min_x, grid.voxel_min_y, grid.voxel_min_z),
+            upper=(grid.voxel_max_x, grid.voxel_max_y, grid.voxel_max_z),
+        )
+
+    # Methods | ingestion
+
+    def add(self, points, values=None):
+        """
+        Bins a batch of points.
+
+        Parameters
+        ----------
+        points : array-like or VectorArray
+            The (N, 3) point coordinates.
+        values : array-like, optional
+            The (N,) attribute to aggregate; defaults to zeros, so only the
+            counts are meaningful.
+        """
+        points = numpy.asarray(getattr(points, "data", points), dtype=numpy.float64)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError("Points must be an array of shape (N, 3).")
+        if values is None:
+            values = numpy.zeros(points.shape[0])
+        else:
+            values = numpy.asarray(values, dtype=numpy.float64).ravel()
+            if values.shape[0] != points.shape[0]:
+                raise ValueError("values must hold one value per point.")
+
+        index = (points - self._center) / self._voxel_size
+        index += 0.5
+        numpy.floor(index, out=index)
+        keep = numpy.isfinite(index).all(axis=1)
+        # Indices beyond the packable range of VoxelKey are dropped too
+        keep &= ((index >= -VoxelKey.OFFSET) & (index < VoxelKey.OFFSET)).all(axis=1)
+        if self._lower is not None:
+            keep &= (index >= self._lower).all(axis=1)
+        if self._upper is not None:
+            keep &= (index < self._upper).all(axis=1)
+        self.dropped += int(keep.size - numpy.count_nonzero(keep))
+
+        index = index[keep].astype(numpy.int64)
+        values = values[keep]
+        keys = VoxelKey.pack(index[:, 0], index[:, 1], index[:, 2])
+        self._push(_reduce(
+            keys,
+            numpy.ones(keys.shape[0], dtype=numpy.int64),
+            values, values, values,
+        ))
+
+    def consume(self, source, chunk_size=1 << 20):
+        """
+        Bins all points of a source, one batch at a time.
+
+        Parameters
+        ----------
+        source : numpy.ndarray or iterable
+            An (N, 3) or (N, 4) array, possibly memory-mapped, whose fourth
+            column is the attribute; or an iterable of such arrays or of
+            (points, values) pairs.
+        chunk_size : int, optional
+            The number of rows per batch when slicing an array. Defaults to
+            2**20.
+
+        Returns
+        -------
+        Voxelizer
+            This voxelizer.
+        """
+        batches = source
+        if isinstance(source, numpy.ndarray):
+            batches = (
+                source[start:start + chunk_size]
+                for start in range(0, source.shape[0], chunk_size)
+            )
+        for batch in batches:
+            if isinstance(batch, tuple):
+                self.add(*batch)
+            else:
+                batch = numpy.asarray(batch)
+                self.add(batch[:, :3], batch[:, 3] if batch.shape[1] > 3 else None)
+        return self
+
+    def merge(self, other):
+        """
+        Merges the aggregates of another voxelizer into this one.
+
+        Parameters
+        ----------
+        other : Voxelizer
+            A voxelizer with the same center, voxel size and bounds.
+
+        Returns
+        -------
+        Voxelizer
+            This voxelizer.
+        """
+        if not (numpy.array_equal(self._center, other._center)
+                and self._voxel_size == other._voxel_size
+                and _same_bound(self._lower, other._lower)
+                and _same_bound(self._upper, other._upper)):
+            raise ValueError("Only voxelizers of the same grid can be merged.")
+        other._compact()
+        self._push(other._state)
+        self.dropped += other.dropped
+        return self
+
+    # Methods | results
+
+    @property
+    def keys(self):
+        """Getter decorator method for keys parameter."""
+        return self._compact()[0]
+
+    @property
+    def count(self):
+        """Getter decorator method for count parameter."""
+        return self._compact()[1]
+
+    @property
+    def mean(self):
+        """Getter decorator method for mean parameter."""
+        state = self._compact()
+        return state[2] / state[1]
+
+    @property
+    def min(self):
+        """Getter decorator method for min parameter."""
+        return self._compact()[3]
+
+    @property
+    def max(self):
+        """Getter decorator method for max parameter."""
+        return self._compact()[4]
+
+    def coords(self):
+        """Returns the (N, 3) indices of the occupied voxels."""
+        return numpy.column_stack(VoxelKey.unpack(self.keys))
+
+    def to_store(self, statistic="count"):
+        """
+        Returns one aggregate as a SparseVoxelStore.
+
+        Parameters
+        ----------
+        statistic : str, optional
+            "count", "mean", "min" or "max". Defaults to "count".
+        """
+        values = self._statistic(statistic)
+        store = SparseVoxelStore(dtype=values.dtype, capacity=values.shape[0])
+        x, y, z = VoxelKey.unpack(self.keys)
+        store.insert(x, y, z, values)
+        return store
+
+    def to_dense(self, statistic="count", lower=None, upper=None, fill_value=0):
+        """
+        Returns one aggregate as a dense (x, y, z) array over the box
+        [lower, upper), which defaults to the bounds of the voxelizer or,
+        for an unbounded voxelizer, to the box of its occupied voxels.
+        """
+        values = self._statistic(statistic)
+        if lower is None:
+            lower = self._lower
+        if upper is None:
+            upper = self._upper
+        if lower is None or upper is None:
+            coords = self.coords()
+            if coords.shape[0] == 0:
+                raise ValueError("An empty unbounded voxelizer needs lower and upper.")
+            if lower is None:
+                lower = coords.min(axis=0)
+            if upper is None:
+                upper = coords.max(axis=0) + 1
+        lower = numpy.asarray(lower, dtype=numpy.int64)
+        upper = numpy.asarray(upper, dtype=numpy.int64)
+        dense = numpy.full(tuple(upper - lower), fill_value, dtype=values.dtype)
+        index = self.coords() - lower
+        inside = numpy.all((index >= 0) & (index < upper - lower), axis=1)
+        dense[tuple(index[inside].T)] = values[inside]
+        return dense
+
+    # Methods | helpers
+
+    def _statistic(self, statistic):
+        """Returns an aggregate by name."""
+        if statistic not in ("count", "mean", "min", "max"):
+            raise ValueError("statistic must be 'count', 'mean', 'min' or 'max'.")
+        return getattr(self, statistic)
+
+    def _push(self, state):
+        """Queues a reduced batch, merging once the queue outweighs the state."""
+        self._pending.append(state)
+        self._pending_size += state[0].shape[0]
+        if self._pending_size > max(self._state[0].shape[0], 1 << 16):
+            self._compact()
+
+    def _compact(self):
+        """Merges the queued batches into the state and returns it."""
+        if self._pending:
+            parts = [self._state] + self._pending
+            self._state = _reduce(*(
+                numpy.concatenate([part[n] for part in parts]) for n in range(5)
+            ))
+            self._pending = []
+            self._pending_size = 0
+        return self._state
+
+
+def _xyz(point):
+    """Returns the (x, y, z) of a Point, Vector or sequence."""
+    if hasattr(point, "x"):
+        return (point.x, point.y, point.z)
+    return tuple(point)
+
+
+def _same_bound(a, b):
+    """Checks whether two optional bounds are equal."""
+    if a is None or b is None:
+        return a is None and b is None
+    return numpy.array_equal(a, b)
+
+
+def _empty_state():
+    """Returns the aggregates of no points."""
+    return (
+        numpy.empty(0, dtype=numpy.int64),
+        numpy.empty(0, dtype=numpy.int64),
+        numpy.empty(0),
+        numpy.empty(0),
+        numpy.empty(0),
+    )
+
+
+def _reduce(keys, count, total, low, high):
+    """
+    Combines the rows of equal keys: counts and sums are added, minima and
+    maxima reduced. Returns the aggregates in key order.
+    """
+    if keys.shape[0] == 0:
+        return _empty_state()
+    order = numpy.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = numpy.flatnonzero(numpy.r_[True, keys[1:] != keys[:-1]])
+    return (
+        keys[starts],
+        numpy.add.reduceat(count[order], starts),
+        numpy.add.reduceat(total[order], starts),
+        numpy.minimum.reduceat(low[order], starts),
+        numpy.maximum.reduceat(high[order], starts),
+    )
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
@@ -25,6 +25,7 @@ Todo:
 # =============================================================================
 
 # Import | Standard Library
+import time
 
 # Import | Libraries
 import geojson
@@ -74,19 +75,14 @@ class GeographicArea(object):
             assert isinstance(upperright, GeographicCoordinate)
         self._upperright = upperright
 
-        # Construct | lowerright and upperleft parameter
-        if isinstance(lowerleft, GeographicCoordinate) and isinstance(upperright, GeographicCoordinate):
-            self._lowerright = GeographicCoordinate(self._upperright.lat, self._lowerleft.lon, self._lowerleft.height)
-            self._upperleft = GeographicCoordinate(self._lowerleft.lat, self._upperright.lon, self._lowerleft.height)
-
-        # Construct | center parameter
-        self._center = GeographicCoordinate(
-            (upperright.lat + lowerleft.lat) / 2,
-            (upperright.lon + lowerleft.lon) / 2,
-        )
+        # Construct | lowerright, upperleft and center parameter
+        self.load_corners()
+
         # self.load_size()
         self._size = size
-        self._geojson_data = self.load_geojson()
+
+        # Construct | geojson_data parameter, built on first access
+        self._geojson_data = None
 
 
     # def __str__(self):
@@ -143,6 +139,7 @@ class GeographicArea(object):
         """Setter decorator method for lowerleft parameter."""
         assert isinstance(lowerleft, GeographicCoordinate)
         self._lowerleft = lowerleft
+        self.load_corners()
 
     @lowerleft.deleter
     def lowerleft(self):
@@ -162,6 +159,7 @@ class GeographicArea(object):
         """Setter decorator method for upperright parameter."""
         assert isinstance(upperright, GeographicCoordinate)
         self._upperright = upperright
+        self.load_corners()
 
     @upperright.deleter
     def upperright(self):
@@ -169,6 +167,23 @@ class GeographicArea(object):
         del self._upperright
 
 
+    def load_corners(self):
+        """
+        Loader method for the lowerright, upperleft and center parameters.
+        Invalidates the cached geojson_data parameter.
+        """
+        lowerleft = self._lowerleft
+        upperright = self._upperright
+        if isinstance(lowerleft, GeographicCoordinate) and isinstance(upperright, GeographicCoordinate):
+            self._lowerright = GeographicCoordinate(upperright.lat, lowerleft.lon, lowerleft.height)
+            self._upperleft = GeographicCoordinate(lowerleft.lat, upperright.lon, lowerleft.height)
+            self._center = GeographicCoordinate(
+                (upperright.lat + lowerleft.lat) / 2,
+                (upperright.lon + lowerleft.lon) / 2,
+            )
+        self._geojson_data = None
+
+
     # Methods | lowerright parameter
 
     @property
@@ -207,6 +222,7 @@ class GeographicArea(object):
         """Setter decorator method for center parameter."""
         assert isinstance(center, GeographicCoordinate)
         self._center = center
+        self._geojson_data = None
 
     @center.deleter
     def center(self):
@@ -243,7 +259,13 @@ class GeographicArea(object):
 
     @property
     def geojson_data(self):
-        """Getter decorator method for geojson_data parameter."""
+        """
+        Getter decorator method for geojson_data parameter.
+        The GeoJSON is built on first access and cached until the corners
+        change.
+        """
+        if self._geojson_data is None:
+            self._geojson_data = self.load_geojson()
         return self._geojson_data
 
     @geojson_data.setter
@@ -282,3 +304,33 @@ class GeographicArea(object):
             ])
         return geojson_data
 
+
+def benchmark(n=1000000):
+    """
+    Benchmark Function
+
+    Compares the cost of constructing 'n' areas with and without building
+    their GeoJSON, the latter being what every constructor used to do.
+    """
+    lowerleft = GeographicCoordinate(52.0, 4.0)
+    upperright = GeographicCoordinate(52.1, 4.1)
+
+    start = time.perf_counter()
+    for _ in range(n):
+        GeographicArea(lowerleft, upperright).geojson_data
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        GeographicArea(lowerleft, upperright)
+    lazy = time.perf_counter() - start
+
+    print(f"eager geojson {eager:8.2f} s  ({eager / n * 1e6:.2f} us/area)")
+    print(f"lazy geojson  {lazy:8.2f} s  ({lazy / n * 1e6:.2f} us/area)")
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    benchmark()
@@ -26,11 +26,14 @@ Todo:
 # =============================================================================
 
 # Import | Standard Library
+from collections import OrderedDict, namedtuple
 import math
+import threading
 
 # Import | Libraries
-from pyproj import Proj, Transformer
+from pyproj import Geod, Proj, Transformer
 import geojson
+import numpy
 
 # Import | Local Modules
 
@@ -39,6 +42,125 @@ import geojson
 # Classes
 # =============================================================================
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TransformerCache(object):
+    """
+    A thread-safe, bounded LRU cache of pyproj Transformers.
+
+    Building a Transformer sets up a PROJ pipeline, which costs far more than
+    transforming a coordinate. Transformers are cached per (source, target,
+    always_xy) key. Since a Transformer must not be shared between threads,
+    every thread keeps its own LRU of at most 'maxsize' instances; the
+    hit/miss counters are shared by the whole process.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of transformers kept per thread. Defaults to 16.
+
+    Examples
+    --------
+    >>> cache = TransformerCache()
+    >>> transformer = cache.get("EPSG:28992", "EPSG:4326")
+    >>> cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=16, currsize=1)
+
+    """
+
+    def __init__(self, maxsize=16):
+        """Constructor of the object."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self._maxsize = int(maxsize)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+
+    def get(self, source, target, always_xy=False):
+        """
+        Returns the cached transformer from 'source' to 'target' for the
+        calling thread, creating it on a miss.
+
+        Parameters
+        ----------
+        source, target : str or int
+            Any CRS definition accepted by Transformer.from_crs.
+        always_xy : bool, optional
+            Whether to use the traditional GIS (x, y) axis order. Defaults to
+            False, following the axis order of the CRS definitions.
+
+        Returns
+        -------
+        pyproj.Transformer
+            A transformer owned by the calling thread.
+
+        """
+        cache = self._thread_cache()
+        key = (source, target, bool(always_xy))
+        transformer = cache.get(key)
+        if transformer is not None:
+            cache.move_to_end(key)
+            with self._lock:
+                self._hits += 1
+            return transformer
+
+        transformer = Transformer.from_crs(source, target, always_xy=always_xy)
+        cache[key] = transformer
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
+        with self._lock:
+            self._misses += 1
+        return transformer
+
+    def info(self):
+        """
+        Returns the process-wide hit/miss counters, and the number of
+        transformers cached by the calling thread.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._thread_cache()),
+            )
+
+    def clear(self):
+        """Drops the transformers of all threads and resets the counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._generation += 1
+
+    def _thread_cache(self):
+        """Returns the LRU of the calling thread, dropping it if cleared."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.cache = OrderedDict()
+            local.generation = self._generation
+        return local.cache
+
+
+#: Process-wide transformer cache used by GeographicCoordinate
+TRANSFORMERS = TransformerCache()
+
+#: Mean equatorial radius used by the spherical offset approximation
+EARTH_RADIUS = 6378137.0
+
+#: WGS84 ellipsoid used by the geodesic offset mode
+WGS84_GEOD = Geod(ellps="WGS84")
+
+#: Structured dtype of RD New (EPSG:28992) coordinates
+RD_DTYPE = numpy.dtype([("x", numpy.float64), ("y", numpy.float64)])
+
+#: Structured dtype of WGS84 (EPSG:4326) coordinates
+WGS84_DTYPE = numpy.dtype([("lon", numpy.float64), ("lat", numpy.float64)])
+
+
 class GeographicCoordinate(object):
     """
     A class used to represent a Geographic Coordinate
@@ -82,8 +204,8 @@ class GeographicCoordinate(object):
         assert isinstance(height, float)
         self._height = height
 
-        # Construct | geojson_data parameter
-        self._geojson_data = self.load_geojson()
+        # Construct | geojson_data parameter, built on first access
+        self._geojson_data = None
 
     # def __str__(self):
     # # This method returns the string representation of the object.
@@ -116,19 +238,104 @@ class GeographicCoordinate(object):
 
     @staticmethod
     def rd2wgs(x, y):
-        """"""
-        RD2WGS = Transformer.from_crs("EPSG:28992", "EPSG:4326")
-        lon, lat = RD2WGS.transform(x, y)
-        return {"lon": lon,
-                "lat": lat}
+        """Converts a single RD New point to a WGS84 {"lon", "lat"} dict."""
+        point = GeographicCoordinate.rd2wgs_array([x], [y])[0]
+        return {"lon": float(point["lon"]),
+                "lat": float(point["lat"])}
 
     @staticmethod
     def wgs2rd(lon, lat):
-        """"""
-        WGS2RD = Transformer.from_crs("EPSG:4326", "EPSG:28992")
-        x, y = WGS2RD.transform(lon, lat)
-        return {"x": x,
-                "y": y}
+        """Converts a single WGS84 point to an RD New {"x", "y"} dict."""
+        point = GeographicCoordinate.wgs2rd_array([lon], [lat])[0]
+        return {"x": float(point["x"]),
+                "y": float(point["y"])}
+
+    @staticmethod
+    def rd2wgs_array(x, y, out=None):
+        """
+        Converts arrays of RD New (EPSG:28992) coordinates to WGS84.
+
+        All points are transformed in a single PROJ call.
+
+        Parameters
+        ----------
+        x, y : array-like
+            The RD coordinates in metres, as NumPy arrays or any object
+            supporting the buffer protocol, of matching shape.
+        out : numpy.ndarray or tuple, optional
+            Either a structured array of :data:`WGS84_DTYPE` to fill, or a
+            (lon, lat) pair of writable, C-contiguous float64 buffers that
+            PROJ writes into directly. 'out' may alias 'x' and 'y' to
+            convert them in place.
+
+        Returns
+        -------
+        numpy.ndarray or tuple
+            A structured array with 'lon' and 'lat' fields in degrees, or
+            'out' when given.
+
+        """
+        return GeographicCoordinate._transform_array(
+            "EPSG:28992", "EPSG:4326", x, y, out, WGS84_DTYPE
+        )
+
+    @staticmethod
+    def wgs2rd_array(lon, lat, out=None):
+        """
+        Converts arrays of WGS84 (EPSG:4326) coordinates to RD New.
+
+        See :meth:`rd2wgs_array`; the result has 'x' and 'y' fields in
+        metres, and a structured 'out' must be of :data:`RD_DTYPE`.
+
+        """
+        return GeographicCoordinate._transform_array(
+            "EPSG:4326", "EPSG:28992", lon, lat, out, RD_DTYPE
+        )
+
+    @staticmethod
+    def _transform_array(source, target, a, b, out, dtype):
+        """
+        Transforms two coordinate arrays in one call, with traditional GIS
+        (x/lon, y/lat) axis order on both sides.
+        """
+        transformer = TRANSFORMERS.get(source, target, always_xy=True)
+
+        if isinstance(out, tuple):
+            # Write straight into the caller's buffers
+            out_a, out_b = (
+                numpy.frombuffer(buffer, dtype=numpy.float64)
+                if not isinstance(buffer, numpy.ndarray) else buffer
+                for buffer in out
+            )
+            for buffer in (out_a, out_b):
+                if not (buffer.flags.c_contiguous and buffer.flags.writeable
+                        and buffer.dtype == numpy.float64):
+                    raise ValueError(
+                        "Output buffers must be writable, C-contiguous "
+                        "float64 arrays."
+                    )
+            out_a[...] = a
+            out_b[...] = b
+            # pyproj leaves 0-d arrays untouched in place; 1-d views of the
+            # same (contiguous) memory are transformed
+            transformer.transform(out_a.reshape(-1), out_b.reshape(-1), inplace=True)
+            return out
+
+        a = numpy.array(a, dtype=numpy.float64, order="C")
+        b = numpy.array(b, dtype=numpy.float64, order="C")
+        if a.shape != b.shape:
+            raise ValueError("Coordinate arrays must have the same shape.")
+        transformer.transform(a.reshape(-1), b.reshape(-1), inplace=True)
+
+        if out is None:
+            out = numpy.empty(a.shape, dtype=dtype)
+        elif out.dtype != dtype or out.shape != a.shape:
+            raise ValueError(
+                f"Output array must have dtype {dtype} and shape {a.shape}."
+            )
+        out[dtype.names[0]] = a
+        out[dtype.names[1]] = b
+        return out
 
     @staticmethod
     def coord_offset(latIn, lonIn, dx, dy):
@@ -142,15 +349,83 @@ class GeographicCoordinate(object):
     @staticmethod
     def coord_offset_alt(_lat, _lon, _offset_n, _offset_e):
         """"""
-        earth_radius = 6378137.0
+        earth_radius = EARTH_RADIUS
         dif_lat = _offset_n / earth_radius
         dif_lon = _offset_e / (earth_radius * math.cos(math.pi * _lat / 180))
         lat_off = _lat + dif_lat * 180 / math.pi
         lon_off = _lon + dif_lon * 180 / math.pi
-        lat_for = float("%.10f" % lat_off)
-        lon_for = float("%.10f" % lon_off)
+        lat_for = round(lat_off, 10)
+        lon_for = round(lon_off, 10)
         return (lat_for, lon_for)
 
+    @staticmethod
+    def coord_offset_array(lat, lon, offset_n, offset_e, method="spherical",
+                           decimals=10):
+        """
+        Offsets a base coordinate by arrays of north/east distances.
+
+        All offsets are computed in one NumPy pass, without any projection.
+
+        Parameters
+        ----------
+        lat, lon : float or array-like
+            The base coordinate in degrees; broadcast against the offsets.
+        offset_n, offset_e : array-like
+            The (N,) northward and eastward offsets in metres.
+        method : str, optional
+            "spherical" uses the small-offset approximation of
+            :meth:`coord_offset_alt` on a sphere of :data:`EARTH_RADIUS`.
+            "geodesic" solves the direct geodesic problem on the WGS84
+            ellipsoid, moving hypot(n, e) metres along azimuth
+            atan2(e, n). Defaults to "spherical".
+        decimals : int, optional
+            The number of decimals to round the degrees to, or None to skip
+            rounding. Defaults to 10, like :meth:`coord_offset_alt`.
+
+        Returns
+        -------
+        lat, lon : numpy.ndarray
+            The offset coordinates in degrees.
+
+        Examples
+        --------
+        >>> lat, lon = GeographicCoordinate.coord_offset_array(
+        ...     52.0, 5.0, [0.0, 100.0], [100.0, 0.0])
+        >>> lat.tolist(), lon.tolist()
+        ([52.0, 52.0008983153], [5.0014591059, 5.0])
+
+        """
+        lat, lon, offset_n, offset_e = numpy.broadcast_arrays(
+            numpy.asarray(lat, dtype=numpy.float64),
+            numpy.asarray(lon, dtype=numpy.float64),
+            numpy.asarray(offset_n, dtype=numpy.float64),
+            numpy.asarray(offset_e, dtype=numpy.float64),
+        )
+
+        if method == "spherical":
+            dif_lat = offset_n / EARTH_RADIUS
+            dif_lon = offset_e / (EARTH_RADIUS * numpy.cos(numpy.radians(lat)))
+            lat_off = lat + numpy.degrees(dif_lat)
+            lon_off = lon + numpy.degrees(dif_lon)
+        elif method == "geodesic":
+            azimuth = numpy.degrees(numpy.arctan2(offset_e, offset_n))
+            distance = numpy.hypot(offset_n, offset_e)
+            lon_off, lat_off, _ = WGS84_GEOD.fwd(
+                numpy.ascontiguousarray(lon),
+                numpy.ascontiguousarray(lat),
+                azimuth,
+                distance,
+            )
+            lat_off = numpy.reshape(lat_off, lat.shape)
+            lon_off = numpy.reshape(lon_off, lon.shape)
+        else:
+            raise ValueError("method must be 'spherical' or 'geodesic'.")
+
+        if decimals is not None:
+            lat_off = numpy.round(lat_off, decimals)
+            lon_off = numpy.round(lon_off, decimals)
+        return numpy.asarray(lat_off), numpy.asarray(lon_off)
+
     # Methods | lat parameter
 
     @property
@@ -162,6 +437,7 @@ class GeographicCoordinate(object):
     def lat(self, lat):
         """Setter decorator method for lat parameter."""
         self._lat = lat
+        self._geojson_data = None
 
     @lat.deleter
     def lat(self):
@@ -179,6 +455,7 @@ class GeographicCoordinate(object):
     def lon(self, lon):
         """Setter decorator method for lon parameter."""
         self._lon = lon
+        self._geojson_data = None
 
     @lon.deleter
     def lon(self):
@@ -208,7 +485,11 @@ class GeographicCoordinate(object):
     def geojson_data(self):
         """
         Getter decorator method for geojson_data parameter.
+        The GeoJSON is built on first access and cached until the lat or lon
+        parameter changes.
         """
+        if self._geojson_data is None:
+            self._geojson_data = self.load_geojson()
         return self._geojson_data
 
     @geojson_data.setter
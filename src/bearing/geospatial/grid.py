@@ -27,6 +27,12 @@ Todo:
 
 # Import | Standard Library
 from array import *
+import io
+import json
+import math
+import os
+import time
+import warnings
 
 
 # Import | Libraries
@@ -42,14 +48,193 @@ from bearing.geospatial.area import GeographicArea
 
 
 
+class GridCell(object):
+    """
+    A lightweight view of a single cell of a GeographicGrid.
+
+    The view only holds the grid and the cell indices; coordinates, areas
+    and raster values are read from the grid arrays on access.
+
+    Attributes
+    ----------
+    index : tuple
+        the (i, j) index of the cell, i along latitude and j along longitude
+    bounds : tuple
+        the (ll_lat, ll_lon, ur_lat, ur_lon) bounds of the cell
+    """
+
+    __slots__ = ("_grid", "_i", "_j")
+
+    def __init__(self, grid, i, j):
+        """Constructor of the object."""
+        self._grid = grid
+        self._i = i
+        self._j = j
+
+    def __repr__(self):
+        """Special method used to represent a class's objects as a string."""
+        return "GridCell(%d, %d)" % (self._i, self._j)
+
+    @property
+    def index(self):
+        """Getter decorator method for index parameter."""
+        return (self._i, self._j)
+
+    @property
+    def bounds(self):
+        """Getter decorator method for bounds parameter."""
+        lat_edges = self._grid.lat_edges
+        lon_edges = self._grid.lon_edges
+        return (
+            float(lat_edges[self._i]),
+            float(lon_edges[self._j]),
+            float(lat_edges[self._i + 1]),
+            float(lon_edges[self._j + 1]),
+        )
+
+    @property
+    def lowerleft(self):
+        """Getter decorator method for lowerleft parameter."""
+        ll_lat, ll_lon, _, _ = self.bounds
+        return GeographicCoordinate(ll_lat, ll_lon)
+
+    @property
+    def upperright(self):
+        """Getter decorator method for upperright parameter."""
+        _, _, ur_lat, ur_lon = self.bounds
+        return GeographicCoordinate(ur_lat, ur_lon)
+
+    @property
+    def center(self):
+        """Getter decorator method for center parameter."""
+        ll_lat, ll_lon, ur_lat, ur_lon = self.bounds
+        return GeographicCoordinate((ll_lat + ur_lat) / 2, (ll_lon + ur_lon) / 2)
+
+    @property
+    def values(self):
+        """Getter decorator method for the raster values of the cell."""
+        return {
+            name: raster[self._i, self._j]
+            for name, raster in self._grid.rasters.items()
+        }
+
+    @property
+    def area(self):
+        """Materializes the cell as a GeographicArea."""
+        return GeographicArea(self.lowerleft, self.upperright)
+
+    @property
+    def geojson_data(self):
+        """Getter decorator method for geojson_data parameter."""
+        return self.area.geojson_data
+
+
+class GridRow(object):
+    """
+    A lightweight view of one row (constant latitude index) of grid cells.
+    """
+
+    __slots__ = ("_grid", "_i")
+
+    def __init__(self, grid, i):
+        """Constructor of the object."""
+        self._grid = grid
+        self._i = i
+
+    def __len__(self):
+        """Returns the number of cells in the row."""
+        return self._grid.resolution[1]
+
+    def __getitem__(self, j):
+        """Returns the cell view at column j."""
+        j = _cell_index(j, len(self))
+        return GridCell(self._grid, self._i, j)
+
+    def __iter__(self):
+        """Iterates over the cell views of the row."""
+        for j in range(len(self)):
+            yield GridCell(self._grid, self._i, j)
+
+
+class GridCells(object):
+    """
+    A lazy, list-like view of the cells of a GeographicGrid.
+
+    Supports the nested indexing of the former list of lists,
+    cells[i][j], as well as cells[i, j]. Cells are only created when they
+    are indexed.
+    """
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid):
+        """Constructor of the object."""
+        self._grid = grid
+
+    def __len__(self):
+        """Returns the number of rows."""
+        return self._grid.resolution[0]
+
+    def __getitem__(self, key):
+        """Returns a row view for cells[i], or a cell view for cells[i, j]."""
+        if isinstance(key, tuple):
+            i, j = key
+            return GridCell(
+                self._grid,
+                _cell_index(i, len(self)),
+                _cell_index(j, self._grid.resolution[1]),
+            )
+        return GridRow(self._grid, _cell_index(key, len(self)))
+
+    def __iter__(self):
+        """Iterates over the row views."""
+        for i in range(len(self)):
+            yield GridRow(self._grid, i)
+
+
+def _warn_cells():
+    """Warns that cells can no longer be set."""
+    warnings.warn(
+        "Setting GeographicGrid cells is deprecated and ignored: cells are "
+        "derived from the area and resolution; store cell values in rasters.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _cell_index(index, length):
+    """Normalizes a (negative) cell index and checks its bounds."""
+    index = int(index)
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("Cell index out of range.")
+    return index
+
+
 class GeographicGrid(object):
     """
     A class used to represent a Geographic Grid
 
-    ...
+    The grid is stored in columnar form: the cell edges are two 1D arrays of
+    latitudes and longitudes, and cell values are kept in 2D rasters of
+    shape 'resolution'. Cells are exposed through lazy views, and whole-grid
+    queries (centers, bounds, point lookup) are array operations.
 
     Attributes
     ----------
+    lat_edges : numpy.ndarray
+        the (resolution[0] + 1,) latitudes of the cell edges
+    lon_edges : numpy.ndarray
+        the (resolution[1] + 1,) longitudes of the cell edges
+    cells : GridCells
+        lazy view of the cells, indexed as cells[i][j] or cells[i, j]
+    rasters : dict
+        the value rasters, by name
+
+    The cells are no longer stored objects, so the 'cells' constructor
+    argument and setter are deprecated and ignored; cell values belong in
+    rasters, which are passed by keyword.
 
 
     Methods
@@ -68,6 +253,7 @@ class GeographicGrid(object):
         step =          None,
         cells =         None,
         geojson_data =  None,
+        rasters =       None,
         ):
         """Constructor of the object."""
 
@@ -91,20 +277,52 @@ class GeographicGrid(object):
         if area is not None:
             self.load_step()
 
-        # Construct | cells parameter
-        self._cells = cells
+        # Construct | cells parameter, derived from the area and resolution
+        if cells is not None:
+            _warn_cells()
+        self._lat_edges = None
+        self._lon_edges = None
+        self._cells = None
         if area is not None:
             self.load_cells()
 
-        # Construct | geojson_data parameter
+        # Construct | rasters parameter, kept in memory until to_disk()
+        self._path = None
+        self._mode = None
+        self._rasters = {}
+        for name, data in (rasters or {}).items():
+            self.add_raster(name, data)
+
+        # Construct | geojson_data parameter, built on first access
         self._geojson_data = geojson_data
-        if area is not None:
-            self.load_geojson()
 
     def __str__(self):
         """This method returns the string representation of the object."""
         return '<' + str(self.area) + ',' + str(self.resolution) + '>'
 
+    def __reduce_ex__(self, protocol):
+        """
+        Pickles a disk-backed grid by path, so workers map the same files.
+
+        Copy-on-write grids, and grids holding rasters that are not on disk,
+        would lose those private changes when reopened from the path, so
+        they are pickled by value and unpickle as in-memory grids.
+        """
+        if self._path is not None and self._mode != "c" and all(
+            isinstance(raster, numpy.memmap) for raster in self._rasters.values()
+        ):
+            return (GeographicGrid.from_disk, (self._path, self._mode))
+        reduced = object.__reduce_ex__(self, protocol)
+        if self._path is None:
+            return reduced
+        state = dict(reduced[2])
+        state["_path"] = None
+        state["_mode"] = None
+        state["_rasters"] = {
+            name: numpy.asarray(raster) for name, raster in self._rasters.items()
+        }
+        return reduced[:2] + (state,) + reduced[3:]
+
     def __eq__(self, other):
         """Operator to compare the instances of the class."""
         return self.area == other.area and self.resolution == other.resolution
@@ -208,28 +426,359 @@ class GeographicGrid(object):
 
     @cells.setter
     def cells(self, cells):
-        """Setter decorator method for cells parameter."""
-        # assert isinstance(cells, dict)
-        self._cells = cells
+        """Setter decorator method for cells parameter (deprecated, ignored)."""
+        _warn_cells()
 
-    @cells.deleter
-    def cells(self):
-        """Deleter decorator method for cells parameter."""
-        del self._cells
+    @property
+    def lat_edges(self):
+        """Getter decorator method for lat_edges parameter."""
+        return self._lat_edges
+
+    @property
+    def lon_edges(self):
+        """Getter decorator method for lon_edges parameter."""
+        return self._lon_edges
 
     def load_cells(self):
         """Loader method for cells parameter."""
-        self._cells = [[0 for x in range(self._resolution[0])] for y in range(self._resolution[1])]
-        for i in range(self._resolution[0]):
-            ll_lat = self._area.lowerleft.lat + i * self._step[0]
-            ur_lat = ll_lat + self._step[0]
-            for j in range(self._resolution[1]):
-                ll_lon = self._area.lowerleft.lon + i * self._step[1]
-                ur_lon = ll_lon + self._step[1]
-                ll = GeographicCoordinate(ll_lat, ll_lon)
-                ur = GeographicCoordinate(ur_lat, ur_lon)
-                cell = GeographicArea(ll, ur)
-                self._cells[i][j] = cell
+        self._lat_edges = (
+            self._area.lowerleft.lat
+            + numpy.arange(self._resolution[0] + 1) * self._step[0]
+        )
+        self._lon_edges = (
+            self._area.lowerleft.lon
+            + numpy.arange(self._resolution[1] + 1) * self._step[1]
+        )
+        self._cells = GridCells(self)
+
+    def centers(self):
+        """
+        Returns the cell centers as two arrays of shape 'resolution'.
+
+        Returns
+        -------
+        lat, lon : numpy.ndarray
+            The latitudes and longitudes of the cell centers.
+        """
+        lat = (self._lat_edges[:-1] + self._lat_edges[1:]) / 2
+        lon = (self._lon_edges[:-1] + self._lon_edges[1:]) / 2
+        return numpy.meshgrid(lat, lon, indexing="ij")
+
+    def bounds(self):
+        """
+        Returns the bounds of all cells.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape resolution + (4,) holding the
+            (ll_lat, ll_lon, ur_lat, ur_lon) bounds of every cell.
+        """
+        bounds = numpy.empty(tuple(self._resolution) + (4,))
+        bounds[..., 0] = self._lat_edges[:-1, numpy.newaxis]
+        bounds[..., 1] = self._lon_edges[numpy.newaxis, :-1]
+        bounds[..., 2] = self._lat_edges[1:, numpy.newaxis]
+        bounds[..., 3] = self._lon_edges[numpy.newaxis, 1:]
+        return bounds
+
+    def locate(self, lat, lon):
+        """
+        Looks up the cells containing the given points.
+
+        The indices are computed arithmetically from the lower left corner
+        and the step of the grid, which is O(1) per point, and then checked
+        against the edge arrays so that points on an edge land in the same
+        cell as reported by :meth:`bounds`. Cells include their lower
+        edges; the upper edges of the last row and column belong to the
+        grid as well.
+
+        Parameters
+        ----------
+        lat, lon : array-like
+            The point coordinates, of any (matching) shape.
+
+        Returns
+        -------
+        i, j : numpy.ndarray
+            The cell indices of the points, -1 for points outside the grid.
+        inside : numpy.ndarray
+            A boolean mask of the points inside the grid.
+
+        Examples
+        --------
+        >>> grid = GeographicGrid(
+        ...     GeographicArea(
+        ...         GeographicCoordinate(52.0, 4.0),
+        ...         GeographicCoordinate(53.0, 5.0),
+        ...     ),
+        ...     (4, 4),
+        ... )
+        >>> gps_lat = numpy.array([52.1, 52.1, 52.9, 54.0])
+        >>> gps_lon = numpy.array([4.1, 4.2, 4.6, 4.5])
+        >>> i, j, inside = grid.locate(gps_lat, gps_lon)
+        >>> i.tolist(), j.tolist(), inside.tolist()
+        ([0, 0, 3, -1], [0, 0, 2, -1], [True, True, True, False])
+        >>> counts = numpy.zeros(grid.resolution, dtype=int)
+        >>> numpy.add.at(counts, (i[inside], j[inside]), 1)
+        >>> int(counts[0, 0])
+        2
+        """
+        i, lat_inside = self._edge_index(self._lat_edges, self._step[0], lat)
+        j, lon_inside = self._edge_index(self._lon_edges, self._step[1], lon)
+        inside = lat_inside & lon_inside
+        i[~inside] = -1
+        j[~inside] = -1
+        return i, j, inside
+
+    @staticmethod
+    def _edge_index(edges, step, values):
+        """Returns the interval index of 'values' in 'edges', and a mask."""
+        values = numpy.asarray(values, dtype=numpy.float64)
+        shape = values.shape
+        values = values.reshape(-1)
+        n = edges.shape[0] - 1
+        inside = (values >= edges[0]) & (values <= edges[-1])
+        index = numpy.floor((values - edges[0]) / step)
+        index = numpy.where(inside, index, 0.0)
+        index = numpy.clip(index, 0, n - 1).astype(numpy.intp)
+
+        # Correct for rounding in the division, for points near an edge;
+        # the upper edge of the grid belongs to the last cell
+        index -= (values < edges[index]) & (index > 0)
+        index += (values >= edges[index + 1]) & (index < n - 1)
+        index[~inside] = -1
+        return index.reshape(shape), inside.reshape(shape)
+
+    def _locate_scan(self, lat, lon):
+        """
+        Brute-force reference of :meth:`locate`, scanning the bounds of
+        every cell for every point.
+        """
+        bounds = self.bounds().reshape(-1, 4)
+        n_lat, n_lon = self._resolution
+        lat = numpy.asarray(lat, dtype=numpy.float64).ravel()
+        lon = numpy.asarray(lon, dtype=numpy.float64).ravel()
+        i = numpy.full(lat.shape, -1, dtype=numpy.intp)
+        j = numpy.full(lat.shape, -1, dtype=numpy.intp)
+        for k in range(lat.shape[0]):
+            hits = numpy.flatnonzero(
+                (bounds[:, 0] <= lat[k])
+                & ((lat[k] < bounds[:, 2]) | (bounds[:, 2] == self._lat_edges[-1]))
+                & (bounds[:, 1] <= lon[k])
+                & ((lon[k] < bounds[:, 3]) | (bounds[:, 3] == self._lon_edges[-1]))
+                & (bounds[:, 2] >= lat[k])
+                & (bounds[:, 3] >= lon[k])
+            )
+            if hits.size:
+                i[k], j[k] = divmod(int(hits[0]), n_lon)
+        return i, j, i >= 0
+
+
+    # Methods | rasters parameter
+
+    @property
+    def rasters(self):
+        """Getter decorator method for rasters parameter."""
+        return self._rasters
+
+    def raster(self, name):
+        """Getter method for a single value raster."""
+        return self._rasters[name]
+
+    def add_raster(self, name, data=None, dtype=numpy.float64, fill_value=numpy.nan):
+        """
+        Adds a value raster of shape 'resolution' to the grid.
+
+        Parameters
+        ----------
+        name : str
+            The name of the raster.
+        data : array-like, optional
+            The raster values; defaults to a new raster of 'fill_value'.
+        dtype : numpy.dtype, optional
+            The dtype of a new raster. Defaults to float64.
+        fill_value : scalar, optional
+            The initial value of a new raster. Defaults to NaN.
+
+        Returns
+        -------
+        numpy.ndarray
+            The raster, which can be updated in place.
+        """
+        shape = tuple(self._resolution)
+        if data is not None and not isinstance(data, numpy.ndarray):
+            data = numpy.asarray(data)
+        if data is not None and data.shape != shape:
+            raise ValueError(
+                f"Raster must have shape {shape}, not {data.shape}."
+            )
+
+        if self._path is not None:
+            self._check_writable()
+        if self._path is not None and self._mode == "r+":
+            # Disk-backed grids write new rasters straight to their file;
+            # copy-on-write grids keep them in memory like their changes.
+            # The file is written aside and then swapped in, so 'data' may
+            # be a map of the file it replaces.
+            path = self._raster_path(name)
+            raster = numpy.lib.format.open_memmap(
+                path + ".tmp", mode="w+", shape=shape,
+                dtype=dtype if data is None else data.dtype,
+            )
+            raster[...] = fill_value if data is None else data
+            raster.flush()
+            os.replace(path + ".tmp", path)
+            self._rasters[name] = raster
+            self._write_header()
+            return raster
+
+        if data is None:
+            data = numpy.full(shape, fill_value, dtype=dtype)
+        self._rasters[name] = data
+        return data
+
+    def del_raster(self, name):
+        """Deleter method for a single value raster."""
+        if self._path is not None:
+            self._check_writable()
+        raster = self._rasters.pop(name)
+        if self._mode == "r+" and isinstance(raster, numpy.memmap):
+            os.remove(self._raster_path(name))
+            self._write_header()
+
+
+    # Methods | disk backend
+
+    #: Name of the JSON header in a disk-backed grid directory
+    HEADER = "grid.json"
+
+    @property
+    def path(self):
+        """Getter decorator method for path parameter."""
+        return self._path
+
+    @property
+    def mode(self):
+        """Getter decorator method for mode parameter."""
+        return self._mode
+
+    def to_disk(self, path):
+        """
+        Stores the grid in a directory and maps its rasters from there.
+
+        The directory holds a small JSON header with the area, resolution
+        and step, and one raw .npy file per raster. Afterwards the rasters
+        of this grid are read-write memory maps of those files, and rasters
+        added later are created on disk directly, so they may be larger
+        than RAM.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The directory; it is created if needed.
+
+        Returns
+        -------
+        GeographicGrid
+            This grid.
+        """
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        if (self._path is not None and self._mode == "r+"
+                and os.path.samefile(path, self._path)):
+            # Already stored there
+            self.flush()
+            self._write_header()
+            return self
+        rasters = self._rasters
+        self._path = path
+        self._mode = "r+"
+        self._rasters = {}
+        for name, data in rasters.items():
+            self.add_raster(name, data)
+        self._write_header()
+        return self
+
+    @classmethod
+    def from_disk(cls, path, mode="r"):
+        """
+        Opens a grid stored by :meth:`to_disk`.
+
+        Only the header is read; the rasters are memory-mapped, so opening
+        takes milliseconds regardless of the grid size, reads only page in
+        the parts of a raster that are touched, and processes opening the
+        same directory share the page cache.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The grid directory.
+        mode : str, optional
+            "r" for read-only maps, "r+" for shared read-write maps, or
+            "c" for copy-on-write maps. Defaults to "r". Copy-on-write
+            grids never modify the directory: rasters added to them are
+            kept in memory and deleted rasters are only dropped from the
+            grid.
+
+        Returns
+        -------
+        GeographicGrid
+            The disk-backed grid.
+        """
+        if mode not in ("r", "r+", "c"):
+            raise ValueError("mode must be 'r', 'r+' or 'c'.")
+        path = os.fspath(path)
+        with open(os.path.join(path, cls.HEADER), encoding="utf-8") as f:
+            header = json.load(f)
+
+        lowerleft, upperright = (
+            GeographicCoordinate(*map(float, corner))
+            for corner in header["area"]
+        )
+        grid = cls(
+            GeographicArea(lowerleft, upperright),
+            tuple(header["resolution"]),
+        )
+        grid._step = tuple(header["step"])
+        grid.load_cells()
+        grid._path = path
+        grid._mode = mode
+        for name in header["rasters"]:
+            grid._rasters[name] = numpy.load(
+                grid._raster_path(name), mmap_mode=mode
+            )
+        return grid
+
+    def flush(self):
+        """Flushes the memory-mapped rasters to disk."""
+        for raster in self._rasters.values():
+            if isinstance(raster, numpy.memmap):
+                raster.flush()
+
+    def _raster_path(self, name):
+        """Returns the .npy file of a raster of a disk-backed grid."""
+        if not name or os.sep in name or (os.altsep and os.altsep in name):
+            raise ValueError(f"Invalid raster name {name!r}.")
+        return os.path.join(self._path, name + ".npy")
+
+    def _check_writable(self):
+        """Raises if the disk-backed grid was opened read-only."""
+        if self._mode == "r":
+            raise ValueError("The grid was opened read-only.")
+
+    def _write_header(self):
+        """Writes the JSON header of a disk-backed grid."""
+        header = {
+            "area": [
+                list(self._area.lowerleft.to_tuple()),
+                list(self._area.upperright.to_tuple()),
+            ],
+            "resolution": list(self._resolution),
+            "step": list(self._step),
+            "rasters": list(self._rasters),
+        }
+        with open(os.path.join(self._path, self.HEADER), "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=2)
 
 
     # def set_cell(self, key, value):
@@ -252,6 +801,8 @@ class GeographicGrid(object):
     @property
     def geojson_data(self):
         """Getter decorator method for geojson_data parameter."""
+        if self._geojson_data is None and self._cells is not None:
+            self.load_geojson()
         return self._geojson_data
 
     @geojson_data.setter
@@ -278,6 +829,132 @@ class GeographicGrid(object):
         grid_feature = geojson.FeatureCollection(features=feature_collection_list_columns)
         self._geojson_data = grid_feature
 
+    def iter_features(self):
+        """
+        Generates one GeoJSON polygon Feature per cell, row by row.
+
+        Only the current feature is kept in memory. The polygon rings are
+        closed and, like the rest of the package, list (lat, lon) positions;
+        the properties hold the cell index and the raster values.
+
+        Yields
+        ------
+        geojson.Feature
+            The feature of cell (i, j).
+        """
+        for i, j, ring, values in self._iter_cells():
+            properties = {"i": i, "j": j}
+            properties.update(values)
+            yield geojson.Feature(
+                geometry=geojson.Polygon([ring]), properties=properties,
+            )
+
+    def write_geojson(self, fp, chunk_size=4096, seq=False):
+        """
+        Streams the cells to a file as GeoJSON, in constant memory.
+
+        The features are serialized straight from the edge arrays and
+        rasters, without building a geojson object tree, and written in
+        chunks of 'chunk_size' features.
+
+        Parameters
+        ----------
+        fp : str, os.PathLike or file-like
+            A path, or an open text or binary file, such as a socket's
+            makefile().
+        chunk_size : int, optional
+            The number of features per write. Defaults to 4096.
+        seq : bool, optional
+            If True, write newline-delimited GeoJSONSeq (one Feature per
+            line) instead of a single FeatureCollection. Defaults to False.
+
+        Returns
+        -------
+        int
+            The number of features written.
+        """
+        if isinstance(fp, (str, os.PathLike)):
+            with open(fp, "w", encoding="utf-8") as f:
+                return self.write_geojson(f, chunk_size, seq)
+
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) \
+            or "b" in getattr(fp, "mode", "")
+
+        def write(text):
+            fp.write(text.encode("utf-8") if binary else text)
+
+        separator = "\n" if seq else ",\n"
+        if not seq:
+            write('{"type": "FeatureCollection", "features": [\n')
+        count = 0
+        chunk = []
+        for feature in self._iter_feature_text():
+            chunk.append(feature)
+            if len(chunk) == chunk_size:
+                write(self._join_chunk(chunk, separator, seq, count))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            write(self._join_chunk(chunk, separator, seq, count))
+            count += len(chunk)
+        if not seq:
+            write("\n]}\n")
+        return count
+
+    @staticmethod
+    def _join_chunk(chunk, separator, seq, count):
+        """Joins a chunk of serialized features for writing."""
+        if seq:
+            return separator.join(chunk) + "\n"
+        return (separator if count else "") + separator.join(chunk)
+
+    def _iter_cells(self):
+        """Generates (i, j, ring, values) for every cell."""
+        lat_edges = self._lat_edges.tolist()
+        lon_edges = self._lon_edges.tolist()
+        names = list(self._rasters)
+        for i in range(self._resolution[0]):
+            ll_lat, ur_lat = lat_edges[i], lat_edges[i + 1]
+            rows = [self._rasters[name][i].tolist() for name in names]
+            for j in range(self._resolution[1]):
+                ll_lon, ur_lon = lon_edges[j], lon_edges[j + 1]
+                ring = [
+                    (ll_lat, ll_lon),
+                    (ll_lat, ur_lon),
+                    (ur_lat, ur_lon),
+                    (ur_lat, ll_lon),
+                    (ll_lat, ll_lon),
+                ]
+                values = {
+                    name: _json_value(row[j]) for name, row in zip(names, rows)
+                }
+                yield i, j, ring, values
+
+    def _iter_feature_text(self):
+        """Generates the serialized Feature of every cell."""
+        lat_text = [repr(v) for v in self._lat_edges.tolist()]
+        lon_text = [repr(v) for v in self._lon_edges.tolist()]
+        names = list(self._rasters)
+        keys = "".join(', %s: %%s' % json.dumps(name) for name in names)
+        template = (
+            '{"type": "Feature", "geometry": {"type": "Polygon", '
+            '"coordinates": [[[%s, %s], [%s, %s], [%s, %s], [%s, %s], '
+            '[%s, %s]]]}, "properties": {"i": %d, "j": %d' + keys + '}}'
+        )
+        for i in range(self._resolution[0]):
+            ll_lat, ur_lat = lat_text[i], lat_text[i + 1]
+            rows = [
+                [json.dumps(_json_value(v)) for v in self._rasters[name][i].tolist()]
+                for name in names
+            ]
+            for j in range(self._resolution[1]):
+                ll_lon, ur_lon = lon_text[j], lon_text[j + 1]
+                yield template % (
+                    (ll_lat, ll_lon, ll_lat, ur_lon, ur_lat, ur_lon,
+                     ur_lat, ll_lon, ll_lat, ll_lon, i, j)
+                    + tuple(row[j] for row in rows)
+                )
+
 
     # Methods | test
 
@@ -286,6 +963,67 @@ class GeographicGrid(object):
         pass
 
 
+def _json_value(value):
+    """Maps a raster value to JSON, with null for NaN and infinities."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def benchmark_locate(n_points=1000000, resolution=(1000, 1000), n_scan=100):
+    """
+    Benchmark Function
+
+    Compares the arithmetic :meth:`GeographicGrid.locate` on 'n_points'
+    random points with a brute-force scan over all cells, which is timed on
+    'n_scan' points and extrapolated.
+    """
+    area = GeographicArea(
+        GeographicCoordinate(52.0, 4.0), GeographicCoordinate(53.0, 5.0)
+    )
+    grid = GeographicGrid(area, resolution)
+    lat = numpy.random.uniform(51.9, 53.1, n_points)
+    lon = numpy.random.uniform(3.9, 5.1, n_points)
+
+    start = time.perf_counter()
+    i, j, inside = grid.locate(lat, lon)
+    located = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scan = grid._locate_scan(lat[:n_scan], lon[:n_scan])
+    scanned = (time.perf_counter() - start) * n_points / n_scan
+
+    assert numpy.array_equal(scan[0], i[:n_scan])
+    assert numpy.array_equal(scan[1], j[:n_scan])
+    print(f"scan (extrapolated) {scanned:10.2f} s")
+    print(f"locate              {located:10.2f} s  ({inside.mean():.0%} inside)")
+
+
+def benchmark(resolution=(1000, 1000)):
+    """
+    Benchmark Function
+
+    Compares streaming the grid to GeoJSON with serializing the full
+    in-memory FeatureCollection of its features.
+    """
+    area = GeographicArea(
+        GeographicCoordinate(52.0, 4.0), GeographicCoordinate(53.0, 5.0)
+    )
+    grid = GeographicGrid(area, resolution)
+    grid.add_raster("value", numpy.random.random(resolution))
+
+    start = time.perf_counter()
+    grid.write_geojson(io.StringIO())
+    streamed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    json.dumps(geojson.FeatureCollection(list(grid.iter_features())))
+    dumped = time.perf_counter() - start
+
+    print(f"json.dumps     {dumped:8.2f} s")
+    print(f"write_geojson  {streamed:8.2f} s")
+
+
 def test():
     """Test Function"""
     pass
@@ -296,3 +1034,5 @@ if __name__ == '__main__':
     import doctest
     doctest.testmod()
     test()
+    benchmark()
+    benchmark_locate()
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Grid Pyramid Class
+===========================
+
+Multi-resolution overviews of GeographicGrid rasters.
+
+Examples:
+    >>> grid = GeographicGrid(
+    ...     GeographicArea(
+    ...         GeographicCoordinate(52.0, 4.0),
+    ...         GeographicCoordinate(52.4, 4.4),
+    ...     ),
+    ...     (40, 40),
+    ... )
+    >>> _ = grid.add_raster("temperature", numpy.full((40, 40), 10.0))
+    >>> pyramid = GridPyramid(grid, "temperature", method="mean")
+    >>> len(pyramid)
+    7
+    >>> area = GeographicArea(
+    ...     GeographicCoordinate(52.0, 4.0),
+    ...     GeographicCoordinate(52.2, 4.2),
+    ... )
+    >>> level, overview = pyramid.query((0.04, 0.04), area=area)
+    >>> level, float(overview.raster("temperature")[0, 0])
+    (2, 10.0)
+    >>> grid.raster("temperature")[0:20, 0:20] = 20.0
+    >>> pyramid.update(0, 20, 0, 20)
+    >>> float(pyramid[2][0, 0]), float(pyramid[-1][0, 0])
+    (20.0, 12.5)
+
+Todo:
+
+"""
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import os
+
+# Import | Libraries
+import numpy
+
+# Import | Local Modules
+from bearing.geospatial.coordinate import GeographicCoordinate
+from bearing.geospatial.area import GeographicArea
+from bearing.geospatial.grid import GeographicGrid
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class GridPyramid(object):
+    """
+    A class used to represent the overview pyramid of a grid raster
+
+    Level 0 is the base raster itself; every next level halves the
+    resolution along both axes, each cell aggregating a 2x2 block of the
+    level below (blocks on the upper edges may be partial). Levels are built
+    down to a single cell, or to 'levels' overviews.
+
+    Overviews are float64 rasters in which NaN marks cells without data.
+    The "mean" of a cell is weighted by the number of valid base cells
+    below it, so it equals the mean of those base cells. "min" and "max"
+    are built from the level below, each level in one vectorized pass.
+    "mode" is taken over the base cells of the block (the smallest value
+    wins ties); the base is read in bands of rows within 'BAND_BYTES', and
+    the values of a band are tallied per cell, so memory scales with the
+    distinct values per cell rather than with the base raster.
+
+    When the base grid is disk-backed and writable (see
+    :meth:`GeographicGrid.to_disk`) the overviews are stored next to it as
+    memory-mapped .npy files and can be reopened with 'reopen=True'. Grids
+    opened read-only or copy-on-write never have their directory modified:
+    their overviews are built in memory, or reopened with the grid's mode.
+
+    Attributes
+    ----------
+    grid : GeographicGrid
+        the base grid
+    name : str
+        the name of the base raster
+    method : str
+        "mean", "min", "max" or "mode"
+    levels : list
+        the base raster followed by the overview rasters
+    """
+
+    #: Supported aggregation methods
+    METHODS = ("mean", "min", "max", "mode")
+
+    #: Memory budget for the base rows read at once by "mode" (64 MiB)
+    BAND_BYTES = 64 * 1024 * 1024
+
+    # Magic Methods
+
+    def __init__(self, grid, name, method="mean", levels=None, reopen=False):
+        """Constructor of the object, building (or reopening) the overviews."""
+        if method not in self.METHODS:
+            raise ValueError(
+                "method must be one of %s." % ", ".join(self.METHODS)
+            )
+        self._grid = grid
+        self._name = name
+        self._method = method
+        self._levels = [grid.raster(name)]
+        self._counts = [None]
+
+        shape = tuple(grid.resolution)
+        while max(shape) > 1 and (levels is None or len(self._levels) <= levels):
+            shape = (-(-shape[0] // 2), -(-shape[1] // 2))
+            k = len(self._levels)
+            self._levels.append(self._allocate(k, shape, numpy.float64, reopen))
+            if method == "mean":
+                self._counts.append(self._allocate(k, shape, numpy.int64, reopen, "count"))
+            if not reopen:
+                self._build(k, 0, shape[0], 0, shape[1])
+        self.flush()
+
+    def __len__(self):
+        """Returns the number of levels, including the base raster."""
+        return len(self._levels)
+
+    def __getitem__(self, k):
+        """Returns the raster of level k."""
+        return self._levels[k]
+
+    # Methods | parameters
+
+    @property
+    def grid(self):
+        """Getter decorator method for grid parameter."""
+        return self._grid
+
+    @property
+    def name(self):
+        """Getter decorator method for name parameter."""
+        return self._name
+
+    @property
+    def method(self):
+        """Getter decorator method for method parameter."""
+        return self._method
+
+    @property
+    def levels(self):
+        """Getter decorator method for levels parameter."""
+        return self._levels
+
+    # Methods | queries
+
+    def step(self, k):
+        """Returns the (lat, lon) cell size of level k, in degrees."""
+        return (self._grid.step[0] * 2 ** k, self._grid.step[1] * 2 ** k)
+
+    def level_for(self, step):
+        """
+        Returns the coarsest level whose cells are at most 'step' in size.
+
+        Parameters
+        ----------
+        step : tuple
+            The requested (lat, lon) cell size, in degrees.
+
+        Returns
+        -------
+        int
+            The level; 0 if even the base grid is coarser than requested.
+        """
+        base = self._grid.step
+        factor = min(step[0] / base[0], step[1] / base[1])
+        if factor < 2:
+            return 0
+        # Guard against rounding just below a power of two
+        k = int(numpy.floor(numpy.log2(factor) + 1e-9))
+        return min(k, len(self._levels) - 1)
+
+    def level_grid(self, k, area=None):
+        """
+        Returns level k as a GeographicGrid, optionally cropped to the cells
+        intersecting an area.
+
+        Parameters
+        ----------
+        k : int
+            The level.
+        area : GeographicArea, optional
+            The query area; defaults to the whole grid.
+
+        Returns
+        -------
+        GeographicGrid
+            An in-memory grid holding the raster under the pyramid name.
+        """
+        raster = self._levels[k]
+        lowerleft = self._grid.area.lowerleft
+        step = self.step(k)
+        i0, i1, j0, j1 = 0, raster.shape[0], 0, raster.shape[1]
+        if area is not None:
+            i0, i1, j0, j1 = self._window(raster.shape, step, area)
+
+        grid = GeographicGrid(
+            GeographicArea(
+                GeographicCoordinate(lowerleft.lat + i0 * step[0], lowerleft.lon + j0 * step[1]),
+                GeographicCoordinate(lowerleft.lat + i1 * step[0], lowerleft.lon + j1 * step[1]),
+            ),
+            (i1 - i0, j1 - j0),
+        )
+        grid.add_raster(self._name, numpy.array(raster[i0:i1, j0:j1]))
+        return grid
+
+    def query(self, step, area=None):
+        """
+        Serves a request from the coarsest level that satisfies 'step'.
+
+        Parameters
+        ----------
+        step : tuple
+            The requested (lat, lon) cell size, in degrees.
+        area : GeographicArea, optional
+            The query area; defaults to the whole grid.
+
+        Returns
+        -------
+        level : int
+            The level used.
+        grid : GeographicGrid
+            See :meth:`level_grid`.
+        """
+        k = self.level_for(step)
+        return k, self.level_grid(k, area)
+
+    # Methods | updates
+
+    def update(self, i0, i1, j0, j1):
+        """
+        Refreshes the overviews after the base cells [i0:i1, j0:j1] changed.
+
+        Only the blocks above the changed window are recomputed, level by
+        level.
+        """
+        for k in range(1, len(self._levels)):
+            shape = self._levels[k].shape
+            i0, i1 = i0 // 2, min(-(-i1 // 2), shape[0])
+            j0, j1 = j0 // 2, min(-(-j1 // 2), shape[1])
+            self._build(k, i0, i1, j0, j1)
+        self.flush()
+
+    def flush(self):
+        """Flushes memory-mapped overviews to disk."""
+        for raster in self._levels[1:] + self._counts[1:]:
+            if isinstance(raster, numpy.memmap):
+                raster.flush()
+
+    # Methods | helpers
+
+    def _allocate(self, k, shape, dtype, reopen, kind="level"):
+        """Allocates (or reopens) the raster of level k."""
+        if self._grid.path is None:
+            if reopen:
+                raise ValueError("Only disk-backed pyramids can be reopened.")
+            return numpy.empty(shape, dtype=dtype)
+        path = os.path.join(
+            self._grid.path,
+            "%s.%s.%s%d.npy" % (self._name, self._method, kind, k),
+        )
+        if reopen:
+            return numpy.load(path, mmap_mode=self._grid.mode)
+        if self._grid.mode != "r+":
+            # Only read-write grids may write to their directory
+            return numpy.empty(shape, dtype=dtype)
+        return numpy.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    def _build(self, k, i0, i1, j0, j1):
+        """Computes the cells [i0:i1, j0:j1] of level k."""
+        if i0 >= i1 or j0 >= j1:
+            return
+        if self._method == "mode":
+            self._build_mode(k, i0, i1, j0, j1)
+            return
+
+        source = self._levels[k - 1][2 * i0:2 * i1, 2 * j0:2 * j1]
+        if self._method == "mean":
+            if k == 1:
+                counts = ~numpy.isnan(numpy.asarray(source, dtype=numpy.float64))
+            else:
+                counts = self._counts[k - 1][2 * i0:2 * i1, 2 * j0:2 * j1]
+            total = _blocks(counts.astype(numpy.float64), 2, 0.0).sum(axis=(1, 3))
+            weighted = numpy.nan_to_num(numpy.asarray(source, dtype=numpy.float64)) * counts
+            weighted = _blocks(weighted, 2, 0.0).sum(axis=(1, 3))
+            with numpy.errstate(invalid="ignore"):
+                self._levels[k][i0:i1, j0:j1] = weighted / total
+            self._counts[k][i0:i1, j0:j1] = total
+        elif self._method == "min":
+            self._levels[k][i0:i1, j0:j1] = numpy.fmin.reduce(
+                _blocks(source, 2, numpy.nan), axis=(1, 3)
+            )
+        else:
+            self._levels[k][i0:i1, j0:j1] = numpy.fmax.reduce(
+                _blocks(source, 2, numpy.nan), axis=(1, 3)
+            )
+
+    def _build_mode(self, k, i0, i1, j0, j1):
+        """
+        Computes the cells [i0:i1, j0:j1] of level k of a "mode" pyramid
+        from bands of base rows.
+        """
+        f = 2 ** k
+        base = self._levels[0]
+        c0, c1 = j0 * f, min(j1 * f, base.shape[1])
+        width = j1 - j0
+        chunk = max(1, self.BAND_BYTES // (8 * max(c1 - c0, 1)))
+        columns = numpy.arange(c0, c1) // f - j0
+        band = max(1, chunk // f)
+
+        for b0 in range(i0, i1, band):
+            b1 = min(b0 + band, i1)
+            tally = (
+                numpy.empty(0, dtype=numpy.intp),
+                numpy.empty(0),
+                numpy.empty(0, dtype=numpy.int64),
+            )
+            r_stop = min(b1 * f, base.shape[0])
+            for r0 in range(b0 * f, r_stop, chunk):
+                r1 = min(r0 + chunk, r_stop)
+                data = numpy.asarray(base[r0:r1, c0:c1], dtype=numpy.float64)
+                cells = (numpy.arange(r0, r1) // f - b0)[:, numpy.newaxis] * width + columns
+                valid = ~numpy.isnan(data)
+                found = _tally(cells[valid], data[valid])
+                if tally[0].shape[0]:
+                    # Blocks taller than the budget: merge with the rows so far
+                    found = _tally(*(
+                        numpy.concatenate((old, new)) for old, new in zip(tally, found)
+                    ))
+                tally = found
+            mode = _tally_mode(tally, (b1 - b0) * width)
+            self._levels[k][b0:b1, j0:j1] = mode.reshape(b1 - b0, width)
+
+    def _window(self, shape, step, area):
+        """Returns the half-open cell window of a level intersecting an area."""
+        lowerleft = self._grid.area.lowerleft
+        i0 = int(numpy.floor((area.lowerleft.lat - lowerleft.lat) / step[0]))
+        i1 = int(numpy.ceil((area.upperright.lat - lowerleft.lat) / step[0]))
+        j0 = int(numpy.floor((area.lowerleft.lon - lowerleft.lon) / step[1]))
+        j1 = int(numpy.ceil((area.upperright.lon - lowerleft.lon) / step[1]))
+        i0, i1 = max(i0, 0), min(max(i1, i0 + 1), shape[0])
+        j0, j1 = max(j0, 0), min(max(j1, j0 + 1), shape[1])
+        if i0 >= i1 or j0 >= j1:
+            raise ValueError("The area does not intersect the grid.")
+        return i0, i1, j0, j1
+
+
+def _blocks(data, f, fill_value):
+    """
+    Pads 'data' to a multiple of f with 'fill_value' and views it as
+    (rows / f, f, columns / f, f) blocks.
+    """
+    data = numpy.asarray(data, dtype=numpy.float64)
+    rows = -(-data.shape[0] // f) * f
+    cols = -(-data.shape[1] // f) * f
+    if (rows, cols) != data.shape:
+        data = numpy.pad(
+            data,
+            ((0, rows - data.shape[0]), (0, cols - data.shape[1])),
+            constant_values=fill_value,
+        )
+    return data.reshape(rows // f, f, cols // f, f)
+
+
+def _tally(cells, values, counts=None):
+    """
+    Adds up the counts (default ones) of equal (cell, value) pairs and
+    returns them sorted by cell and value.
+    """
+    if cells.shape[0] == 0:
+        return cells, values, numpy.empty(0, dtype=numpy.int64)
+    # Code the values and pack (cell, code) into one integer key
+    uniques, codes = numpy.unique(values, return_inverse=True)
+    keys = cells.astype(numpy.int64) * uniques.shape[0] + codes.ravel()
+    if int(keys.max()) < 4 * keys.shape[0]:
+        # Few distinct keys (categorical rasters): count them directly
+        totals = numpy.bincount(keys, weights=counts)
+        keys = numpy.flatnonzero(totals)
+        totals = totals[keys]
+    else:
+        keys, index = numpy.unique(keys, return_inverse=True)
+        totals = numpy.bincount(index.ravel(), weights=counts)
+    return (
+        (keys // uniques.shape[0]).astype(numpy.intp),
+        uniques[keys % uniques.shape[0]],
+        totals.astype(numpy.int64),
+    )
+
+
+def _tally_mode(tally, n_cells):
+    """
+    Returns the most frequent value of each of n_cells cells (the smallest
+    value wins ties), NaN for cells without values.
+    """
+    cells, values, counts = tally
+    mode = numpy.full(n_cells, numpy.nan)
+    if cells.shape[0] == 0:
+        return mode
+    # The tally is sorted by cell and value, so the first entry reaching
+    # the highest count of its cell holds the smallest most frequent value
+    starts = numpy.flatnonzero(numpy.r_[True, cells[1:] != cells[:-1]])
+    highest = numpy.maximum.reduceat(counts, starts)
+    runs = numpy.diff(numpy.r_[starts, cells.shape[0]])
+    best = numpy.flatnonzero(counts == numpy.repeat(highest, runs))
+    first = best[numpy.r_[True, cells[best[1:]] != cells[best[:-1]]]]
+    mode[cells[first]] = values[first]
+    return mode
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
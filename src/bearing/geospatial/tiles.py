@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Tiled Grid Class
+=========================
+
+Chunked, per-tile compressed storage of GeographicGrid rasters.
+
+Examples:
+    >>> import tempfile
+    >>> grid = GeographicGrid(
+    ...     GeographicArea(
+    ...         GeographicCoordinate(52.0, 4.0),
+    ...         GeographicCoordinate(53.0, 5.0),
+    ...     ),
+    ...     (8, 8),
+    ... )
+    >>> raster = grid.add_raster("height", numpy.arange(64.0).reshape(8, 8))
+    >>> with tempfile.TemporaryDirectory() as path:
+    ...     tiles = TiledGrid.write(grid, path, tile_shape=(4, 4))
+    ...     window = tiles.read_area(GeographicArea(
+    ...         GeographicCoordinate(52.25, 4.25),
+    ...         GeographicCoordinate(52.5, 4.5),
+    ...     ))
+    >>> window.resolution
+    (2, 2)
+    >>> window.raster("height").tolist()
+    [[18.0, 19.0], [26.0, 27.0]]
+
+Todo:
+
+"""
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Standard Library
+import functools
+import json
+import lzma
+import os
+import zlib
+
+# Import | Libraries
+import numpy
+
+# Import | Local Modules
+from bearing.geospatial.coordinate import GeographicCoordinate
+from bearing.geospatial.area import GeographicArea
+from bearing.geospatial.grid import GeographicGrid
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class TiledGrid(object):
+    """
+    A class used to represent a tiled, compressed Geographic Grid on disk
+
+    The rasters of the grid are split into fixed-size tiles that are
+    compressed independently, in the spirit of Zarr or Cloud-Optimized
+    GeoTIFF. A grid directory holds:
+
+    - tiles.json, a header with the area, resolution, step, tile shape,
+      compression and the dtype of every raster;
+    - <raster>.tiles, the compressed tiles concatenated row by row;
+    - <raster>.index.npy, the (offset, length) of every tile in that file.
+
+    Reading a window only decompresses the tiles it intersects, so its cost
+    is proportional to the window rather than the grid.
+
+    Attributes
+    ----------
+    grid : GeographicGrid
+        the geometry of the grid, without rasters
+    tile_shape : tuple
+        the (rows, columns) of cells per tile
+    compression : str
+        "zlib", "lzma" or "none"
+    rasters : list
+        the names of the stored rasters
+    """
+
+    #: Name of the JSON header in a tiled grid directory
+    HEADER = "tiles.json"
+
+    #: Supported compressors, as (compress, decompress) functions
+    CODECS = {
+        "zlib": (zlib.compress, zlib.decompress),
+        "lzma": (lzma.compress, lzma.decompress),
+        "none": (bytes, bytes),
+    }
+
+    # Magic Methods
+
+    def __init__(self, path):
+        """Constructor of the object, opening a tiled grid directory."""
+        self._path = os.fspath(path)
+        with open(os.path.join(self._path, self.HEADER), encoding="utf-8") as f:
+            header = json.load(f)
+
+        lowerleft, upperright = (
+            GeographicCoordinate(*map(float, corner))
+            for corner in header["area"]
+        )
+        self._grid = GeographicGrid(
+            GeographicArea(lowerleft, upperright),
+            tuple(header["resolution"]),
+        )
+        self._grid.step = tuple(header["step"])
+        self._grid.load_cells()
+        self._tile_shape = tuple(header["tile_shape"])
+        self._compression = header["compression"]
+        self._decompress = self.CODECS[self._compression][1]
+        self._dtypes = {
+            name: numpy.dtype(dtype) for name, dtype in header["rasters"].items()
+        }
+        self._index = {
+            name: numpy.load(self._file(name, ".index.npy"))
+            for name in self._dtypes
+        }
+
+    def __repr__(self):
+        """Special method used to represent a class's objects as a string."""
+        return "TiledGrid(%r)" % self._path
+
+    # Methods | parameters
+
+    @property
+    def grid(self):
+        """Getter decorator method for grid parameter."""
+        return self._grid
+
+    @property
+    def tile_shape(self):
+        """Getter decorator method for tile_shape parameter."""
+        return self._tile_shape
+
+    @property
+    def compression(self):
+        """Getter decorator method for compression parameter."""
+        return self._compression
+
+    @property
+    def rasters(self):
+        """Getter decorator method for rasters parameter."""
+        return list(self._dtypes)
+
+    # Class Methods
+
+    @classmethod
+    def write(cls, grid, path, tile_shape=(256, 256), compression="zlib", level=None):
+        """
+        Stores the rasters of a grid as compressed tiles.
+
+        The rasters are read one tile at a time, so a memory-mapped grid
+        (see :meth:`GeographicGrid.to_disk`) can be tiled without loading it.
+
+        Parameters
+        ----------
+        grid : GeographicGrid
+            The grid to store.
+        path : str or os.PathLike
+            The directory; it is created if needed.
+        tile_shape : tuple, optional
+            The (rows, columns) of cells per tile. Defaults to (256, 256).
+        compression : str, optional
+            "zlib", "lzma" or "none". Defaults to "zlib".
+        level : int, optional
+            The zlib level or lzma preset; defaults to the codec default.
+
+        Returns
+        -------
+        TiledGrid
+            The opened tiled grid.
+        """
+        if compression not in cls.CODECS:
+            raise ValueError(
+                "compression must be one of %s." % ", ".join(cls.CODECS)
+            )
+        compress = cls.CODECS[compression][0]
+        if level is not None and compression == "zlib":
+            compress = functools.partial(zlib.compress, level=level)
+        elif level is not None and compression == "lzma":
+            compress = functools.partial(lzma.compress, preset=level)
+
+        path = os.fspath(path)
+        for name in grid.rasters:
+            _raster_file(path, name, ".tiles")
+        os.makedirs(path, exist_ok=True)
+        rows, cols = tile_shape
+        n_i = -(-grid.resolution[0] // rows)
+        n_j = -(-grid.resolution[1] // cols)
+
+        for name, raster in grid.rasters.items():
+            index = numpy.zeros((n_i, n_j, 2), dtype=numpy.int64)
+            with open(_raster_file(path, name, ".tiles"), "wb") as f:
+                offset = 0
+                for ti in range(n_i):
+                    for tj in range(n_j):
+                        tile = numpy.ascontiguousarray(
+                            raster[ti * rows:(ti + 1) * rows, tj * cols:(tj + 1) * cols]
+                        )
+                        data = compress(tile.tobytes())
+                        f.write(data)
+                        index[ti, tj] = (offset, len(data))
+                        offset += len(data)
+            numpy.save(_raster_file(path, name, ".index.npy"), index)
+
+        header = {
+            "area": [
+                list(grid.area.lowerleft.to_tuple()),
+                list(grid.area.upperright.to_tuple()),
+            ],
+            "resolution": list(grid.resolution),
+            "step": list(grid.step),
+            "tile_shape": [rows, cols],
+            "compression": compression,
+            "rasters": {
+                name: raster.dtype.str for name, raster in grid.rasters.items()
+            },
+        }
+        with open(os.path.join(path, cls.HEADER), "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=2)
+        return cls(path)
+
+    # Methods | reading
+
+    def read_tile(self, name, ti, tj):
+        """
+        Reads and decompresses a single tile.
+
+        Parameters
+        ----------
+        name : str
+            The raster name.
+        ti, tj : int
+            The tile index.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tile values; tiles on the upper edges of the grid may be
+            smaller than 'tile_shape'.
+        """
+        offset, length = self._index[name][ti, tj]
+        with open(self._file(name, ".tiles"), "rb") as f:
+            return self._decode(name, f, ti, tj, offset, length)
+
+    def read_window(self, name, i0, i1, j0, j1):
+        """
+        Reads the cells [i0:i1, j0:j1] of a raster.
+
+        Only the tiles intersecting the window are read and decompressed.
+
+        Parameters
+        ----------
+        name : str
+            The raster name.
+        i0, i1, j0, j1 : int
+            The half-open window of cell indices.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (i1 - i0, j1 - j0) window.
+        """
+        n_lat, n_lon = self._grid.resolution
+        if not (0 <= i0 < i1 <= n_lat and 0 <= j0 < j1 <= n_lon):
+            raise IndexError("Window out of range.")
+        rows, cols = self._tile_shape
+        out = numpy.empty((i1 - i0, j1 - j0), dtype=self._dtypes[name])
+        index = self._index[name]
+        with open(self._file(name, ".tiles"), "rb") as f:
+            for ti in range(i0 // rows, (i1 - 1) // rows + 1):
+                for tj in range(j0 // cols, (j1 - 1) // cols + 1):
+                    offset, length = index[ti, tj]
+                    tile = self._decode(name, f, ti, tj, offset, length)
+                    # Intersection of the tile and the window, in cells
+                    a0 = max(i0, ti * rows)
+                    a1 = min(i1, (ti + 1) * rows)
+                    b0 = max(j0, tj * cols)
+                    b1 = min(j1, (tj + 1) * cols)
+                    out[a0 - i0:a1 - i0, b0 - j0:b1 - j0] = tile[
+                        a0 - ti * rows:a1 - ti * rows,
+                        b0 - tj * cols:b1 - tj * cols,
+                    ]
+        return out
+
+    def read_area(self, area, names=None):
+        """
+        Reads the cells intersecting a geographic area as a new grid.
+
+        Parameters
+        ----------
+        area : GeographicArea
+            The query area.
+        names : list, optional
+            The rasters to read; defaults to all rasters.
+
+        Returns
+        -------
+        GeographicGrid
+            An in-memory grid of the intersecting cells, with their rasters.
+
+        Raises
+        ------
+        ValueError
+            If the area does not intersect the grid.
+        """
+        i0, i1, j0, j1 = self.window(area)
+        grid = self._grid
+        window = GeographicGrid(
+            GeographicArea(
+                GeographicCoordinate(
+                    float(grid.lat_edges[i0]), float(grid.lon_edges[j0])
+                ),
+                GeographicCoordinate(
+                    float(grid.lat_edges[i1]), float(grid.lon_edges[j1])
+                ),
+            ),
+            (i1 - i0, j1 - j0),
+        )
+        for name in self.rasters if names is None else names:
+            window.add_raster(name, self.read_window(name, i0, i1, j0, j1))
+        return window
+
+    def window(self, area):
+        """
+        Returns the half-open (i0, i1, j0, j1) cell window intersecting an
+        area. The upper bounds of the area are exclusive: an area ending on
+        a cell edge does not include the cells beyond it.
+        """
+        grid = self._grid
+        lat_edges = grid.lat_edges
+        lon_edges = grid.lon_edges
+        ll = area.lowerleft
+        ur = area.upperright
+        if (ur.lat < lat_edges[0] or ll.lat > lat_edges[-1]
+                or ur.lon < lon_edges[0] or ll.lon > lon_edges[-1]):
+            raise ValueError("The area does not intersect the grid.")
+        return (
+            _edge_window(lat_edges, ll.lat, ur.lat)
+            + _edge_window(lon_edges, ll.lon, ur.lon)
+        )
+
+    # Methods | helpers
+
+    def _file(self, name, suffix):
+        """Returns a file of a raster in the grid directory."""
+        return _raster_file(self._path, name, suffix)
+
+    def _decode(self, name, f, ti, tj, offset, length):
+        """Reads a compressed tile from an open file and reshapes it."""
+        rows, cols = self._tile_shape
+        shape = (
+            min(rows, self._grid.resolution[0] - ti * rows),
+            min(cols, self._grid.resolution[1] - tj * cols),
+        )
+        f.seek(int(offset))
+        data = self._decompress(f.read(int(length)))
+        return numpy.frombuffer(data, dtype=self._dtypes[name]).reshape(shape)
+
+
+def _edge_window(edges, lower, upper):
+    """
+    Returns the half-open (start, stop) cells between 'edges' covering
+    [lower, upper), at least one cell.
+    """
+    n = len(edges) - 1
+    # The cell holding 'lower', and the cells starting below 'upper'
+    start = int(numpy.searchsorted(edges, lower, side="right")) - 1
+    start = min(max(start, 0), n - 1)
+    stop = int(numpy.searchsorted(edges, upper, side="left"))
+    return start, min(max(stop, start + 1), n)
+
+
+def _raster_file(path, name, suffix):
+    """Returns a file of a raster in a tiled grid directory."""
+    if not name or os.sep in name or (os.altsep and os.altsep in name):
+        raise ValueError(f"Invalid raster name {name!r}.")
+    return os.path.join(path, name + suffix)
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
@@ -72,6 +72,32 @@ class FilterGaussian:
         return g/g.sum()
 
 
+    @staticmethod
+    def gauss1D(sigma, truncate=4.0):
+        """
+        1D gaussian mask of radius int(truncate * sigma + 0.5), normalized
+        to sum to one. The nD gaussian is separable: it is the outer
+        product of 1D masks, so it can be applied one axis at a time.
+        """
+        radius = int(truncate * sigma + 0.5)
+        if sigma <= 0 or radius == 0:
+            return numpy.ones(1)
+        x = numpy.arange(-radius, radius + 1, dtype=numpy.float64)
+        h = numpy.exp(-(x*x) / (2.*sigma*sigma))
+        return h / h.sum()
+
+
+    @staticmethod
+    def gauss3D(sigma, truncate=4.0):
+        """
+        3D gaussian mask, the outer product of three gauss1D masks. 'sigma'
+        is a scalar or one value per axis.
+        """
+        sigma = numpy.broadcast_to(sigma, (3,))
+        x, y, z = (FilterGaussian.gauss1D(s, truncate) for s in sigma)
+        return x[:, None, None] * y[None, :, None] * z[None, None, :]
+
+
     # Methods | test
 
     def test_something(self):
@@ -28,11 +28,17 @@ Links:
 # Import
 # =============================================================================
 
-# Import | Standard Libraryimport math
+# Import | Standard Library
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import math
+import os
 
 # Import | Libraries
 import numpy
-# from scipy.interpolate import Rbf
+from scipy.interpolate import Rbf
+from scipy.linalg import lu_factor, lu_solve
+from scipy.spatial import cKDTree
 
 # Import | Local Modules
 
@@ -41,44 +47,81 @@ class InterpolateIWD:
     """
     """
 
+    #: Default memory budget for the chunked evaluators (512 MiB)
+    MAX_BYTES = 512 * 1024 * 1024
+
     # Static Methods
 
     @staticmethod
-    def simple_idw(x, y, z, xi, yi):
-        """ """
-        dist = InterpolateIWD.distance_matrix(x,y, xi,yi)
+    def simple_idw(x, y, z, xi, yi, n_jobs=1, executor=None):
+        """
+        Inverse distance weighting over all observations.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The (N,) observation coordinates and values.
+        xi, yi : array-like
+            The (M,) target coordinates.
+        n_jobs : int, optional
+            The number of workers to split the targets over; -1 uses all
+            cores. Defaults to 1 (serial).
+        executor : str or concurrent.futures.Executor, optional
+            "thread" (the default when n_jobs > 1), "process", or an
+            existing executor. See :meth:`_parallel`.
+
+        """
+        if n_jobs == 1 and executor is None:
+            return InterpolateIWD._idw_block(x, y, z, xi, yi)
+        return InterpolateIWD._parallel(
+            "idw", x, y, z, xi, yi, n_jobs, executor
+        )
 
-        # In IDW, weights are 1 / distance
-        weights = 1.0 / dist
 
-        # Make weights sum to one
-        weights /= weights.sum(axis=0)
+    @staticmethod
+    def linear_rbf(x, y, z, xi, yi, n_jobs=1, executor=None):
+        """
+        Linear radial basis function interpolation.
 
-        # Multiply the weights for each interpolated point by all observed Z-values
-        zi = numpy.dot(weights.T, z)
-        return zi
+        The RBF system is solved once; the evaluation at the targets can be
+        split over workers. See :meth:`simple_idw` for the parameters.
 
+        """
+        weights = InterpolateIWD.rbf_weights(x, y, z)
+        if n_jobs == 1 and executor is None:
+            return InterpolateIWD._rbf_block(x, y, weights, xi, yi)
+        return InterpolateIWD._parallel(
+            "rbf", x, y, weights, xi, yi, n_jobs, executor
+        )
 
     @staticmethod
-    def linear_rbf(x, y, z, xi, yi):
-        """ """
-        dist = InterpolateIWD.distance_matrix(x,y, xi,yi)
+    def rbf_weights(x, y, z):
+        """Solves the linear RBF weights of the observations."""
 
         # Mutual pariwise distances between observations
         internal_dist = InterpolateIWD.distance_matrix(x,y, x,y)
 
         # Now solve for the weights such that mistfit at the observations is minimized
         weights = numpy.linalg.solve(internal_dist, z)
-
-        # Multiply the weights for each interpolated point by the distances
-        zi =  numpy.dot(dist.T, weights)
-        return zi
+        return weights
 
     @staticmethod
-    def scipy_idw(x, y, z, xi, yi):
-        """ """
+    def scipy_idw(x, y, z, xi, yi, n_jobs=1, executor=None):
+        """
+        Linear radial basis function interpolation through scipy's Rbf.
+
+        In parallel mode the Rbf is fitted once and its nodes are evaluated
+        with the shared linear RBF kernel, so results match the serial path
+        up to floating point rounding. See :meth:`simple_idw` for the
+        parameters.
+
+        """
         interp = Rbf(x, y, z, function='linear')
-        return interp(xi, yi)
+        if n_jobs == 1 and executor is None:
+            return interp(xi, yi)
+        return InterpolateIWD._parallel(
+            "rbf", x, y, interp.nodes, xi, yi, n_jobs, executor
+        )
 
     @staticmethod
     def distance_matrix(x0, y0, x1, y1):
@@ -94,6 +137,333 @@ class InterpolateIWD:
 
         return numpy.hypot(d0, d1)
 
+    @staticmethod
+    def knn_idw(x, y, z, xi, yi, k=8, power=2.0, radius=None):
+        """
+        Inverse distance weighting over the k nearest observations.
+
+        Convenience wrapper that builds a :class:`NearestIDWModel` for a
+        single query. Build the model once and call it repeatedly when the
+        observation locations do not change.
+
+        """
+        model = NearestIDWModel(x, y, z, k=k, power=power, radius=radius)
+        return model(xi, yi)
+
+    # Static Methods | Chunked
+
+    @staticmethod
+    def iter_simple_idw(x, y, z, xi, yi, max_bytes=None):
+        """
+        Evaluates :meth:`simple_idw` block by block over the targets.
+
+        Only one block of the dense distance and weight matrices exists at
+        a time; the block size is derived from 'max_bytes'. Every block is
+        computed with the same kernel as :meth:`simple_idw`, so the
+        concatenated results are bit-for-bit equal to it.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The (N,) observation coordinates and values.
+        xi, yi : array-like
+            The (M,) target coordinates.
+        max_bytes : int, optional
+            The memory budget for the temporaries of one block. Defaults to
+            :attr:`MAX_BYTES`.
+
+        Yields
+        ------
+        block : slice
+            The targets covered by this block.
+        zi : numpy.ndarray
+            The interpolated values of those targets.
+
+        """
+        xi = numpy.asarray(xi)
+        yi = numpy.asarray(yi)
+        for block in InterpolateIWD._blocks(len(x), xi.shape[0], max_bytes):
+            yield block, InterpolateIWD._idw_block(
+                x, y, z, xi[block], yi[block]
+            )
+
+    @staticmethod
+    def iter_linear_rbf(x, y, z, xi, yi, max_bytes=None):
+        """
+        Evaluates :meth:`linear_rbf` block by block over the targets.
+
+        The RBF weights are solved once; afterwards only one block of the
+        dense distance matrix exists at a time. The concatenated results
+        are bit-for-bit equal to :meth:`linear_rbf`.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The (N,) observation coordinates and values.
+        xi, yi : array-like
+            The (M,) target coordinates.
+        max_bytes : int, optional
+            The memory budget for the temporaries of one block. Defaults to
+            :attr:`MAX_BYTES`.
+
+        Yields
+        ------
+        block : slice
+            The targets covered by this block.
+        zi : numpy.ndarray
+            The interpolated values of those targets.
+
+        """
+        xi = numpy.asarray(xi)
+        yi = numpy.asarray(yi)
+        weights = InterpolateIWD.rbf_weights(x, y, z)
+        for block in InterpolateIWD._blocks(len(x), xi.shape[0], max_bytes):
+            yield block, InterpolateIWD._rbf_block(
+                x, y, weights, xi[block], yi[block]
+            )
+
+    @staticmethod
+    def simple_idw_chunked(x, y, z, xi, yi, max_bytes=None, out=None):
+        """
+        Memory-bounded :meth:`simple_idw`, filling a preallocated output.
+
+        Parameters
+        ----------
+        x, y, z : array-like
+            The (N,) observation coordinates and values.
+        xi, yi : array-like
+            The (M,) target coordinates.
+        max_bytes : int, optional
+            The memory budget for the temporaries of one block. Defaults to
+            :attr:`MAX_BYTES`.
+        out : numpy.ndarray or str or os.PathLike, optional
+            An (M,) output array, such as a ``numpy.memmap``, or the path of
+            a ``.npy`` file to create as a memory-mapped output. Defaults to
+            a new in-memory array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (M,) interpolated values, i.e. 'out'.
+
+        """
+        return InterpolateIWD._fill(
+            InterpolateIWD.iter_simple_idw(x, y, z, xi, yi, max_bytes),
+            len(xi),
+            out,
+        )
+
+    @staticmethod
+    def linear_rbf_chunked(x, y, z, xi, yi, max_bytes=None, out=None):
+        """
+        Memory-bounded :meth:`linear_rbf`, filling a preallocated output.
+
+        See :meth:`simple_idw_chunked` for the parameters.
+
+        """
+        return InterpolateIWD._fill(
+            InterpolateIWD.iter_linear_rbf(x, y, z, xi, yi, max_bytes),
+            len(xi),
+            out,
+        )
+
+    @staticmethod
+    def _idw_block(x, y, z, xi, yi):
+        """
+        IDW kernel shared by :meth:`simple_idw` and the chunked evaluator.
+
+        The matrices are laid out as (targets, observations) and reduced
+        along contiguous rows, so the value of each target only depends on
+        its own row. This makes the results independent of how the targets
+        are split into blocks, which a BLAS matrix-vector product does not
+        guarantee.
+
+        """
+        dist = InterpolateIWD.distance_matrix(xi,yi, x,y)
+
+        # In IDW, weights are 1 / distance
+        weights = 1.0 / dist
+
+        # Make weights sum to one
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        # Multiply the weights for each interpolated point by all observed Z-values
+        weights *= z
+        return weights.sum(axis=1)
+
+    @staticmethod
+    def _rbf_block(x, y, weights, xi, yi):
+        """
+        Linear RBF kernel shared by :meth:`linear_rbf` and the chunked
+        evaluator; see :meth:`_idw_block` for the layout. (N, K) weights
+        give (M, K) values.
+
+        """
+        dist = InterpolateIWD.distance_matrix(xi,yi, x,y)
+
+        # Sum the weights for each interpolated point times the distances.
+        # Unlike BLAS, einsum gives every row the same rounding regardless
+        # of the block size, which keeps the blocked results bit-for-bit.
+        return numpy.einsum("ij,j...->i...", dist, weights)
+
+    @staticmethod
+    def _blocks(n_obs, n_targets, max_bytes=None, min_blocks=1):
+        """Yields target slices whose dense temporaries fit 'max_bytes'."""
+        if max_bytes is None:
+            max_bytes = InterpolateIWD.MAX_BYTES
+
+        # Per target: d0, d1, dist and weights, each N float64 values
+        per_target = 4 * max(n_obs, 1) * 8
+        size = max(1, int(max_bytes // per_target))
+        size = min(size, max(1, -(-n_targets // min_blocks)))
+        for start in range(0, n_targets, size):
+            yield slice(start, min(start + size, n_targets))
+
+    # Static Methods | Parallel
+
+    @staticmethod
+    def _parallel(kind, x, y, payload, xi, yi, n_jobs=-1, executor=None,
+                  max_bytes=None):
+        """
+        Evaluates an interpolation kernel with the targets split over
+        workers.
+
+        With threads, NumPy releases the GIL inside the kernels and every
+        worker writes its block straight into the shared output array. With
+        processes, the observation, target and output arrays are placed in
+        shared memory once, so tasks only carry the block bounds; the
+        workers attach to the segments and write their blocks in place.
+        The memory budget is divided over the workers. Every block uses the
+        same kernel as the serial path, so results are bit-for-bit equal.
+
+        Parameters
+        ----------
+        kind : str
+            "idw" (payload holds the observed values) or "rbf" (payload
+            holds the solved RBF weights).
+        n_jobs : int, optional
+            The number of workers; -1 uses all cores.
+        executor : str or concurrent.futures.Executor, optional
+            "thread", "process", or an existing executor. A
+            ThreadPoolExecutor shares memory directly, any other executor
+            is assumed to run in separate processes. Defaults to "thread".
+
+        """
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        if executor is None:
+            executor = "thread"
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'.")
+
+        arrays = {
+            "x": numpy.ascontiguousarray(x, dtype=numpy.float64),
+            "y": numpy.ascontiguousarray(y, dtype=numpy.float64),
+            "payload": numpy.ascontiguousarray(payload, dtype=numpy.float64),
+            "xi": numpy.ascontiguousarray(xi, dtype=numpy.float64),
+            "yi": numpy.ascontiguousarray(yi, dtype=numpy.float64),
+        }
+        n_targets = arrays["xi"].shape[0]
+        if max_bytes is None:
+            max_bytes = InterpolateIWD.MAX_BYTES
+        blocks = list(InterpolateIWD._blocks(
+            arrays["x"].shape[0], n_targets, max_bytes // n_jobs, n_jobs
+        ))
+
+        owned = isinstance(executor, str)
+        if executor == "thread":
+            executor = ThreadPoolExecutor(n_jobs)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(n_jobs)
+        try:
+            if isinstance(executor, ThreadPoolExecutor):
+                arrays["out"] = numpy.empty(n_targets, dtype=numpy.float64)
+                futures = [
+                    executor.submit(
+                        InterpolateIWD._evaluate_block, kind, arrays, block
+                    )
+                    for block in blocks
+                ]
+                for future in futures:
+                    future.result()
+                return arrays["out"]
+            return InterpolateIWD._parallel_shared(
+                executor, kind, arrays, n_targets, blocks
+            )
+        finally:
+            if owned:
+                executor.shutdown()
+
+    @staticmethod
+    def _parallel_shared(executor, kind, arrays, n_targets, blocks):
+        """Runs the blocks in worker processes over shared memory."""
+        arrays = dict(arrays, out=numpy.empty(n_targets, dtype=numpy.float64))
+        segments = []
+        try:
+            spec = {}
+            views = {}
+            for key, array in arrays.items():
+                shm = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1)
+                )
+                segments.append(shm)
+                views[key] = numpy.ndarray(
+                    array.shape, dtype=numpy.float64, buffer=shm.buf
+                )
+                if key != "out":
+                    views[key][:] = array
+                spec[key] = (shm.name, array.shape)
+            futures = [
+                executor.submit(_evaluate_shared_block, kind, spec, block)
+                for block in blocks
+            ]
+            for future in futures:
+                future.result()
+            out = arrays["out"]
+            out[:] = views["out"]
+            views.clear()
+            return out
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
+    def _evaluate_block(kind, arrays, block):
+        """Evaluates one block of targets into arrays["out"]."""
+        kernel = InterpolateIWD._idw_block if kind == "idw" \
+            else InterpolateIWD._rbf_block
+        arrays["out"][block] = kernel(
+            arrays["x"],
+            arrays["y"],
+            arrays["payload"],
+            arrays["xi"][block],
+            arrays["yi"][block],
+        )
+
+    @staticmethod
+    def _fill(blocks, n_targets, out=None, columns=()):
+        """
+        Writes (slice, values) blocks into a (memory-mapped) output of shape
+        (n_targets,) + columns.
+        """
+        shape = (n_targets,) + tuple(columns)
+        if out is None:
+            out = numpy.empty(shape, dtype=numpy.float64)
+        elif isinstance(out, (str, os.PathLike)):
+            out = numpy.lib.format.open_memmap(
+                out, mode="w+", dtype=numpy.float64, shape=shape
+            )
+        elif out.shape != shape:
+            raise ValueError(
+                f"Output array must have shape {shape}, not {out.shape}."
+            )
+        for block, zi in blocks:
+            out[block] = zi
+        if isinstance(out, numpy.memmap):
+            out.flush()
+        return out
+
     # Methods | test
 
     def test_something(self):
@@ -101,6 +471,350 @@ class InterpolateIWD:
         pass
 
 
+def _evaluate_shared_block(kind, spec, block):
+    """
+    Worker process entry point: attaches to the shared memory segments
+    described by 'spec' and evaluates one block of targets in place.
+    """
+    segments = []
+    arrays = {}
+    try:
+        for key, (name, shape) in spec.items():
+            shm = shared_memory.SharedMemory(name=name)
+            segments.append(shm)
+            arrays[key] = numpy.ndarray(
+                shape, dtype=numpy.float64, buffer=shm.buf
+            )
+        InterpolateIWD._evaluate_block(kind, arrays, block)
+    finally:
+        # Views must be released before the segments can be closed
+        arrays.clear()
+        for shm in segments:
+            shm.close()
+
+
+class LinearRBFModel:
+    """
+    Linear radial basis function interpolation with a fitted station set.
+
+    The N x N system of mutual observation distances is LU factorized once
+    at construction, O(N^3). Solving the weights for a new set of readings
+    at the same stations then only costs two triangular solves, O(N^2),
+    and evaluating targets reuses the memory-bounded blocks of
+    :meth:`InterpolateIWD.linear_rbf_chunked`.
+
+    The distance matrix of a linear RBF is symmetric but not positive
+    definite, so an LU rather than a Cholesky factorization is used.
+
+    Parameters
+    ----------
+    x, y : array-like
+        The (N,) observation coordinates.
+    z : array-like, optional
+        The (N,) observed values. Can also be given per call, which allows
+        re-using the factorization for new readings at the same locations.
+    max_bytes : int, optional
+        The memory budget for one block of targets. Defaults to
+        :attr:`InterpolateIWD.MAX_BYTES`.
+
+    Examples
+    --------
+    >>> x, y = [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]
+    >>> model = LinearRBFModel(x, y, [1.0, 2.0, 3.0, 4.0])
+    >>> model([0.0, 0.5], [0.0, 0.5]).round(6)
+    array([1.      , 2.071068])
+    >>> z_next_hour = [2.0, 4.0, 6.0, 8.0]
+    >>> model([0.0, 0.5], [0.0, 0.5], z=z_next_hour).round(6)
+    array([2.      , 4.142136])
+
+    """
+
+    def __init__(self, x, y, z=None, max_bytes=None):
+        """Constructor of the object."""
+        self._x = numpy.asarray(x, dtype=numpy.float64).ravel()
+        self._y = numpy.asarray(y, dtype=numpy.float64).ravel()
+        if self._x.shape != self._y.shape:
+            raise ValueError("x and y must have the same length.")
+        self._size = self._x.shape[0]
+        self._max_bytes = max_bytes
+
+        # Mutual pairwise distances between observations, factorized once
+        internal_dist = InterpolateIWD.distance_matrix(
+            self._x, self._y, self._x, self._y
+        )
+        self._lu = lu_factor(internal_dist, overwrite_a=True)
+        self._weights = None if z is None else self.solve(z)
+
+    def __call__(self, xi, yi, z=None, out=None):
+        """
+        Interpolates the observed values at the query points.
+
+        Parameters
+        ----------
+        xi, yi : array-like
+            The query coordinates, of any (matching) shape.
+        z : array-like, optional
+            The (N,) observed values, or (N, K) sets of them; defaults to
+            the values given to the constructor.
+        out : numpy.ndarray, optional
+            A preallocated (M,) or (M, K) float64 output array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The interpolated values, in the shape of 'xi' (followed by K
+            for stacked readings) unless 'out' is given.
+
+        """
+        weights = self._weights if z is None else self.solve(z)
+        if weights is None:
+            raise ValueError("No observed values given.")
+        zi = self.evaluate(weights, xi, yi, out=out)
+        if out is not None:
+            return zi
+        return zi.reshape(numpy.shape(xi) + weights.shape[1:])
+
+    def solve(self, z):
+        """
+        Solves the RBF weights of observed values at the fitted stations.
+
+        Parameters
+        ----------
+        z : array-like
+            The (N,) observed values, or an (N, K) array holding K sets of
+            readings, which are solved together.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) or (N, K) RBF weights.
+
+        """
+        z = numpy.asarray(z, dtype=numpy.float64)
+        if z.shape[0] != self._size or z.ndim > 2:
+            raise ValueError(
+                "z must hold one value per observation location."
+            )
+        return lu_solve(self._lu, z)
+
+    def evaluate(self, weights, xi, yi, out=None):
+        """
+        Evaluates solved RBF weights at the query points, block by block.
+
+        Parameters
+        ----------
+        weights : numpy.ndarray
+            The (N,) or (N, K) weights returned by :meth:`solve`.
+        xi, yi : array-like
+            The query coordinates, of any (matching) shape.
+        out : numpy.ndarray, optional
+            A preallocated (M,) or (M, K) float64 output array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (M,) or (M, K) interpolated values.
+
+        """
+        weights = numpy.asarray(weights, dtype=numpy.float64)
+        xi = numpy.asarray(xi, dtype=numpy.float64).ravel()
+        yi = numpy.asarray(yi, dtype=numpy.float64).ravel()
+        blocks = (
+            (block, InterpolateIWD._rbf_block(
+                self._x, self._y, weights, xi[block], yi[block]
+            ))
+            for block in InterpolateIWD._blocks(
+                self._size, xi.shape[0], self._max_bytes
+            )
+        )
+        return InterpolateIWD._fill(blocks, xi.shape[0], out, weights.shape[1:])
+
+    def update(self, z):
+        """
+        Replaces the observed values used by default, e.g. with a new
+        hourly reading at the same stations.
+
+        Parameters
+        ----------
+        z : array-like
+            The (N,) observed values, or (N, K) sets of them.
+
+        """
+        self._weights = self.solve(z)
+
+
+class NearestIDWModel:
+    """
+    Inverse distance weighting over the k nearest observations.
+
+    The observation locations are indexed once in a KD-tree, so each query
+    point only visits its k nearest neighbours instead of every observation.
+    Memory is O(M * k) and query time roughly O(M log N) for M targets and
+    N observations, compared to the dense O(M * N) distance matrix of
+    :meth:`InterpolateIWD.simple_idw`.
+
+    Parameters
+    ----------
+    x, y : array-like
+        The (N,) observation coordinates.
+    z : array-like, optional
+        The (N,) observed values. Can also be given per call, which allows
+        re-using the index for new readings at the same locations.
+    k : int, optional
+        The number of neighbours per query point. Defaults to 8.
+    power : float, optional
+        The power of the inverse distance weights, 1 / d ** power.
+        Defaults to 2.0.
+    radius : float, optional
+        The search radius; observations further away are ignored. Query
+        points without any observation within the radius get 'fill_value'.
+        Defaults to no limit.
+    fill_value : float, optional
+        The value for query points without neighbours. Defaults to NaN.
+
+    Examples
+    --------
+    >>> x, y = [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]
+    >>> model = NearestIDWModel(x, y, [1.0, 2.0, 3.0, 4.0], k=2)
+    >>> model([0.0, 0.25], [0.0, 0.0]).round(6)
+    array([1. , 1.1])
+    >>> z_next_hour = [2.0, 4.0, 6.0, 8.0]
+    >>> model([0.0, 0.25], [0.0, 0.0], z=z_next_hour).round(6)
+    array([2. , 2.2])
+
+    """
+
+    def __init__(
+        self,
+        x,
+        y,
+        z=None,
+        k=8,
+        power=2.0,
+        radius=None,
+        fill_value=numpy.nan,
+    ):
+        """Constructor of the object."""
+        points = numpy.column_stack((
+            numpy.asarray(x, dtype=numpy.float64).ravel(),
+            numpy.asarray(y, dtype=numpy.float64).ravel(),
+        ))
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self._tree = cKDTree(points)
+        self._size = points.shape[0]
+        self._z = None if z is None else self._values(z)
+        self._k = min(int(k), self._size)
+        self._power = float(power)
+        self._radius = numpy.inf if radius is None else float(radius)
+        self._fill_value = fill_value
+
+    def __call__(self, xi, yi, z=None):
+        """
+        Interpolates the observed values at the query points.
+
+        Parameters
+        ----------
+        xi, yi : array-like
+            The query coordinates, of any (matching) shape.
+        z : array-like, optional
+            The (N,) observed values; defaults to the values given to the
+            constructor.
+
+        Returns
+        -------
+        numpy.ndarray
+            The interpolated values, in the shape of 'xi'.
+
+        """
+        index, weights = self.weights(xi, yi)
+        return self.apply(index, weights, z).reshape(numpy.shape(xi))
+
+    def weights(self, xi, yi):
+        """
+        Computes the neighbour indices and normalized weights of the query
+        points.
+
+        The result only depends on the locations, so it can be computed once
+        and combined with new readings through :meth:`apply`.
+
+        Parameters
+        ----------
+        xi, yi : array-like
+            The query coordinates, of any (matching) shape.
+
+        Returns
+        -------
+        index : numpy.ndarray
+            The (M, k) neighbour indices; missing neighbours point to index
+            0 with weight 0.
+        weights : numpy.ndarray
+            The (M, k) normalized weights. Rows without any neighbour are
+            all NaN.
+
+        """
+        targets = numpy.column_stack((
+            numpy.asarray(xi, dtype=numpy.float64).ravel(),
+            numpy.asarray(yi, dtype=numpy.float64).ravel(),
+        ))
+        dist, index = self._tree.query(
+            targets, k=self._k, distance_upper_bound=self._radius
+        )
+        dist = dist.reshape(targets.shape[0], self._k)
+        index = index.reshape(targets.shape[0], self._k)
+
+        # Missing neighbours (beyond the radius) are reported as index N
+        missing = index == self._size
+        index[missing] = 0
+
+        with numpy.errstate(divide="ignore"):
+            weights = dist ** -self._power
+        weights[missing] = 0.0
+
+        # A query point on top of an observation takes its value exactly
+        exact = dist == 0.0
+        hits = exact.any(axis=1)
+        weights[hits] = exact[hits]
+
+        with numpy.errstate(invalid="ignore"):
+            weights /= weights.sum(axis=1, keepdims=True)
+        return index, weights
+
+    def apply(self, index, weights, z=None):
+        """
+        Combines precomputed neighbour weights with observed values.
+
+        Parameters
+        ----------
+        index, weights : numpy.ndarray
+            The result of :meth:`weights`.
+        z : array-like, optional
+            The (N,) observed values; defaults to the values given to the
+            constructor.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (M,) interpolated values.
+
+        """
+        z = self._z if z is None else self._values(z)
+        if z is None:
+            raise ValueError("No observed values given.")
+        zi = numpy.einsum("ij,ij->i", weights, z[index])
+        zi[numpy.isnan(zi)] = self._fill_value
+        return zi
+
+    def _values(self, z):
+        """Validates observed values against the indexed locations."""
+        z = numpy.asarray(z, dtype=numpy.float64).ravel()
+        if z.shape[0] != self._size:
+            raise ValueError(
+                "z must hold one value per observation location."
+            )
+        return z
+
+
 def test():
     """
     Test Function
@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+
+
+# =============================================================================
+# Docstring
+# =============================================================================
+
+"""
+Provides Transformation Class
+=============================
+
+Batched 4x4 homogeneous transformations of (N, 3) coordinate arrays.
+
+Todo:
+-----
+
+Links:
+------
+
+"""
+
+# =============================================================================
+# Import
+# =============================================================================
+
+# Import | Futures
+from __future__ import annotations
+
+# Import | Standard Library
+from typing import Any
+import math
+
+# Import | Libraries
+import numpy
+
+# Import | Local Modules
+
+
+# =============================================================================
+# Classes
+# =============================================================================
+
+class Transformation(object):
+    """
+
+    Transformation Class
+    ====================
+
+    Represents a 4x4 homogeneous transformation matrix.
+
+    The Transformation class provides constructors for common affine
+    transformations (translation, rotation, scaling), composition through the
+    '@' operator, and a batched engine that applies one matrix, or a stack of
+    matrices, to an (N, 3) array of coordinates in a single matrix product.
+
+    Attributes
+    ----------
+    matrix : numpy.ndarray
+        The (4, 4) float64 transformation matrix.
+
+    Methods
+    -------
+    apply(data, w=1.0, out=None, in_place=False)
+        Applies the transformation to an (N, 3) array.
+    inverse()
+        Returns the inverse transformation.
+
+    Class Methods
+    -------------
+    from_matrix(matrix)
+        Creates a transformation from a 3x3 or 4x4 matrix.
+    translation(vector)
+        Creates a translation.
+    rotation(axis, angle)
+        Creates a rotation about an axis through the origin.
+    scale(factors)
+        Creates a (non-uniform) scaling.
+
+    Static Methods
+    --------------
+    transform_array(data, matrices, w=1.0, out=None, in_place=False)
+        Applies one or more matrices to an (N, 3) array.
+
+    Examples
+    --------
+    >>> R = Transformation.rotation((0.0, 0.0, 1.0), math.radians(90))
+    >>> R.apply([(1.0, 0.0, 0.0)]).round(3)
+    array([[0., 1., 0.]])
+
+    Note
+    ----
+    Coordinates are treated as homogeneous rows (x, y, z, w). Use w=1.0 for
+    points, which are affected by translation, and w=0.0 for directions,
+    which are not.
+
+    """
+
+    # =========================================================================
+    # Methods | Constructors
+    # =========================================================================
+
+    __slots__ = ["_matrix"]
+
+    #: Number of rows transformed per block, bounding temporary memory
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        matrix: Any = None,
+    ) -> None:
+        """
+        Constructor of the Transformation object.
+
+        Parameters
+        ----------
+        matrix : array-like, optional
+            A 3x3 linear or 4x4 homogeneous matrix. Defaults to the identity.
+
+        """
+        if matrix is None:
+            self._matrix = numpy.identity(4)
+        else:
+            self._matrix = Transformation._as_matrix(matrix)
+            if self._matrix.ndim != 2:
+                raise ValueError(
+                    "A Transformation holds a single 3x3 or 4x4 matrix."
+                )
+
+    # =========================================================================
+    # Methods | Properties
+    # =========================================================================
+
+    @property
+    def matrix(self) -> numpy.ndarray:
+        """
+        Getter decorator method for matrix parameter.
+        Gets the (4, 4) transformation matrix.
+
+        Returns
+        -------
+        matrix : numpy.ndarray
+            The homogeneous transformation matrix.
+
+        """
+        return self._matrix
+
+    # =========================================================================
+    # Methods | Magic
+    # =========================================================================
+
+    def __repr__(self) -> str:
+        """
+        Returns an unambiguous string representation of the Transformation.
+
+        Returns
+        -------
+        str
+            A string representing the Transformation object.
+        """
+        rows = ", ".join(
+            "[" + ", ".join(f"{c:.3f}" for c in row) + "]"
+            for row in self._matrix
+        )
+        return f"Transformation([{rows}])"
+
+    def __matmul__(self, other: Transformation) -> Transformation:
+        """
+        Composes this transformation with another one.
+
+        The result applies 'other' first and this transformation second,
+        following the usual matrix product convention.
+
+        Parameters
+        ----------
+        other : Transformation
+            The transformation to apply first.
+
+        Returns
+        -------
+        Transformation
+            The composed transformation.
+        """
+        if not isinstance(other, Transformation):
+            return NotImplemented
+        return Transformation(self._matrix @ other._matrix)
+
+    # =========================================================================
+    # Methods | Class
+    # =========================================================================
+
+    @classmethod
+    def from_matrix(cls, matrix: Any) -> Transformation:
+        """
+        Creates a transformation from a 3x3 linear or 4x4 homogeneous matrix.
+
+        Parameters
+        ----------
+        matrix : array-like
+            The matrix, given as nested lists or a NumPy array.
+
+        Returns
+        -------
+        Transformation
+            A new Transformation instance.
+        """
+        return cls(matrix)
+
+    @classmethod
+    def translation(cls, vector: Any) -> Transformation:
+        """
+        Creates a translation by the given vector.
+
+        Parameters
+        ----------
+        vector : Vector, tuple or list
+            The translation vector (x, y, z).
+
+        Returns
+        -------
+        Transformation
+            A new translation.
+        """
+        matrix = numpy.identity(4)
+        matrix[:3, 3] = numpy.asarray(list(vector), dtype=numpy.float64)
+        return cls(matrix)
+
+    @classmethod
+    def rotation(cls, axis: Any, angle: float) -> Transformation:
+        """
+        Creates a rotation about an axis through the origin.
+
+        Parameters
+        ----------
+        axis : Vector, tuple or list
+            The rotation axis; it does not need to be of unit length.
+        angle : float
+            The rotation angle in radians, counterclockwise when looking
+            down the axis towards the origin.
+
+        Returns
+        -------
+        Transformation
+            A new rotation.
+
+        Raises
+        ------
+        ValueError
+            If the axis has zero length.
+        """
+        axis = numpy.asarray(list(axis), dtype=numpy.float64)
+        norm = numpy.linalg.norm(axis)
+        if norm == 0:
+            raise ValueError("The rotation axis must not be zero.")
+        x, y, z = axis / norm
+        c = math.cos(angle)
+        s = math.sin(angle)
+        t = 1.0 - c
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = [
+            [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+        ]
+        return cls(matrix)
+
+    @classmethod
+    def scale(cls, factors: Any) -> Transformation:
+        """
+        Creates a scaling about the origin.
+
+        Parameters
+        ----------
+        factors : float, Vector, tuple or list
+            A uniform scale factor, or one factor per axis.
+
+        Returns
+        -------
+        Transformation
+            A new scaling.
+        """
+        if isinstance(factors, (int, float)):
+            factors = (factors, factors, factors)
+        matrix = numpy.identity(4)
+        matrix[:3, :3] = numpy.diag(
+            numpy.asarray(list(factors), dtype=numpy.float64)
+        )
+        return cls(matrix)
+
+    # =========================================================================
+    # Methods | Transformations
+    # =========================================================================
+
+    def inverse(self) -> Transformation:
+        """
+        Returns the inverse of this transformation.
+
+        Returns
+        -------
+        Transformation
+            The inverse transformation.
+
+        Raises
+        ------
+        numpy.linalg.LinAlgError
+            If the matrix is singular.
+        """
+        return Transformation(numpy.linalg.inv(self._matrix))
+
+    def apply(
+        self,
+        data: Any,
+        w: float = 1.0,
+        out: numpy.ndarray | None = None,
+        in_place: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Applies this transformation to an (N, 3) array of coordinates.
+
+        See :meth:`Transformation.transform_array` for the parameters.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) transformed coordinates.
+        """
+        return Transformation.transform_array(
+            data, self._matrix, w=w, out=out, in_place=in_place
+        )
+
+    @staticmethod
+    def transform_array(
+        data: Any,
+        matrices: Any,
+        w: float = 1.0,
+        out: numpy.ndarray | None = None,
+        in_place: bool = False,
+    ) -> numpy.ndarray:
+        """
+        Applies one matrix, or a stack of matrices, to an (N, 3) array.
+
+        The rows are processed in blocks of :attr:`CHUNK_SIZE`, so temporary
+        memory stays bounded regardless of N. Each block is transformed with
+        a single matrix product of its rows and the linear part of the
+        matrix, plus the translation. The projective division is only
+        performed when the bottom row of the matrix is not (0, 0, 0, 1).
+
+        Parameters
+        ----------
+        data : array-like
+            The (N, 3) coordinates.
+        matrices : Transformation or array-like
+            A single 3x3/4x4 matrix, or a (K, 4, 4) stack of matrices.
+        w : float, optional
+            The homogeneous coordinate of every row; 1.0 for points, 0.0 for
+            directions. Defaults to 1.0.
+        out : numpy.ndarray, optional
+            A preallocated float64 output array of shape (N, 3), or (K, N, 3)
+            for a stack of matrices.
+        in_place : bool, optional
+            If True, overwrite 'data' with the result. Only supported for a
+            single matrix and a float64 ndarray 'data'. Defaults to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            The transformed coordinates, of shape (N, 3) for a single matrix
+            or (K, N, 3) for a stack of K matrices.
+
+        Raises
+        ------
+        ValueError
+            If the shapes of 'data', 'matrices' or 'out' do not match, or if
+            'in_place' is combined with 'out' or a stack of matrices.
+        TypeError
+            If 'in_place' is requested for data that is not a float64
+            ndarray.
+
+        Examples
+        --------
+        >>> T = Transformation.translation((1.0, 0.0, 0.0))
+        >>> Transformation.transform_array([(0.0, 0.0, 0.0)], T)
+        array([[1., 0., 0.]])
+        """
+        matrices = Transformation._as_matrix(matrices)
+        single = matrices.ndim == 2
+        data, out = Transformation._as_operands(
+            data, matrices, out, in_place
+        )
+        n = data.shape[0]
+
+        linear = numpy.swapaxes(matrices[..., :3, :3], -1, -2)
+        offset = matrices[..., :3, 3] * w
+        projection = matrices[..., 3, :3]
+        scale = matrices[..., 3, 3] * w
+        projective = bool(
+            numpy.any(projection != 0) or numpy.any(scale != w)
+        )
+        if not single:
+            offset = offset[:, numpy.newaxis, :]
+
+        for start in range(0, n, Transformation.CHUNK_SIZE):
+            stop = min(start + Transformation.CHUNK_SIZE, n)
+            block = data[start:stop]
+            target = out[start:stop] if single else out[:, start:stop]
+            if projective:
+                # Evaluate the homogeneous coordinate before 'block' may be
+                # overwritten by an in-place product
+                denominator = block @ projection.T + scale
+            numpy.matmul(block, linear, out=target)
+            if w != 0:
+                target += offset
+            if projective:
+                target /= denominator.T[..., numpy.newaxis]
+        return out
+
+    # =========================================================================
+    # Methods | Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _as_operands(
+        data: Any,
+        matrices: numpy.ndarray,
+        out: numpy.ndarray | None,
+        in_place: bool,
+    ) -> tuple:
+        """
+        Validates the data and output of :meth:`transform_array` and
+        allocates the output when needed.
+
+        Returns
+        -------
+        tuple
+            The (N, 3) float64 data and the output array.
+        """
+        if in_place:
+            Transformation._check_in_place(data, matrices, out)
+            out = data
+        else:
+            data = numpy.asarray(data, dtype=numpy.float64)
+
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError("Data must be an array of shape (N, 3).")
+
+        n = data.shape[0]
+        shape = (n, 3) if matrices.ndim == 2 else (matrices.shape[0], n, 3)
+        if out is None:
+            out = numpy.empty(shape, dtype=numpy.float64)
+        elif out.shape != shape:
+            raise ValueError(
+                f"Output array must have shape {shape}, not {out.shape}."
+            )
+        return data, out
+
+    @staticmethod
+    def _check_in_place(
+        data: Any,
+        matrices: numpy.ndarray,
+        out: numpy.ndarray | None,
+    ) -> None:
+        """
+        Raises if an in-place :meth:`transform_array` is not possible.
+        """
+        if out is not None:
+            raise ValueError("Use either 'out' or 'in_place', not both.")
+        if matrices.ndim != 2:
+            raise ValueError(
+                "In-place transformation requires a single matrix."
+            )
+        if not (
+            isinstance(data, numpy.ndarray)
+            and data.dtype == numpy.float64
+        ):
+            raise TypeError(
+                "In-place transformation requires a float64 ndarray."
+            )
+
+    @staticmethod
+    def _as_matrix(matrices: Any) -> numpy.ndarray:
+        """
+        Converts a Transformation, a 3x3/4x4 matrix or a (K, 4, 4) stack
+        into a float64 array of 4x4 matrices.
+
+        Raises
+        ------
+        ValueError
+            If the input is not a 3x3, 4x4 or (K, 4, 4) matrix.
+        """
+        if isinstance(matrices, Transformation):
+            return matrices._matrix
+        matrices = numpy.asarray(matrices, dtype=numpy.float64)
+        if matrices.shape == (3, 3):
+            matrix = numpy.identity(4)
+            matrix[:3, :3] = matrices
+            return matrix
+        if matrices.shape[-2:] != (4, 4) or matrices.ndim not in (2, 3):
+            raise ValueError(
+                "Matrix must be 3x3, 4x4 or a (K, 4, 4) stack of matrices."
+            )
+        return matrices
+
+
+def test():
+    """Test Function"""
+    pass
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    test()
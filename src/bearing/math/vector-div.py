@@ -95,154 +95,6 @@ class Vector:
     # Methods | Static
     # =========================================================================
 
-    @staticmethod
-    def transform_collection(collection, X):
-        """
-        Transform a collection of vector objects.
-
-        Parameters
-        ----------
-        collection : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            The collection of vectors.
-
-        Returns
-        -------
-        None
-
-        Examples
-        --------
-        >>> from bearing.math import Rotation
-        >>> R = Rotation.from_axis_and_angle(Vector.Zaxis(), math.radians(90))
-        >>> u = Vector(1.0, 0.0, 0.0)
-        >>> vectors = [u]
-        >>> Vector.transform_collection(vectors, R)
-        >>> v = vectors[0]
-        >>> v
-        Vector(0.000, 1.000, 0.000)
-        >>> u is v
-        True
-
-        """
-        data = transform_vectors(collection, X)
-        for vector, xyz in zip(collection, data):
-            vector.x = xyz[0]
-            vector.y = xyz[1]
-            vector.z = xyz[2]
-
-    @staticmethod
-    def transformed_collection(collection, X):
-        """
-        Create a collection of transformed vectors.
-
-        Parameters
-        ----------
-        collection : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            The collection of vectors.
-
-        Returns
-        -------
-        list[:class:`~bearing.math.Vector`]
-            The transformed vectors.
-
-        Examples
-        --------
-        >>> from bearing.math import Rotation
-        >>> R = Rotation.from_axis_and_angle(Vector.Zaxis(), math.radians(90))
-        >>> u = Vector(1.0, 0.0, 0.0)
-        >>> vectors = [u]
-        >>> vectors = Vector.transformed_collection(vectors, R)
-        >>> v = vectors[0]
-        >>> v
-        Vector(0.000, 1.000, 0.000)
-        >>> u is v
-        False
-
-        """
-        vectors = [vector.copy() for vector in collection]
-        Vector.transform_collection(vectors, X)
-        return vectors
-
-
-
-
-    @staticmethod
-    def cross_vectors(left, right):
-        """
-        Compute the cross product of two lists of vectors.
-
-        Parameters
-        ----------
-        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-
-        Returns
-        -------
-        list[:class:`~bearing.math.Vector`]
-            A list of cross products.
-
-        Examples
-        --------
-        >>> Vector.cross_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
-        [Vector(0.000, 0.000, 1.000), Vector(0.000, -4.000, 0.000)]
-
-        """
-        return [Vector.cross(u, v) for u, v in zip(left, right)]
-
-    @staticmethod
-    def angles_vectors(left, right):
-        """
-        Compute both angles between corresponding pairs of two lists of vectors.
-
-        Parameters
-        ----------
-        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-
-        Returns
-        -------
-        list[float]
-            A list of angle pairs.
-
-        Examples
-        --------
-        >>> Vector.angles_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
-        [(1.5707963267948966, 4.71238898038469), (1.5707963267948966, 4.71238898038469)]
-
-        """
-        return [angles_vectors(u, v) for u, v in zip(left, right)]
-
-    @staticmethod
-    def angle_vectors(left, right):
-        """
-        Compute the smallest angle between corresponding pairs of two lists of vectors.
-
-        Parameters
-        ----------
-        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
-
-        Returns
-        -------
-        list[float]
-            A list of angles.
-
-        Examples
-        --------
-        >>> Vector.angle_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
-        [1.5707963267948966, 1.5707963267948966]
-
-        """
-        return [angle_vectors(u, v) for u, v in zip(left, right)]
-
-
-
-
     # ==========================================================================
     # helpers
     # ==========================================================================
@@ -633,61 +485,6 @@ class Vector:
         return vector
 
 
-    def rotate(self, theta):
-        """
-        Rotate this vector. If passed a number, assumes this is a
-        2D vector and rotates by the passed value in degrees.  Otherwise,
-        assumes the passed value is a list acting as a matrix which rotates the vector.
-
-        """
-        if isinstance(theta, (int, float)):
-            # So, if rotate is passed an int or a float...
-            if len(self) != 2:
-                raise ValueError("Rotation axis not defined for greater than 2D vector")
-            return self._rotate2D(theta)
-
-        matrix = theta
-        if not all(len(row) == len(self) for row in matrix) or not len(matrix)==len(self):
-            raise ValueError("Rotation matrix must be square and same dimensions as vector")
-        return self.matrix_mult(matrix)
-
-
-    def _rotate2D(self, theta):
-        """
-        Rotate this vector by theta in degrees.
-
-        Returns a new vector.
-
-        """
-        theta = math.radians(theta)
-        # Just applying the 2D rotation matrix
-        dc, ds = math.cos(theta), math.sin(theta)
-        x, y = self.values
-        x, y = dc*x - ds*y, ds*x + dc*y
-        return self.__class__(x, y)
-
-
-    def matrix_mult(self, matrix):
-        """
-        Multiply this vector by a matrix.  Assuming matrix is a list of lists.
-
-        Example:
-        mat = [[1,2,3],[-1,0,1],[3,4,5]]
-        Vector(1,2,3).matrix_mult(mat) ->  (14, 2, 26)
-
-        """
-        if not all(len(row) == len(self) for row in matrix):
-            raise ValueError('Matrix must match vector dimensions')
-
-        # Grab a row from the matrix, make it a Vector, take the dot product,
-        # and store it as the first component
-        product = tuple(Vector(*row)*self for row in matrix)
-
-        return self.__class__(*product)
-
-
-
-
     def difference_vector(vector1, vector2):
         """
         This functions creates (and returns) a new vector obtained by subtracting from vector vector1 the vector vector2 (i.e., vector1 - vector2). This is computed by subtracting the corresponding x-, y-, and z-components. (Yes, this is very similar to the previous function; the types, however, are conceptually different.)
@@ -6,8 +6,8 @@
 # =============================================================================
 
 """
-Provides Vector Class
-=====================
+Provides Vector Classes
+=======================
 
 Todo:
 -----
@@ -21,13 +21,21 @@ Links:
 # Import
 # =============================================================================
 
+# Import | Futures
+from __future__ import annotations
+
 # Import | Standard Library
 from typing import Any, Dict, List, Iterator, Tuple
+import contextlib
+import itertools
 import math
+import time
 
 # Import | Libraries
+import numpy
 
 # Import | Local Modules
+from bearing.math.transform import Transformation
 
 
 # =============================================================================
@@ -107,7 +115,8 @@ class Vector(object):
     ----
     This class represents vectors in 3D space and is not optimized for
     high-performance computations typically required in numerical simulations
-    or machine learning applications.
+    or machine learning applications. Use :class:`VectorArray` to process
+    large collections of vectors in a single vectorized call.
 
     """
 
@@ -117,6 +126,9 @@ class Vector(object):
 
     __slots__ = ["_components"]
 
+    #: Number of elements per block in all-pairs evaluation
+    PAIR_BLOCK_SIZE = 1 << 20
+
     def __init__(
         self,
         x: float = 0.0,
@@ -241,11 +253,8 @@ class Vector(object):
         None
 
         """
-        assert isinstance(
-            x,
-            (int, float),
-            msg = "x parameter must be int or float"
-        )
+        assert isinstance(x, (int, float)), \
+            "x parameter must be int or float"
         self._components[0] = float(x)
 
     @x.deleter
@@ -303,11 +312,8 @@ class Vector(object):
         None
 
         """
-        assert isinstance(
-            y,
-            (int, float),
-            msg = "y parameter must be int or float"
-        )
+        assert isinstance(y, (int, float)), \
+            "y parameter must be int or float"
         self._components[1] = float(y)
 
     @y.deleter
@@ -366,11 +372,8 @@ class Vector(object):
         None
 
         """
-        assert isinstance(
-            z,
-            (int, float),
-            msg = "z parameter must be int or float"
-        )
+        assert isinstance(z, (int, float)), \
+            "z parameter must be int or float"
         self._components[2] = float(z)
 
     @z.deleter
@@ -543,11 +546,7 @@ class Vector(object):
         floating-point values with a relative tolerance. This accounts for
         minor differences in floating-point arithmetic.
         """
-        if not isinstance(
-            other,
-            Vector,
-            msg = "other must be of type: Vector"
-        ):
+        if not isinstance(other, Vector):
             return NotImplemented
 
         return all(
@@ -664,6 +663,9 @@ class Vector(object):
                 self.y + other[1],
                 self.z + other[2],
             )
+        elif isinstance(other, VectorArray):
+            # Defer to the batched implementation for broadcasting
+            return NotImplemented
         else:
             raise TypeError(
                 f"Addition with type {type(other).__name__} not supported. "
@@ -827,6 +829,9 @@ class Vector(object):
                 self.y - other[1],
                 self.z - other[2],
             )
+        elif isinstance(other, VectorArray):
+            # Defer to the batched implementation for broadcasting
+            return NotImplemented
         else:
             raise TypeError(
                 f"Subtraction with type {type(other).__name__} not supported. "
@@ -989,6 +994,9 @@ class Vector(object):
                 self.y * other[1],
                 self.z * other[2],
             )
+        elif isinstance(other, VectorArray):
+            # Defer to the batched implementation for broadcasting
+            return NotImplemented
         else:
             raise TypeError(
                 f"Multiplication with type {type(other).__name__} not "
@@ -1160,6 +1168,9 @@ class Vector(object):
                 self.y / other[1],
                 self.z / other[2],
             )
+        elif isinstance(other, VectorArray):
+            # Defer to the batched implementation for broadcasting
+            return NotImplemented
         else:
             raise TypeError(
                 f"Division with type {type(other).__name__} not supported. "
@@ -1321,6 +1332,9 @@ class Vector(object):
                 self.y ** other[1],
                 self.z ** other[2],
             )
+        elif isinstance(other, VectorArray):
+            # Defer to the batched implementation for broadcasting
+            return NotImplemented
         else:
             raise TypeError(
                 f"Exponent must be a Vector, int, float, tuple, or list, not {type(other).__name__}."  # noqa E501
@@ -1505,7 +1519,7 @@ class Vector(object):
         return (self.x, self.y, self.z)
 
     @classmethod
-    def from_polar(cls, magnitude, angle_degrees) -> "Vector":
+    def from_polar(cls, magnitude, angle_degrees, out=None) -> "Vector":
         """
         Constructs a 2D vector from polar coordinates.
 
@@ -1521,12 +1535,15 @@ class Vector(object):
         angle_degrees : float
             The angle in degrees, measured counterclockwise from the positive
             X-axis.
+        out : Vector, optional
+            A mutable Vector to write the result into instead of allocating
+            a new instance.
 
         Returns
         -------
         Vector
-            A new instance of Vector representing the 2D vector in Cartesian
-            coordinates.
+            A new instance of Vector (or 'out') representing the 2D vector in
+            Cartesian coordinates.
 
         Examples
         --------
@@ -1538,6 +1555,12 @@ class Vector(object):
         coordinates.
         """
         angle_radians = math.radians(angle_degrees)
+        if out is not None:
+            components = out._components
+            components[0] = magnitude * math.cos(angle_radians)
+            components[1] = magnitude * math.sin(angle_radians)
+            components[2] = 0.0
+            return out
         return cls(
             magnitude * math.cos(angle_radians),
             magnitude * math.sin(angle_radians),
@@ -1801,29 +1824,36 @@ class Vector(object):
             )
 
     @staticmethod
-    def sum(vectors) -> "Vector":
+    def sum(vectors, as_array: bool = False, out=None) -> "Vector":
         """
         Calculates the sum of a sequence of vectors.
 
         This method takes an iterable of vectors and returns their cumulative
-        sum. It's equivalent to adding each vector in the iterable
-        sequentially.
+        sum. The vectors are packed once into an (N, 3) buffer and reduced
+        in a single vectorized call.
 
         Parameters
         ----------
-        vectors : iterable of Vector
-            An iterable (like a list or tuple) of Vector instances to be
-            summed.
+        vectors : iterable of Vector or sequence of float, or array-like
+            An iterable (like a list or tuple) of Vector instances or
+            sequences of three numeric components, a VectorArray, or an
+            (N, 3) NumPy array to be summed.
+        as_array : bool, optional
+            If True, return the sum as a (3,) NumPy array instead of a
+            Vector. Defaults to False.
+        out : Vector, optional
+            A mutable Vector to write the sum into instead of allocating a
+            new instance. Ignored when 'as_array' is True.
 
         Returns
         -------
-        Vector
+        Vector or numpy.ndarray
             A new Vector instance representing the sum of the vectors.
 
         Raises
         ------
         TypeError
-            If 'vectors' is not an iterable of Vector instances.
+            If 'vectors' cannot be interpreted as a collection of vectors.
 
         Examples
         --------
@@ -1837,16 +1867,21 @@ class Vector(object):
         any other quantities that are represented as vectors, especially when
         dealing with a large number of vectors.
         """
-        total_x, total_y, total_z = 0, 0, 0
-        for v in vectors:
-            if not isinstance(v, Vector):
-                raise TypeError(
-                    "All elements in 'vectors' must be instances of Vector."
-                )
-            total_x += v.x
-            total_y += v.y
-            total_z += v.z
-        return Vector(total_x, total_y, total_z)
+        try:
+            data = Vector._pack(vectors)
+        except ValueError as error:
+            raise TypeError(
+                "All elements in 'vectors' must be instances of Vector or "
+                "sequences of three numeric components."
+            ) from error
+
+        total = data.sum(axis=0)
+        if as_array:
+            return total
+        if out is not None:
+            out._components[:] = total.tolist()
+            return out
+        return Vector(*total.tolist())
 
     @staticmethod
     def dot(
@@ -1895,29 +1930,32 @@ class Vector(object):
         return vector1.x * vector2.x + vector1.y * vector2.y + vector1.z * vector2.z  # noqa E501
 
     @staticmethod
-    def dot_vectors(left, right):
+    def dot_vectors(left, right, as_array: bool = False):
         """
         Computes the dot product for pairs of vectors from two lists.
 
         This method calculates the dot product for each corresponding pair of
         vectors in the 'left' and 'right' lists. It supports inputs as either
-        instances of the Vector class or as sequences (tuples/lists) of three
-        numeric components (x, y, z).
+        instances of the Vector class, sequences (tuples/lists) of three
+        numeric components (x, y, z), a VectorArray or an (N, 3) NumPy array.
 
-        If a sequence is provided, it is automatically converted to a Vector
-        instance before calculating the dot product.
+        Both inputs are packed once into (N, 3) buffers and all dot products
+        are computed in a single vectorized reduction.
 
         Parameters
         ----------
-        left : list[Vector or sequence of float]
+        left : list[Vector or sequence of float] or array-like
             A list of vectors, each either an instance of Vector or a sequence
             of three numeric components.
-        right : list[Vector or sequence of float]
+        right : list[Vector or sequence of float] or array-like
             A list of vectors, in the same format as 'left'.
+        as_array : bool, optional
+            If True, return the dot products as an (N,) NumPy array instead
+            of a list. Defaults to False.
 
         Returns
         -------
-        list[float]
+        list[float] or numpy.ndarray
             A list containing the dot product of each pair of vectors.
 
         Raises
@@ -1941,13 +1979,39 @@ class Vector(object):
                 "The 'left' and 'right' lists must be of the same length."
             )
 
-        return [
-            Vector.to_vector(u).dot(Vector.to_vector(v)) for u, v in zip(left, right)  # noqa E501
-        ]
+        a = Vector._pack(left)
+        b = Vector._pack(right)
+        dots = numpy.einsum("ij,ij->i", a, b)
+        if as_array:
+            return dots
+        return dots.tolist()
 
-    def cross(self, other: "Vector") -> "Vector":
+    def cross(self, other: "Vector", out=None) -> "Vector":
+        """
+        Computes the cross product of this vector with another vector.
+
+        Parameters
+        ----------
+        other : Vector
+            The right-hand operand of the cross product.
+        out : Vector, optional
+            A mutable Vector to write the result into instead of allocating
+            a new instance. May be this vector or 'other'.
+
+        Returns
+        -------
+        Vector
+            The cross product, as a new Vector or as 'out'.
+
+        Raises
+        ------
+        TypeError
+            If 'other' is not an instance of Vector.
+        """
         if not isinstance(other, Vector):
             raise TypeError("Operand must be a Vector.")
+        if out is not None:
+            return Vector.cross_into(self, other, out)
         return Vector(
             self.y * other.z - self.z * other.y,
             self.z * other.x - self.x * other.z,
@@ -1997,18 +2061,24 @@ class Vector(object):
         #  return math.hypot(self.x, self.y)
 
     @staticmethod
-    def length_vectors(vectors):
+    def length_vectors(vectors, as_array: bool = False):
         """
         Compute the length of multiple vectors.
 
+        The vectors are packed once into an (N, 3) buffer and all lengths
+        are computed in a single vectorized reduction.
+
         Parameters
         ----------
         vectors : list[[float, float, float] | :class:`~bearing.math.Vector`]
-            A list of vectors.
+            A list of vectors, a VectorArray or an (N, 3) NumPy array.
+        as_array : bool, optional
+            If True, return the lengths as an (N,) NumPy array instead of a
+            list. Defaults to False.
 
         Returns
         -------
-        list[float]
+        list[float] or numpy.ndarray
             A list of lengths.
 
         Examples
@@ -2017,4 +2087,1910 @@ class Vector(object):
         [1.0, 2.0]
 
         """
-        return [Vector.length_vector(vector) for vector in vectors]
+        data = Vector._pack(vectors)
+        lengths = numpy.sqrt(numpy.einsum("ij,ij->i", data, data))
+        if as_array:
+            return lengths
+        return lengths.tolist()
+
+    @staticmethod
+    def _pack(vectors) -> numpy.ndarray:
+        """
+        Packs a collection of vectors into an (N, 3) float64 buffer.
+
+        Homogeneous inputs take a fast path: a VectorArray or NumPy array is
+        used as-is, and a list of Vector instances is streamed straight into
+        a preallocated buffer. Lists of sequences, or mixed lists, go through
+        a single ``numpy.array`` conversion.
+
+        Parameters
+        ----------
+        vectors : iterable of Vector or sequence of float, or array-like
+            The vectors to pack.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) float64 buffer.
+
+        Raises
+        ------
+        ValueError
+            If 'vectors' cannot be interpreted as an (N, 3) collection.
+        """
+        if isinstance(vectors, VectorArray):
+            return vectors.data
+        if isinstance(vectors, numpy.ndarray):
+            data = numpy.asarray(vectors, dtype=numpy.float64)
+        else:
+            if not isinstance(vectors, (list, tuple)):
+                vectors = list(vectors)
+            if not vectors:
+                return numpy.empty((0, 3), dtype=numpy.float64)
+            try:
+                # Fast path: all elements are Vector instances
+                data = numpy.fromiter(
+                    itertools.chain.from_iterable(
+                        v._components for v in vectors
+                    ),
+                    dtype=numpy.float64,
+                    count=3 * len(vectors),
+                ).reshape(-1, 3)
+            except AttributeError:
+                try:
+                    data = numpy.array(
+                        [
+                            v._components if isinstance(v, Vector) else v
+                            for v in vectors
+                        ],
+                        dtype=numpy.float64,
+                    )
+                except (TypeError, ValueError) as error:
+                    raise ValueError(
+                        "Object must be a Vector or a sequence of three "
+                        "numeric components."
+                    ) from error
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError(
+                "Object must be a Vector or a sequence of three numeric "
+                "components."
+            )
+        return data
+
+    # =========================================================================
+    # Methods | Transformations
+    # =========================================================================
+
+    def matrix_mult(self, matrix) -> "Vector":
+        """
+        Multiplies this vector by a 3x3 matrix.
+
+        Parameters
+        ----------
+        matrix : list[list[float]] or array-like
+            The 3x3 matrix, given row by row.
+
+        Returns
+        -------
+        Vector
+            A new vector holding the matrix-vector product.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not 3x3.
+
+        Examples
+        --------
+        >>> mat = [[1, 2, 3], [-1, 0, 1], [3, 4, 5]]
+        >>> Vector(1, 2, 3).matrix_mult(mat)
+        Vector(14.000, 2.000, 26.000)
+        """
+        if len(matrix) != 3 or not all(len(row) == 3 for row in matrix):
+            raise ValueError("Matrix must match vector dimensions.")
+        x, y, z = self._components
+        return type(self)(
+            *(row[0] * x + row[1] * y + row[2] * z for row in matrix)
+        )
+
+    def rotate(self, theta) -> "Vector":
+        """
+        Returns a rotated copy of this vector.
+
+        If 'theta' is a number, the vector is rotated by that many degrees
+        counterclockwise in the XY-plane (about the Z-axis). Otherwise
+        'theta' is taken as a 3x3 rotation matrix.
+
+        Parameters
+        ----------
+        theta : int, float or list[list[float]]
+            The rotation angle in degrees, or a 3x3 rotation matrix.
+
+        Returns
+        -------
+        Vector
+            A new, rotated vector.
+
+        Raises
+        ------
+        ValueError
+            If the rotation matrix is not 3x3.
+
+        Examples
+        --------
+        >>> Vector(1, 0, 5).rotate(90)
+        Vector(0.000, 1.000, 5.000)
+        """
+        if isinstance(theta, (int, float)):
+            return self._rotate2D(theta)
+        return self.matrix_mult(theta)
+
+    def _rotate2D(self, theta: float) -> "Vector":
+        """
+        Rotates this vector by theta degrees about the Z-axis.
+
+        Returns a new vector; the z-component is left unchanged.
+
+        """
+        theta = math.radians(theta)
+        dc, ds = math.cos(theta), math.sin(theta)
+        x, y, z = self._components
+        return type(self)(dc * x - ds * y, ds * x + dc * y, z)
+
+    @staticmethod
+    def transform_collection(collection, X, w: float = 0.0) -> None:
+        """
+        Transforms a collection of vectors in place.
+
+        The collection is packed once and transformed with a single batched
+        matrix product (see :meth:`Transformation.transform_array`), after
+        which the results are written back into the original objects.
+
+        Parameters
+        ----------
+        collection : list[Vector], VectorArray or numpy.ndarray
+            The vectors to transform. Lists must hold mutable Vectors; an
+            (N, 3) float64 array or a VectorArray is overwritten directly.
+        X : Transformation or array-like
+            The 3x3 or 4x4 transformation matrix.
+        w : float, optional
+            The homogeneous coordinate; 0.0 treats the vectors as directions
+            (translation is ignored), 1.0 as points. Defaults to 0.0.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> R = Transformation.rotation((0.0, 0.0, 1.0), math.radians(90))
+        >>> u = Vector(1.0, 0.0, 0.0)
+        >>> vectors = [u]
+        >>> Vector.transform_collection(vectors, R)
+        >>> vectors[0] is u
+        True
+        """
+        if isinstance(collection, (VectorArray, numpy.ndarray)):
+            Transformation.transform_array(
+                numpy.asarray(collection), X, w=w, in_place=True
+            )
+            return
+        data = Vector._pack(collection)
+        Transformation.transform_array(data, X, w=w, in_place=True)
+        for vector, xyz in zip(collection, data.tolist()):
+            vector._components[:] = xyz
+
+    @staticmethod
+    def transformed_collection(collection, X, w: float = 0.0):
+        """
+        Creates a collection of transformed vectors.
+
+        Parameters
+        ----------
+        collection : list[Vector | sequence of float], VectorArray or
+                     numpy.ndarray
+            The vectors to transform.
+        X : Transformation or array-like
+            The 3x3 or 4x4 transformation matrix, or a (K, 4, 4) stack.
+        w : float, optional
+            The homogeneous coordinate; 0.0 treats the vectors as directions
+            (translation is ignored), 1.0 as points. Defaults to 0.0.
+
+        Returns
+        -------
+        list[Vector], VectorArray or numpy.ndarray
+            The transformed vectors, in the same kind of container as the
+            input. For a stack of K matrices, one collection per matrix.
+
+        Examples
+        --------
+        >>> R = Transformation.rotation((0.0, 0.0, 1.0), math.radians(90))
+        >>> u = Vector(1.0, 0.0, 0.0)
+        >>> vectors = Vector.transformed_collection([u], R)
+        >>> vectors[0] is u
+        False
+        """
+        result = Transformation.transform_array(Vector._pack(collection), X, w=w)  # noqa E501
+        if isinstance(collection, numpy.ndarray):
+            return result
+        if isinstance(collection, VectorArray):
+            if result.ndim == 3:
+                return [VectorArray(data, copy=False) for data in result]
+            return VectorArray(result, copy=False)
+        if result.ndim == 3:
+            return [
+                [Vector(x, y, z) for x, y, z in data]
+                for data in result.tolist()
+            ]
+        return [Vector(x, y, z) for x, y, z in result.tolist()]
+
+    # =========================================================================
+    # Methods | Static | Pairwise
+    # =========================================================================
+
+    @staticmethod
+    def cross_vectors(
+        left,
+        right,
+        as_array: bool = False,
+        all_pairs: bool = False,
+        out: numpy.ndarray | None = None,
+    ):
+        """
+        Compute the cross product of two lists of vectors.
+
+        Both inputs are packed once into (N, 3) buffers and all cross
+        products are computed in a single vectorized pass.
+
+        Parameters
+        ----------
+        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of N vectors, a VectorArray or an (N, 3) array.
+        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of vectors in the same format; of length N, or of any
+            length M when 'all_pairs' is True.
+        as_array : bool, optional
+            If True, return a NumPy array instead of a list of Vectors.
+            Defaults to False.
+        all_pairs : bool, optional
+            If True, cross every vector of 'left' with every vector of
+            'right', giving an (N, M, 3) result. Defaults to False.
+        out : numpy.ndarray, optional
+            A preallocated float64 array of shape (N, 3), or (N, M, 3) when
+            'all_pairs' is True, to write the result into. Implies
+            'as_array'.
+
+        Returns
+        -------
+        list[:class:`~bearing.math.Vector`] or numpy.ndarray
+            A list of cross products (a nested list for 'all_pairs').
+
+        Raises
+        ------
+        ValueError
+            If the inputs are of different lengths while 'all_pairs' is
+            False, or if 'out' has the wrong shape.
+
+        Examples
+        --------
+        >>> Vector.cross_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+        [Vector(0.000, 0.000, 1.000), Vector(0.000, -4.000, 0.000)]
+
+        """
+        a = Vector._pack(left)
+        b = Vector._pack(right)
+        if all_pairs:
+            a = a[:, numpy.newaxis, :]
+            b = b[numpy.newaxis, :, :]
+        elif a.shape[0] != b.shape[0]:
+            raise ValueError(
+                "The 'left' and 'right' lists must be of the same length."
+            )
+        crosses = Vector._cross_array(a, b, out=out)
+        if as_array or out is not None:
+            return crosses
+        if all_pairs:
+            return [
+                [Vector(x, y, z) for x, y, z in row]
+                for row in crosses.tolist()
+            ]
+        return [Vector(x, y, z) for x, y, z in crosses.tolist()]
+
+    @staticmethod
+    def angle_vectors(
+        left,
+        right,
+        as_array: bool = False,
+        all_pairs: bool = False,
+        out: numpy.ndarray | None = None,
+    ):
+        """
+        Compute the smallest angle between corresponding pairs of two lists of vectors.
+
+        The angles are computed as ``atan2(|a x b|, a . b)``, which, unlike
+        ``acos`` of the normalized dot product, stays accurate for nearly
+        parallel and nearly anti-parallel vectors. Pairs containing a
+        zero-length vector give an angle of 0.
+
+        Parameters
+        ----------
+        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of N vectors, a VectorArray or an (N, 3) array.
+        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of vectors in the same format; of length N, or of any
+            length M when 'all_pairs' is True.
+        as_array : bool, optional
+            If True, return a NumPy array instead of a list. Defaults to
+            False.
+        all_pairs : bool, optional
+            If True, compute the angle between every vector of 'left' and
+            every vector of 'right', giving an (N, M) result. The pairs are
+            evaluated in row blocks so temporary memory stays bounded.
+            Defaults to False.
+        out : numpy.ndarray, optional
+            A preallocated float64 array of shape (N,), or (N, M) when
+            'all_pairs' is True, to write the angles into. Implies
+            'as_array'.
+
+        Returns
+        -------
+        list[float] or numpy.ndarray
+            The angles in radians, in the range [0, pi].
+
+        Raises
+        ------
+        ValueError
+            If the inputs are of different lengths while 'all_pairs' is
+            False, or if 'out' has the wrong shape.
+
+        Examples
+        --------
+        >>> Vector.angle_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+        [1.5707963267948966, 1.5707963267948966]
+
+        """
+        a = Vector._pack(left)
+        b = Vector._pack(right)
+        n, m = a.shape[0], b.shape[0]
+        if not all_pairs and n != m:
+            raise ValueError(
+                "The 'left' and 'right' lists must be of the same length."
+            )
+        shape = (n, m) if all_pairs else (n,)
+        if out is None:
+            angles = numpy.empty(shape, dtype=numpy.float64)
+        elif out.shape != shape:
+            raise ValueError(
+                f"Output array must have shape {shape}, not {out.shape}."
+            )
+        else:
+            angles = out
+
+        if all_pairs:
+            rows = max(1, Vector.PAIR_BLOCK_SIZE // max(m, 1))
+            for start in range(0, n, rows):
+                stop = min(start + rows, n)
+                Vector._angle_array(
+                    a[start:stop, numpy.newaxis, :],
+                    b[numpy.newaxis, :, :],
+                    out=angles[start:stop],
+                )
+        else:
+            Vector._angle_array(a, b, out=angles)
+
+        if as_array or out is not None:
+            return angles
+        return angles.tolist()
+
+    @staticmethod
+    def angles_vectors(
+        left,
+        right,
+        as_array: bool = False,
+        all_pairs: bool = False,
+    ):
+        """
+        Compute both angles between corresponding pairs of two lists of vectors.
+
+        Parameters
+        ----------
+        left : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of N vectors, a VectorArray or an (N, 3) array.
+        right : list[[float, float, float] | :class:`~bearing.math.Vector`]
+            A list of vectors in the same format; of length N, or of any
+            length M when 'all_pairs' is True.
+        as_array : bool, optional
+            If True, return an (N, 2) (or (N, M, 2)) NumPy array instead of
+            a list of tuples. Defaults to False.
+        all_pairs : bool, optional
+            If True, compute the angles between every vector of 'left' and
+            every vector of 'right'. Defaults to False.
+
+        Returns
+        -------
+        list[tuple[float, float]] or numpy.ndarray
+            A list of angle pairs, with the smallest angle first.
+
+        Examples
+        --------
+        >>> Vector.angles_vectors([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+        [(1.5707963267948966, 4.71238898038469), (1.5707963267948966, 4.71238898038469)]
+
+        """
+        smallest = Vector.angle_vectors(
+            left, right, as_array=True, all_pairs=all_pairs
+        )
+        angles = numpy.stack((smallest, 2.0 * math.pi - smallest), axis=-1)
+        if as_array:
+            return angles
+        if all_pairs:
+            return [[tuple(pair) for pair in row] for row in angles.tolist()]
+        return [tuple(pair) for pair in angles.tolist()]
+
+    @staticmethod
+    def _cross_array(
+        a: numpy.ndarray,
+        b: numpy.ndarray,
+        out: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        """
+        Computes broadcast cross products of two (..., 3) arrays.
+
+        The results are written straight into 'out', in blocks of about
+        :attr:`PAIR_BLOCK_SIZE` elements along the first axis, so that
+        temporaries stay bounded for all-pairs products. An operand that
+        shares memory with 'out' is copied first, so 'out' may alias it.
+
+        Raises
+        ------
+        ValueError
+            If 'out' does not have the broadcast shape.
+        """
+        shape = numpy.broadcast_shapes(a.shape, b.shape)
+        if out is None:
+            out = numpy.empty(shape, dtype=numpy.float64)
+        elif out.shape != shape:
+            raise ValueError(
+                f"Output array must have shape {shape}, not {out.shape}."
+            )
+        if numpy.may_share_memory(out, a):
+            a = a.copy()
+        if numpy.may_share_memory(out, b):
+            b = b.copy()
+        if len(shape) == 1:
+            Vector._cross_block(a, b, out)
+            return out
+
+        n = shape[0]
+        per_row = max(1, int(numpy.prod(shape[1:-1], dtype=numpy.int64)))
+        rows = max(1, Vector.PAIR_BLOCK_SIZE // per_row)
+        for start in range(0, n, rows):
+            block = slice(start, min(start + rows, n))
+            Vector._cross_block(
+                a[block] if a.ndim == len(shape) and a.shape[0] == n else a,
+                b[block] if b.ndim == len(shape) and b.shape[0] == n else b,
+                out[block],
+            )
+        return out
+
+    @staticmethod
+    def _cross_block(
+        a: numpy.ndarray,
+        b: numpy.ndarray,
+        out: numpy.ndarray,
+    ) -> None:
+        """
+        Writes the broadcast cross products of two (..., 3) arrays into
+        'out', which must not share memory with them.
+        """
+        ax, ay, az = a[..., 0], a[..., 1], a[..., 2]
+        bx, by, bz = b[..., 0], b[..., 1], b[..., 2]
+        term = numpy.empty(out.shape[:-1], dtype=numpy.float64)
+        numpy.multiply(ay, bz, out=out[..., 0])
+        numpy.subtract(out[..., 0], numpy.multiply(az, by, out=term), out=out[..., 0])
+        numpy.multiply(az, bx, out=out[..., 1])
+        numpy.subtract(out[..., 1], numpy.multiply(ax, bz, out=term), out=out[..., 1])
+        numpy.multiply(ax, by, out=out[..., 2])
+        numpy.subtract(out[..., 2], numpy.multiply(ay, bx, out=term), out=out[..., 2])
+
+    @staticmethod
+    def _angle_array(
+        a: numpy.ndarray,
+        b: numpy.ndarray,
+        out: numpy.ndarray | None = None,
+    ) -> numpy.ndarray:
+        """
+        Computes broadcast angles ``atan2(|a x b|, a . b)`` of two (..., 3)
+        arrays.
+
+        """
+        cross = Vector._cross_array(a, b)
+        sine = numpy.sqrt(numpy.einsum("...i,...i->...", cross, cross))
+        cosine = numpy.einsum("...i,...i->...", a, b)
+        return numpy.arctan2(sine, cosine, out=out)
+
+    # =========================================================================
+    # Methods | Static | Output
+    # =========================================================================
+
+    @staticmethod
+    def add_into(a: "Vector", b: "Vector", out: "Vector") -> "Vector":
+        """
+        Adds two vectors and writes the result into 'out'.
+
+        Unlike the '+' operator no new Vector is allocated, which keeps tight
+        loops free of garbage collector churn. 'out' may alias 'a' or 'b'.
+
+        Parameters
+        ----------
+        a : Vector
+            The left-hand operand.
+        b : Vector
+            The right-hand operand.
+        out : Vector
+            The mutable Vector receiving the result.
+
+        Returns
+        -------
+        Vector
+            The 'out' vector.
+
+        Examples
+        --------
+        >>> out = Vector()
+        >>> Vector.add_into(Vector(1, 2, 3), Vector(4, 5, 6), out)
+        Vector(5.000, 7.000, 9.000)
+        """
+        u = a._components
+        v = b._components
+        w = out._components
+        w[0] = u[0] + v[0]
+        w[1] = u[1] + v[1]
+        w[2] = u[2] + v[2]
+        return out
+
+    @staticmethod
+    def sub_into(a: "Vector", b: "Vector", out: "Vector") -> "Vector":
+        """
+        Subtracts 'b' from 'a' and writes the result into 'out'.
+
+        Parameters
+        ----------
+        a : Vector
+            The left-hand operand.
+        b : Vector
+            The right-hand operand.
+        out : Vector
+            The mutable Vector receiving the result. May alias 'a' or 'b'.
+
+        Returns
+        -------
+        Vector
+            The 'out' vector.
+        """
+        u = a._components
+        v = b._components
+        w = out._components
+        w[0] = u[0] - v[0]
+        w[1] = u[1] - v[1]
+        w[2] = u[2] - v[2]
+        return out
+
+    @staticmethod
+    def scale_into(a: "Vector", factor: float, out: "Vector") -> "Vector":
+        """
+        Multiplies a vector by a scalar and writes the result into 'out'.
+
+        Parameters
+        ----------
+        a : Vector
+            The vector to scale.
+        factor : float
+            The scaling factor.
+        out : Vector
+            The mutable Vector receiving the result. May alias 'a'.
+
+        Returns
+        -------
+        Vector
+            The 'out' vector.
+
+        Examples
+        --------
+        >>> v = Vector(1, 2, 3)
+        >>> Vector.scale_into(v, 2.0, v)
+        Vector(2.000, 4.000, 6.000)
+        """
+        u = a._components
+        w = out._components
+        w[0] = u[0] * factor
+        w[1] = u[1] * factor
+        w[2] = u[2] * factor
+        return out
+
+    @staticmethod
+    def cross_into(a: "Vector", b: "Vector", out: "Vector") -> "Vector":
+        """
+        Computes the cross product of two vectors and writes the result into
+        'out'.
+
+        Parameters
+        ----------
+        a : Vector
+            The left-hand operand.
+        b : Vector
+            The right-hand operand.
+        out : Vector
+            The mutable Vector receiving the result. May alias 'a' or 'b'.
+
+        Returns
+        -------
+        Vector
+            The 'out' vector.
+
+        Examples
+        --------
+        >>> out = Vector()
+        >>> Vector.cross_into(Vector(1, 0, 0), Vector(0, 1, 0), out)
+        Vector(0.000, 0.000, 1.000)
+        """
+        ax, ay, az = a._components
+        bx, by, bz = b._components
+        w = out._components
+        # All inputs are read before writing, so 'out' may alias an operand
+        w[0] = ay * bz - az * by
+        w[1] = az * bx - ax * bz
+        w[2] = ax * by - ay * bx
+        return out
+
+
+class FrozenVector(Vector):
+    """
+
+    FrozenVector Class
+    ==================
+
+    Represents an immutable, hashable three-dimensional vector.
+
+    The FrozenVector class stores its components directly in slots rather
+    than in a component list, so every instance is a single allocation and
+    component access needs no property call. The length and the hash are
+    computed lazily on first access and cached. Because the components can
+    not change, instances can be used as dictionary keys or set members, for
+    example to deduplicate or index large numbers of direction vectors.
+
+    FrozenVector is a subclass of :class:`Vector`, so it can be used anywhere
+    a Vector is accepted. Arithmetic operators return new (mutable) Vector
+    instances, while the in-place operators rebind to a new FrozenVector.
+
+    Attributes
+    ----------
+    x : float
+        The X component of the vector.
+    y : float
+        The Y component of the vector.
+    z : float
+        The Z component of the vector.
+
+    Examples
+    --------
+    >>> u = FrozenVector(1, 0, 0)
+    >>> {u: "east"}[FrozenVector(1.0, 0.0, 0.0)]
+    'east'
+    >>> u + Vector(0, 1, 0)
+    Vector(1.000, 1.000, 0.000)
+
+    Note
+    ----
+    Equality of FrozenVector instances is exact rather than tolerance based,
+    so that it stays consistent with the hash.
+
+    """
+
+    # =========================================================================
+    # Methods | Constructors
+    # =========================================================================
+
+    __slots__ = ["x", "y", "z", "_length", "_hash"]
+
+    def __init__(
+        self,
+        x: float = 0.0,
+        y: float = 0.0,
+        z: float = 0.0,
+    ) -> None:
+        """
+        Constructor of the FrozenVector object.
+
+        """
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
+        object.__setattr__(self, "z", float(z))
+
+    @classmethod
+    def from_vector(cls, vector: Vector | tuple | list) -> "FrozenVector":
+        """
+        Creates a frozen copy of a vector.
+
+        Parameters
+        ----------
+        vector : Vector, tuple or list
+            The vector, or a sequence of three numeric components, to freeze.
+
+        Returns
+        -------
+        FrozenVector
+            The given vector itself if it already is a FrozenVector, a new
+            frozen copy otherwise.
+        """
+        if isinstance(vector, FrozenVector):
+            return vector
+        x, y, z = Vector.to_vector(vector)._components
+        return cls(x, y, z)
+
+    # =========================================================================
+    # Methods | Properties
+    # =========================================================================
+
+    @property
+    def _components(self) -> Tuple[float, float, float]:
+        """
+        Getter decorator method for the component tuple, so that the methods
+        inherited from Vector read the slot values.
+
+        """
+        return (self.x, self.y, self.z)
+
+    @property
+    def length(self) -> float:
+        """
+        Getter decorator method for length parameter.
+        Gets the cached magnitude (length) of the vector.
+
+        Returns
+        -------
+        length : float
+            The length of the vector.
+
+        """
+        try:
+            return self._length
+        except AttributeError:
+            length = math.sqrt(self.x**2 + self.y**2 + self.z**2)
+            object.__setattr__(self, "_length", length)
+            return length
+
+    # =========================================================================
+    # Methods | Magic
+    # =========================================================================
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is immutable; "
+            f"cannot set attribute '{name}'."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is immutable; "
+            f"cannot delete attribute '{name}'."
+        )
+
+    def __setitem__(self, index: int, value: float) -> None:
+        raise TypeError(
+            f"{type(self).__name__} does not support item assignment."
+        )
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (self.x, self.y, self.z))
+
+    def __repr__(self) -> str:
+        """
+        Returns an unambiguous string representation of the FrozenVector.
+
+        Returns
+        -------
+        str
+            A string representing the FrozenVector object.
+        """
+        precision = 3
+        return f"FrozenVector({self.x:.{precision}f}, {self.y:.{precision}f}, {self.z:.{precision}f})"  # noqa E501
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks if this vector is exactly equal to another vector.
+
+        Parameters
+        ----------
+        other : object
+            Another object to compare against, ideally another Vector.
+
+        Returns
+        -------
+        bool
+            True if the other object is a Vector with identical components.
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return (self.x, self.y, self.z) == tuple(other._components)
+
+    def __hash__(self) -> int:
+        """
+        Returns the cached hash of the vector components.
+
+        Returns
+        -------
+        int
+            The hash of the (x, y, z) tuple.
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.x, self.y, self.z))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    # Methods | Magic | In-place
+    # -------------------------------------------------------------------------
+
+    def __iadd__(self, other: Any) -> "FrozenVector":
+        return FrozenVector(*(self + other)._components)
+
+    def __isub__(self, other: Any) -> "FrozenVector":
+        return FrozenVector(*(self - other)._components)
+
+    def __imul__(self, other: Any) -> "FrozenVector":
+        return FrozenVector(*(self * other)._components)
+
+    def __itruediv__(self, other: Any) -> "FrozenVector":
+        return FrozenVector(*(self / other)._components)
+
+    def __ipow__(self, other: Any) -> "FrozenVector":
+        return FrozenVector(*(self ** other)._components)
+
+
+class VectorArray(object):
+    """
+
+    VectorArray Class
+    =================
+
+    Represents a collection of three-dimensional vectors stored in a single
+    contiguous (N, 3) float64 buffer.
+
+    The VectorArray class mirrors the operator surface of :class:`Vector`
+    (addition, subtraction, multiplication, division, exponentiation,
+    negation, absolute value, dot product, cross product and length), but
+    evaluates every operation element-wise over the whole collection in one
+    vectorized call. Operands broadcast: a single :class:`Vector`, a scalar
+    or a three-element tuple/list is applied to every row, while another
+    VectorArray of the same length is applied row by row.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        The underlying (N, 3) float64 buffer.
+    x : numpy.ndarray
+        A view on the X components of the vectors.
+    y : numpy.ndarray
+        A view on the Y components of the vectors.
+    z : numpy.ndarray
+        A view on the Z components of the vectors.
+    length : numpy.ndarray
+        The magnitude (length) of every vector.
+
+    Methods
+    -------
+    __init__(data=None, copy=True)
+        Initializes a new VectorArray from an (N, 3) array-like.
+    dot(other)
+        Returns the row-wise dot products with another operand.
+    cross(other)
+        Returns the row-wise cross products with another operand.
+    to_vectors()
+        Converts the collection to a list of Vector instances.
+
+    Class Methods
+    -------------
+    from_vectors(vectors)
+        Packs an iterable of Vectors or 3-sequences into a VectorArray.
+    zeros(n)
+        Creates a VectorArray of n zero vectors.
+
+    Examples
+    --------
+    Creating a new VectorArray:
+    >>> va = VectorArray([(1, 0, 0), (0, 2, 0)])
+
+    Broadcasting with a single Vector:
+    >>> va + Vector(0, 0, 1)
+    VectorArray([[1.000, 0.000, 1.000], [0.000, 2.000, 1.000]])
+
+    Calculating the lengths:
+    >>> va.length
+    array([1., 2.])
+
+    """
+
+    # =========================================================================
+    # Methods | Constructors
+    # =========================================================================
+
+    __slots__ = ["_data"]
+
+    def __init__(
+        self,
+        data: Any = None,
+        copy: bool = True,
+    ) -> None:
+        """
+        Constructor of the VectorArray object.
+
+        Parameters
+        ----------
+        data : array-like, optional
+            An (N, 3) array-like of vector components, or a single
+            three-element sequence. Defaults to an empty collection.
+        copy : bool, optional
+            If False and 'data' already is a C-contiguous (N, 3) float64
+            array, it is wrapped without copying. Defaults to True.
+
+        Raises
+        ------
+        ValueError
+            If 'data' cannot be interpreted as an (N, 3) array.
+
+        """
+        if data is None:
+            data = numpy.empty((0, 3), dtype=numpy.float64)
+        if copy:
+            data = numpy.array(data, dtype=numpy.float64, order="C")
+        else:
+            data = numpy.ascontiguousarray(data, dtype=numpy.float64)
+        if data.ndim == 1:
+            data = data.reshape(1, -1)
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError(
+                "Data must be an array of shape (N, 3)."
+            )
+        self._data = data
+
+    # =========================================================================
+    # Methods | Properties
+    # =========================================================================
+
+    # Methods | Properties | data parameter
+    # -------------------------------------------------------------------------
+
+    @property
+    def data(self) -> numpy.ndarray:
+        """
+        Getter decorator method for data parameter.
+        Gets the underlying (N, 3) float64 buffer.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            The buffer holding the vector components, one vector per row.
+
+        """
+        return self._data
+
+    # Methods | Properties | component parameters
+    # -------------------------------------------------------------------------
+
+    @property
+    def x(self) -> numpy.ndarray:
+        """
+        Getter decorator method for x parameter.
+        Gets a view on the x-components of the vectors.
+
+        Returns
+        -------
+        x : numpy.ndarray
+            The (N,) view on the x-components.
+
+        """
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> numpy.ndarray:
+        """
+        Getter decorator method for y parameter.
+        Gets a view on the y-components of the vectors.
+
+        Returns
+        -------
+        y : numpy.ndarray
+            The (N,) view on the y-components.
+
+        """
+        return self._data[:, 1]
+
+    @property
+    def z(self) -> numpy.ndarray:
+        """
+        Getter decorator method for z parameter.
+        Gets a view on the z-components of the vectors.
+
+        Returns
+        -------
+        z : numpy.ndarray
+            The (N,) view on the z-components.
+
+        """
+        return self._data[:, 2]
+
+    # Methods | Properties | length parameter
+    # -------------------------------------------------------------------------
+
+    @property
+    def length(self) -> numpy.ndarray:
+        """
+        Getter decorator method for length parameter.
+        Gets the magnitude (length) of every vector.
+
+        Returns
+        -------
+        length : numpy.ndarray
+            The (N,) array of vector lengths.
+
+        """
+        data = self._data
+        return numpy.sqrt(numpy.einsum("ij,ij->i", data, data))
+
+    # =========================================================================
+    # Methods | Magic
+    # =========================================================================
+
+    def __repr__(self) -> str:
+        """
+        Returns an unambiguous string representation of the VectorArray.
+
+        Returns
+        -------
+        str
+            A string representing the VectorArray object.
+        """
+        precision = 3
+        rows = ", ".join(
+            "[" + ", ".join(f"{c:.{precision}f}" for c in row) + "]"
+            for row in self._data
+        )
+        return f"VectorArray([{rows}])"
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vectors in the collection.
+
+        Returns
+        -------
+        int
+            The number of vectors in the collection.
+        """
+        return self._data.shape[0]
+
+    def __iter__(self) -> Iterator[Vector]:
+        """
+        Returns an iterator yielding a Vector for every row.
+
+        Returns
+        -------
+        Iterator[Vector]
+            An iterator over the vectors in the collection.
+        """
+        for x, y, z in self._data.tolist():
+            yield Vector(x, y, z)
+
+    def __getitem__(self, index: Any) -> Vector | VectorArray:
+        """
+        Retrieves a single vector or a sub-collection.
+
+        Parameters
+        ----------
+        index : int, slice or array-like
+            An integer index returns a Vector, any other index returns a
+            VectorArray (a view when 'index' is a slice).
+
+        Returns
+        -------
+        Vector or VectorArray
+            The selected vector(s).
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return Vector(*self._data[index].tolist())
+        return VectorArray(self._data[index], copy=False)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """
+        Sets a single vector or a sub-collection.
+
+        Parameters
+        ----------
+        index : int, slice or array-like
+            The rows to set.
+        value : Vector, VectorArray, tuple, list or array-like
+            The new component values, broadcast over the selected rows.
+        """
+        self._data[index] = VectorArray._operand(value)
+
+    def __array__(self, dtype=None, copy=None) -> numpy.ndarray:
+        """
+        Exposes the underlying buffer to NumPy.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N, 3) component buffer.
+        """
+        if dtype is None or dtype == self._data.dtype:
+            return self._data.copy() if copy else self._data
+        return self._data.astype(dtype)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks if this collection is equal to another collection.
+
+        Equality is determined component-wise using a relative tolerance,
+        matching :meth:`Vector.__eq__`.
+
+        Parameters
+        ----------
+        other : object
+            Another object to compare against, ideally another VectorArray.
+
+        Returns
+        -------
+        bool
+            True if the other object is a VectorArray of the same shape and
+            all corresponding components are close enough.
+        """
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        if self._data.shape != other._data.shape:
+            return False
+        return bool(numpy.allclose(self._data, other._data, rtol=1e-09, atol=0.0))  # noqa E501
+
+    __hash__ = None
+
+    # Methods | Magic | Unary
+    # -------------------------------------------------------------------------
+
+    def __pos__(self) -> VectorArray:
+        """
+        Returns a new collection with the same components.
+
+        Returns
+        -------
+        VectorArray
+            A copy of this collection.
+        """
+        return VectorArray(self._data.copy(), copy=False)
+
+    def __neg__(self) -> VectorArray:
+        """
+        Returns a new collection with every component negated.
+
+        Returns
+        -------
+        VectorArray
+            The negated collection.
+        """
+        return VectorArray(numpy.negative(self._data), copy=False)
+
+    def __abs__(self) -> VectorArray:
+        """
+        Returns a new collection with the absolute values of the components.
+
+        Returns
+        -------
+        VectorArray
+            The collection of absolute values.
+        """
+        return VectorArray(numpy.absolute(self._data), copy=False)
+
+    # Methods | Magic | Additions
+    # -------------------------------------------------------------------------
+
+    def __add__(self, other: Any) -> VectorArray:
+        """
+        Adds another operand element-wise to this collection.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to add, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the sums.
+        """
+        return VectorArray(
+            numpy.add(self._data, VectorArray._operand(other)), copy=False
+        )
+
+    def __iadd__(self, other: Any) -> VectorArray:
+        """
+        Performs in-place element-wise addition.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to add, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            This collection after in-place addition.
+        """
+        numpy.add(self._data, VectorArray._operand(other), out=self._data)
+        return self
+
+    def __radd__(self, other: Any) -> VectorArray:
+        """
+        Handles addition where the collection is on the right-hand side.
+
+        Parameters
+        ----------
+        other : Vector, int, float, tuple, list or array-like
+            The operand on the left side of the '+' operator.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the sums.
+        """
+        return VectorArray(
+            numpy.add(VectorArray._operand(other), self._data), copy=False
+        )
+
+    # Methods | Magic | Subtractions
+    # -------------------------------------------------------------------------
+
+    def __sub__(self, other: Any) -> VectorArray:
+        """
+        Subtracts another operand element-wise from this collection.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to subtract, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the differences.
+        """
+        return VectorArray(
+            numpy.subtract(self._data, VectorArray._operand(other)),
+            copy=False,
+        )
+
+    def __isub__(self, other: Any) -> VectorArray:
+        """
+        Performs in-place element-wise subtraction.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to subtract, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            This collection after in-place subtraction.
+        """
+        numpy.subtract(
+            self._data, VectorArray._operand(other), out=self._data
+        )
+        return self
+
+    def __rsub__(self, other: Any) -> VectorArray:
+        """
+        Handles subtraction where the collection is on the right-hand side.
+
+        Parameters
+        ----------
+        other : Vector, int, float, tuple, list or array-like
+            The operand on the left side of the '-' operator.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the differences.
+        """
+        return VectorArray(
+            numpy.subtract(VectorArray._operand(other), self._data),
+            copy=False,
+        )
+
+    # Methods | Magic | Multiplications
+    # -------------------------------------------------------------------------
+
+    def __mul__(self, other: Any) -> VectorArray:
+        """
+        Multiplies this collection element-wise by another operand.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to multiply with. An (N,) array scales each vector
+            by its own factor; a (3,) array is treated as a single vector.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the products.
+        """
+        return VectorArray(
+            numpy.multiply(self._data, VectorArray._operand(other)),
+            copy=False,
+        )
+
+    def __imul__(self, other: Any) -> VectorArray:
+        """
+        Performs in-place element-wise multiplication.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The operand to multiply with.
+
+        Returns
+        -------
+        VectorArray
+            This collection after in-place multiplication.
+        """
+        numpy.multiply(
+            self._data, VectorArray._operand(other), out=self._data
+        )
+        return self
+
+    def __rmul__(self, other: Any) -> VectorArray:
+        """
+        Handles multiplication where the collection is on the right-hand
+        side.
+
+        Parameters
+        ----------
+        other : Vector, int, float, tuple, list or array-like
+            The operand on the left side of the '*' operator.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the products.
+        """
+        return VectorArray(
+            numpy.multiply(VectorArray._operand(other), self._data),
+            copy=False,
+        )
+
+    # Methods | Magic | Subdivisions
+    # -------------------------------------------------------------------------
+
+    def __truediv__(self, other: Any) -> VectorArray:
+        """
+        Divides this collection element-wise by another operand.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The divisor, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the quotients.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any component of the divisor is zero.
+        """
+        divisor = VectorArray._divisor(other)
+        return VectorArray(
+            numpy.true_divide(self._data, divisor), copy=False
+        )
+
+    def __itruediv__(self, other: Any) -> VectorArray:
+        """
+        Performs in-place element-wise division.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The divisor, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            This collection after in-place division.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any component of the divisor is zero.
+        """
+        divisor = VectorArray._divisor(other)
+        numpy.true_divide(self._data, divisor, out=self._data)
+        return self
+
+    def __rtruediv__(self, other: Any) -> VectorArray:
+        """
+        Handles division where the collection is on the right-hand side.
+
+        Parameters
+        ----------
+        other : Vector, int, float, tuple, list or array-like
+            The dividend on the left side of the '/' operator.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the quotients.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any component of this collection is zero.
+        """
+        divisor = VectorArray._divisor(self)
+        return VectorArray(
+            numpy.true_divide(VectorArray._operand(other), divisor),
+            copy=False,
+        )
+
+    # Methods | Magic | Powers
+    # -------------------------------------------------------------------------
+
+    def __pow__(self, other: Any) -> VectorArray:
+        """
+        Raises every component element-wise to the power of 'other'.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The exponent, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the powers.
+        """
+        return VectorArray(
+            numpy.power(self._data, VectorArray._operand(other)), copy=False
+        )
+
+    def __ipow__(self, other: Any) -> VectorArray:
+        """
+        Performs in-place element-wise exponentiation.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, int, float, tuple, list or array-like
+            The exponent, broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            This collection after in-place exponentiation.
+        """
+        numpy.power(self._data, VectorArray._operand(other), out=self._data)
+        return self
+
+    def __rpow__(self, other: Any) -> VectorArray:
+        """
+        Handles exponentiation where the collection is the exponent.
+
+        Parameters
+        ----------
+        other : Vector, int, float, tuple, list or array-like
+            The base on the left side of the '**' operator.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the powers.
+        """
+        return VectorArray(
+            numpy.power(VectorArray._operand(other), self._data), copy=False
+        )
+
+    # =========================================================================
+    # Methods | Class
+    # =========================================================================
+
+    @classmethod
+    def from_vectors(cls, vectors) -> VectorArray:
+        """
+        Packs an iterable of vectors into a VectorArray.
+
+        Parameters
+        ----------
+        vectors : iterable of Vector or sequence of float
+            The vectors to pack, each either a Vector instance or a sequence
+            of three numeric components.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the given vectors.
+
+        Examples
+        --------
+        >>> VectorArray.from_vectors([Vector(1, 2, 3), (4, 5, 6)])
+        VectorArray([[1.000, 2.000, 3.000], [4.000, 5.000, 6.000]])
+        """
+        return cls(Vector._pack(vectors))
+
+    @classmethod
+    def zeros(cls, n: int) -> VectorArray:
+        """
+        Creates a collection of n zero vectors.
+
+        Parameters
+        ----------
+        n : int
+            The number of vectors.
+
+        Returns
+        -------
+        VectorArray
+            A new collection of n zero vectors.
+        """
+        return cls(numpy.zeros((n, 3), dtype=numpy.float64), copy=False)
+
+    def to_vectors(self) -> List[Vector]:
+        """
+        Converts the collection into a list of Vector instances.
+
+        Returns
+        -------
+        list[Vector]
+            One Vector per row of the collection.
+        """
+        return [Vector(x, y, z) for x, y, z in self._data.tolist()]
+
+    # =========================================================================
+    # Methods | Products
+    # =========================================================================
+
+    def dot(self, other: Any) -> numpy.ndarray:
+        """
+        Computes the row-wise dot products with another operand.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, tuple, list or array-like
+            Another collection of the same length, or a single vector that
+            is broadcast over the collection.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of dot products.
+
+        Examples
+        --------
+        >>> VectorArray([(1, 2, 3), (1, 0, 0)]).dot(Vector(1, 1, 1))
+        array([6., 1.])
+        """
+        other = numpy.broadcast_to(
+            VectorArray._operand(other), self._data.shape
+        )
+        return numpy.einsum("ij,ij->i", self._data, other)
+
+    def cross(self, other: Any) -> VectorArray:
+        """
+        Computes the row-wise cross products with another operand.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, tuple, list or array-like
+            Another collection of the same length, or a single vector that
+            is broadcast over the collection.
+
+        Returns
+        -------
+        VectorArray
+            A new collection holding the cross products.
+
+        Examples
+        --------
+        >>> VectorArray([(1, 0, 0)]).cross(Vector(0, 1, 0))
+        VectorArray([[0.000, 0.000, 1.000]])
+        """
+        other = numpy.broadcast_to(
+            VectorArray._operand(other), self._data.shape
+        )
+        return VectorArray(
+            Vector._cross_array(self._data, other), copy=False
+        )
+
+    def angle(self, other: Any) -> numpy.ndarray:
+        """
+        Computes the row-wise smallest angles with another operand.
+
+        See :meth:`Vector.angle_vectors` for the formulation used.
+
+        Parameters
+        ----------
+        other : VectorArray, Vector, tuple, list or array-like
+            Another collection of the same length, or a single vector that
+            is broadcast over the collection.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (N,) array of angles in radians.
+        """
+        other = numpy.broadcast_to(
+            VectorArray._operand(other), self._data.shape
+        )
+        return Vector._angle_array(self._data, other)
+
+    # =========================================================================
+    # Methods | Transformations
+    # =========================================================================
+
+    def transform(
+        self,
+        X: Any,
+        w: float = 0.0,
+        in_place: bool = False,
+    ) -> VectorArray:
+        """
+        Applies a transformation to every vector in the collection.
+
+        Parameters
+        ----------
+        X : Transformation or array-like
+            The 3x3 or 4x4 transformation matrix.
+        w : float, optional
+            The homogeneous coordinate; 0.0 treats the rows as directions
+            (translation is ignored), 1.0 as points. Defaults to 0.0.
+        in_place : bool, optional
+            If True, overwrite this collection. Defaults to False.
+
+        Returns
+        -------
+        VectorArray
+            This collection if 'in_place' is True, a new one otherwise.
+        """
+        if in_place:
+            Transformation.transform_array(self._data, X, w=w, in_place=True)
+            return self
+        return VectorArray(
+            Transformation.transform_array(self._data, X, w=w), copy=False
+        )
+
+    # =========================================================================
+    # Methods | Helpers
+    # =========================================================================
+
+    @staticmethod
+    def _operand(other: Any) -> numpy.ndarray | float:
+        """
+        Converts an operand into something that broadcasts against an
+        (N, 3) buffer.
+
+        Scalars are returned as-is, vectors become (3,) arrays and (N,)
+        arrays become (N, 1) columns so that they scale each row.
+
+        Raises
+        ------
+        TypeError
+            If the operand type is not supported.
+        ValueError
+            If a sequence operand does not contain exactly three elements.
+        """
+        if isinstance(other, VectorArray):
+            return other._data
+        if isinstance(other, Vector):
+            return numpy.array(other._components, dtype=numpy.float64)
+        if isinstance(other, (int, float)):
+            return other
+        if isinstance(other, (tuple, list)):
+            if len(other) != 3:
+                raise ValueError(
+                    "The iterable must contain exactly three elements."
+                )
+            return numpy.array(other, dtype=numpy.float64)
+        if isinstance(other, numpy.ndarray):
+            if other.ndim == 1 and other.shape[0] != 3:
+                return other[:, numpy.newaxis]
+            return other
+        raise TypeError(
+            f"Operation with type {type(other).__name__} not supported. "
+            "Operand must be a VectorArray, Vector, int, float, tuple, list "
+            "or numpy.ndarray."
+        )
+
+    @staticmethod
+    def _divisor(other: Any) -> numpy.ndarray | float:
+        """
+        Converts a divisor operand, raising on zero components as
+        :meth:`Vector.__truediv__` does.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any component of the divisor is zero.
+        """
+        divisor = VectorArray._operand(other)
+        if numpy.any(numpy.equal(divisor, 0)):
+            raise ZeroDivisionError(
+                "Division by zero in element-wise division is not allowed."
+            )
+        return divisor
+
+
+class VectorPool(object):
+    """
+
+    VectorPool Class
+    ================
+
+    Keeps a free list of reusable scratch Vector instances.
+
+    Hot loops can acquire their temporaries from a pool once, use them as
+    'out' arguments of :meth:`Vector.add_into`, :meth:`Vector.sub_into`,
+    :meth:`Vector.scale_into` and :meth:`Vector.cross_into`, and release them
+    afterwards, so that no Vector is allocated per iteration.
+
+    Methods
+    -------
+    acquire()
+        Takes a scratch vector from the pool.
+    release(*vectors)
+        Returns scratch vectors to the pool.
+    scratch(n)
+        Context manager lending n scratch vectors.
+
+    Examples
+    --------
+    >>> vectors = [Vector(1.0, 0.0, 0.0), Vector(0.0, 2.0, 0.0)]
+    >>> dt = 0.5
+    >>> pool = VectorPool(2)
+    >>> with pool.scratch(2) as (tmp, acc):
+    ...     acc = Vector.scale_into(acc, 0.0, acc)
+    ...     for v in vectors:
+    ...         acc = Vector.add_into(acc, Vector.scale_into(v, dt, tmp), acc)
+    ...     total = Vector.copy(acc)
+    >>> total
+    Vector(0.500, 1.000, 0.000)
+    >>> len(pool)
+    2
+
+    """
+
+    __slots__ = ["_free"]
+
+    def __init__(self, size: int = 0) -> None:
+        """
+        Constructor of the VectorPool object.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of scratch vectors to preallocate. Defaults to 0.
+
+        """
+        self._free = [Vector() for _ in range(size)]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of free vectors in the pool.
+
+        """
+        return len(self._free)
+
+    def acquire(self) -> Vector:
+        """
+        Takes a scratch vector from the pool, allocating a new one only when
+        the pool is empty. The components of the returned vector are
+        undefined.
+
+        Returns
+        -------
+        Vector
+            A mutable scratch vector.
+        """
+        if self._free:
+            return self._free.pop()
+        return Vector()
+
+    def release(self, *vectors: Vector) -> None:
+        """
+        Returns scratch vectors to the pool.
+
+        Parameters
+        ----------
+        *vectors : Vector
+            The vectors to return. They must not be used by the caller
+            afterwards.
+        """
+        self._free.extend(vectors)
+
+    @contextlib.contextmanager
+    def scratch(self, n: int = 1) -> Iterator[List[Vector]]:
+        """
+        Lends n scratch vectors for the duration of a with-block.
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of scratch vectors. Defaults to 1.
+
+        Yields
+        ------
+        list[Vector]
+            The borrowed scratch vectors.
+        """
+        vectors = [self.acquire() for _ in range(n)]
+        try:
+            yield vectors
+        finally:
+            self.release(*vectors)
+
+
+def benchmark(iterations: int = 100000) -> None:
+    """
+    Benchmark Function
+
+    Compares the allocating operators with the 'out' variants on an
+    accumulate loop, reporting the run time and the number of Vector
+    instances constructed per loop.
+    """
+
+    def measure(label, loop):
+        start = time.perf_counter()
+        loop()
+        elapsed = time.perf_counter() - start
+
+        # Count constructions in a second, instrumented run
+        counter = [0]
+        init = Vector.__init__
+
+        def counting_init(self, *args, **kwargs):
+            counter[0] += 1
+            init(self, *args, **kwargs)
+
+        Vector.__init__ = counting_init
+        try:
+            loop()
+        finally:
+            Vector.__init__ = init
+        print(
+            f"{label:<12} {elapsed * 1000:9.2f} ms  "
+            f"{counter[0]:>9} Vector allocations"
+        )
+
+    a = Vector(1.0, 2.0, 3.0)
+    b = Vector(0.5, -0.25, 0.125)
+    pool = VectorPool(2)
+
+    def operators():
+        acc = Vector()
+        for _ in range(iterations):
+            acc = acc + a.cross(b) * 0.5
+
+    def into():
+        with pool.scratch(2) as (tmp, acc):
+            Vector.scale_into(acc, 0.0, acc)
+            for _ in range(iterations):
+                Vector.cross_into(a, b, tmp)
+                Vector.scale_into(tmp, 0.5, tmp)
+                Vector.add_into(acc, tmp, acc)
+
+    measure("operators", operators)
+    measure("into", into)
+
+
+if __name__ == '__main__':
+    """Main"""
+    import doctest
+    doctest.testmod()
+    benchmark()